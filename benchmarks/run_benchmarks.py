@@ -0,0 +1,161 @@
+"""
+Micro- and macro-benchmarks for the mastermind package.
+
+Run from the repository root:
+  python -m benchmarks.run_benchmarks --output results.json
+  python -m benchmarks.run_benchmarks --baseline baseline.json   #exit code 1 on regressions
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from functools import lru_cache, partial
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import Feedback
+from mastermind import Game
+from mastermind.frontend import NullFrontend
+from mastermind.simulation import simulate_games
+
+#(code_length, code_range) sizes every per-code benchmark runs at
+SIZES = [(4, 8), (6, 9), (8, 12)]
+#moves in the history formatted by the format_game_history benchmark
+LONG_HISTORY_MOVES = 1000
+#Dict{benchmark name: python code} run in a fresh interpreter each call, so import time is part of the timing
+STARTUP_SNIPPETS = {
+  "startup[python]": "pass",
+  "startup[import mastermind]": "import mastermind",
+  "startup[offline Game]": "from mastermind import Game; from mastermind.frontend import NullFrontend; Game(offline=True, frontend=NullFrontend()).start()"
+}
+#secret/guess lines in the bulk scoring benchmark chunk
+BULK_PAIRS = 100000
+#fraction slower than baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+def random_code(rng: random.Random, code_length: int, code_range: int) -> CodeEntry:
+  """Returns a random valid CodeEntry."""
+  code_maker = CodeMaker(code_length, code_range, rng=rng)
+  return CodeEntry(code_maker.use_in_house_random_seq_gen(), code_length, code_range)
+
+def setup_startup(code: str):
+  return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+def setup_compare_with(code_length: int, code_range: int):
+  rng = random.Random(f"{code_length}x{code_range}")
+  secret, guess = random_code(rng, code_length, code_range), random_code(rng, code_length, code_range)
+  return lambda: secret.compare_with(guess)
+
+def setup_is_valid(code_length: int, code_range: int):
+  return random_code(random.Random(f"{code_length}x{code_range}"), code_length, code_range).is_valid
+
+def setup_random_seq_gen(code_length: int, code_range: int):
+  return CodeMaker(code_length, code_range, rng=random.Random(0)).use_in_house_random_seq_gen
+
+def setup_format_game_history():
+  rng = random.Random(0)
+  game = Game(frontend=NullFrontend())
+  long_history = [(random_code(rng, 4, 8), Feedback(rng.randint(0, 4), 0, 4)) for _ in range(LONG_HISTORY_MOVES)]
+  return lambda: game.format_game_history(long_history)
+
+@lru_cache(maxsize=None)
+def warm_solver():
+  """Returns 4x8 solver with its feedback table and guess cache built, so the timing covers playing, not setup."""
+  from mastermind import SolverCodeBreaker
+  solver = SolverCodeBreaker(4, 8)
+  simulate_games(100, code_breaker=solver, seed=0)
+  return solver
+
+def setup_solver_games():
+  solver = warm_solver()
+  return lambda: simulate_games(1000, code_breaker=solver, seed=1)
+
+def setup_tree_games():
+  from mastermind.decision_tree import DecisionTree, TreeCodeBreaker
+  tree_breaker = TreeCodeBreaker(DecisionTree.compile(warm_solver()))
+  return lambda: simulate_games(1000, code_breaker=tree_breaker, seed=1)
+
+def setup_score_chunk():
+  from mastermind.bulk_eval import score_chunk
+  rng = random.Random(0)
+  pairs = "".join(f"{random_code(rng, 4, 8).sequence} {random_code(rng, 4, 8).sequence}\n" for _ in range(BULK_PAIRS)).encode("ascii")
+  return lambda: score_chunk(pairs, 4, 8)
+
+def build_benchmarks() -> dict:
+  """
+  Returns Dict{benchmark name: setup callable returning the zero-argument callable to time}.
+
+  Setup only runs for the benchmarks selected, so filtered runs skip building unrelated inputs.
+  """
+  benchmarks = {name: partial(setup_startup, code) for name, code in STARTUP_SNIPPETS.items()}
+  for code_length, code_range in SIZES:
+    size = f"{code_length}x{code_range}"
+    benchmarks[f"compare_with[{size}]"] = partial(setup_compare_with, code_length, code_range)
+    benchmarks[f"is_valid[{size}]"] = partial(setup_is_valid, code_length, code_range)
+    benchmarks[f"use_in_house_random_seq_gen[{size}]"] = partial(setup_random_seq_gen, code_length, code_range)
+  benchmarks[f"format_game_history[{LONG_HISTORY_MOVES} moves]"] = setup_format_game_history
+  benchmarks["headless_games[4x8, 1000 games]"] = setup_solver_games
+  benchmarks["headless_games[4x8 decision tree, 1000 games]"] = setup_tree_games
+  benchmarks[f"score_chunk[4x8, {BULK_PAIRS} pairs]"] = setup_score_chunk
+  return benchmarks
+
+def time_benchmark(function, repeat: int) -> dict:
+  """Time one benchmark with an automatically sized loop, returns per-call seconds."""
+  timer = timeit.Timer(function)
+  number, _ = timer.autorange()
+  per_call = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+  return {"best": min(per_call), "median": statistics.median(per_call), "number": number, "repeat": repeat}
+
+def run(name_filter: str=None, repeat: int=5) -> dict:
+  """Run every benchmark whose name contains name_filter, returns machine-readable results."""
+  results = {}
+  for name, setup in build_benchmarks().items():
+    if name_filter and name_filter not in name:
+      continue
+    results[name] = time_benchmark(setup(), repeat)
+  return {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+  """Returns (name, baseline seconds, current seconds) of benchmarks whose best time regressed past threshold."""
+  regressions = []
+  for name, current in results["results"].items():
+    previous = baseline["results"].get(name)
+    if previous and current["best"] > previous["best"] * (1 + threshold):
+      regressions.append((name, previous["best"], current["best"]))
+  return regressions
+
+def format_results(results: dict) -> str:
+  """Returns a readable table of results."""
+  lines = [f"{'benchmark':<45} {'best':>12} {'median':>12}"]
+  for name, timing in results["results"].items():
+    lines.append(f"{name:<45} {timing['best'] * 1e6:>10.2f}us {timing['median'] * 1e6:>10.2f}us")
+  return "\n".join(lines)
+
+def main(argv: list=None) -> int:
+  """Entry point, returns exit code 1 if any benchmark regressed against the baseline."""
+  parser = argparse.ArgumentParser(description="Benchmark mastermind hot paths.")
+  parser.add_argument("--output", help="write results as JSON to this file")
+  parser.add_argument("--baseline", help="compare against results saved by a previous --output")
+  parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="fraction slower than baseline that is a regression")
+  parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args(argv)
+
+  results = run(args.filter, args.repeat)
+  print(format_results(results))
+  if args.output:
+    with open(args.output, "w") as output_file:
+      json.dump(results, output_file, indent=2)
+  if args.baseline:
+    with open(args.baseline) as baseline_file:
+      regressions = compare(results, json.load(baseline_file), args.threshold)
+    for name, previous, current in regressions:
+      print(f"REGRESSION {name}: {previous * 1e6:.2f}us -> {current * 1e6:.2f}us")
+    return 1 if regressions else 0
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -1,10 +1,15 @@
+import argparse
 from mastermind import Game
 
-def main() -> None:
+def main(argv: list=None) -> None:
   """Entry point for starting a new Mastermind game."""
-  new_game = Game()
+  parser = argparse.ArgumentParser(description="Play Mastermind on the terminal.")
+  parser.add_argument("--offline", action="store_true", help="generate secret codes locally, never loading the network stack")
+  parser.add_argument("--hard", action="store_true", help="the secret code is only chosen once the game ends, always as the hardest one left")
+  args = parser.parse_args(argv)
+  new_game = Game(offline=args.offline, hard_mode=args.hard)
   new_game.start()
   new_game.run()
 
 if __name__ == "__main__":
-  main()
\ No newline at end of file
+  main()
@@ -1,5 +1,24 @@
-from .game import Game
-from .code_maker import CodeMaker
-from .code_breaker import CodeBreaker
-from .code_entry import CodeEntry
-from .feedback import Feedback
\ No newline at end of file
+import importlib
+
+#public name -> submodule defining it, submodules (and numpy or requests behind them) load on first attribute access
+_EXPORTS = {
+  "Game": ".game",
+  "CodeMaker": ".code_maker",
+  "CodeBreaker": ".code_breaker",
+  "SolverCodeBreaker": ".solver",
+  "SamplingCodeBreaker": ".sampling",
+  "CodeEntry": ".code_entry",
+  "Feedback": ".feedback"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+  if name not in _EXPORTS:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+  globals()[name] = value
+  return value
+
+def __dir__() -> list:
+  return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,105 @@
+import random
+import time
+import numpy as np
+from . import scoring
+from .code_entry import CodeEntry
+from .code_maker import CodeMaker
+from .feedback import Feedback
+from .frontend import Frontend
+from .instrumentation import Metrics
+from .sampling import SamplingCodeBreaker
+
+#largest code space whose possible secrets are all tracked, larger ones partition a random sample of them
+MAX_EXACT_CODES = 1 << 22
+
+class AdversarialCodeMaker(CodeMaker):
+  """
+  Hard mode CodeMaker that commits lazily: each guess gets the feedback that keeps the most secrets possible,
+  and secret_code is only a provisional pick consistent with every feedback given so far.
+  """
+  def __init__(self, code_length: int, code_range: int, rng: random.Random=None, frontend: Frontend=None, metrics: Metrics=None, sample_size: int=2000, time_budget: float=0.5):
+    """
+    Args:
+      sample_size(int): Possible secrets partitioned per guess once the code space is too large to track them all.
+      time_budget(float): Seconds per guess spent sampling possible secrets in large code spaces.
+    """
+    super().__init__(code_length, code_range, rng=rng, offline=True, frontend=frontend, metrics=metrics)
+    self.sample_size = sample_size
+    self.time_budget = time_budget
+    self.exact = code_range ** code_length <= MAX_EXACT_CODES
+    self.perfect = scoring.feedback_index(code_length, code_length, code_length)
+    self.candidates = None  # code space indexes of every secret still possible, None for the whole code space
+    self.sampler = None  # SamplingCodeBreaker fed the same feedback, finds possible secrets in large code spaces
+
+  def generate_code(self, max_retries: int=3, delay: int=3) -> None:
+    """Start a new game with every code possible, no secret is committed yet."""
+    self.candidates = None
+    if not self.exact:
+      self.sampler = SamplingCodeBreaker(self.code_length, self.code_range, self.sample_size, guess_pool_size=0, time_budget=self.time_budget, seed=self.rng.getrandbits(32))
+    self.secret_code = CodeEntry(self.use_in_house_random_seq_gen(), self.code_length, self.code_range)
+
+  async def async_generate_code(self, max_retries: int=3, delay: float=3, timeout: float=5) -> None:
+    """Same as generate_code, no network is involved."""
+    self.generate_code()
+
+  def get_hint_position_dict(self) -> dict:
+    """Hints would commit to a secret, returns an empty dictionary."""
+    return {}
+
+  def live_feedback(self, guess: np.ndarray) -> tuple:
+    """
+    Score the guess against the secrets still possible, or a sample of them in large code spaces.
+
+    Returns:
+      tuple: (digit array of the scored secrets, feedback index of each).
+    """
+    if self.exact:
+      if self.candidates is None:
+        self.candidates = np.arange(self.code_range ** self.code_length, dtype=np.int64)
+      received = np.empty(len(self.candidates), dtype=np.int16)
+      for start in range(0, len(self.candidates), scoring.ENUMERATION_CHUNK_CODES):
+        codes = scoring.codes_from_indices(self.candidates[start:start + scoring.ENUMERATION_CHUNK_CODES], self.code_length, self.code_range)
+        received[start:start + len(codes)] = scoring.feedback_index(*scoring.score_batch(guess, codes, self.code_range), self.code_length)
+      return None, received
+    deadline = time.perf_counter() + self.time_budget
+    #the provisional secret is always possible, so the sample never runs dry
+    provisional = scoring.encode_codes([self.secret_code], self.code_length)
+    sample = np.unique(np.concatenate((self.sampler.sample_candidates(deadline), provisional)), axis=0)
+    sample = sample[self.sampler.distances(sample) == 0]
+    return sample, scoring.feedback_index(*scoring.score_batch(guess, sample, self.code_range), self.code_length)
+
+  def evaluate_code(self, guess_code: CodeEntry) -> Feedback:
+    """
+    Give the feedback shared by the largest group of secrets still possible, a tie with the perfect response goes against the CodeBreaker.
+
+    Returns:
+      Feedback: Formatted object of the user's guess comparison result.
+    """
+    guess = scoring.encode_codes([guess_code], self.code_length)[0]
+    sample, received = self.live_feedback(guess)
+    counts = np.bincount(received, minlength=scoring.feedback_index_count(self.code_length)).astype(float)
+    counts[self.perfect] -= 0.5
+    chosen = int(np.argmax(counts))
+    kept = received == chosen
+    if self.exact:
+      self.candidates = self.candidates[kept]
+      secret = scoring.codes_from_indices(self.candidates[[self.rng.randrange(len(self.candidates))]], self.code_length, self.code_range)
+    else:
+      members = sample[kept]
+      secret = members[self.rng.randrange(len(members))]
+    self.secret_code = CodeEntry(scoring.decode_codes(secret)[0], self.code_length, self.code_range)
+    feedback = Feedback.from_id(chosen, self.code_length)
+    if self.sampler:
+      self.sampler.receive_feedback(guess_code, feedback)
+    return feedback
+
+  def resume(self, secret_code: CodeEntry, history: list) -> None:
+    """Continue a game from a snapshot: secret_code is the provisional pick and history the (CodeEntry, Feedback) pairs already given."""
+    self.generate_code()
+    self.secret_code = secret_code
+    if self.exact:
+      if history:
+        self.candidates = np.concatenate(list(scoring.iter_consistent_indices(history, self.code_length, self.code_range)))
+    else:
+      for guess_code, feedback in history:
+        self.sampler.receive_feedback(guess_code, feedback)
@@ -0,0 +1,193 @@
+"""
+Streaming bulk scoring of files of secret/guess pairs.
+
+Each input line is a secret and a guess separated by one space, tab or comma, e.g. "1234 4321". Every line
+gives one output line with its feedback as "correct_number correct_location", or "invalid" for lines that
+are not two codes of the rules. Files are read in chunks of whole lines, each chunk is validated and scored
+as numpy arrays, so memory stays constant whatever the file size. Run with:
+  python score_file.py 4 8 pairs.txt [more.txt ...] [--output scores.txt] [--workers 4] [--text]
+"""
+import argparse
+import sys
+from collections import deque
+from functools import lru_cache
+import numpy as np
+from . import scoring
+from .code_entry import MAX_CODE_RANGE
+from .feedback import Feedback
+
+#bytes read per chunk, a chunk is extended to the end of its last line
+CHUNK_BYTES = 1 << 22
+#chunks queued per worker process, bounds memory while keeping every worker busy
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+#invalid lines kept in a report, the rest are only counted
+MAX_REPORTED_INVALID = 10
+INVALID_LINE = b"invalid"
+NEWLINE, CARRIAGE_RETURN = ord("\n"), ord("\r")
+SEPARATORS = np.frombuffer(b" \t,", dtype=np.uint8)
+
+@lru_cache(maxsize=None)
+def rendered_feedback(code_length: int, text: bool=False) -> np.ndarray:
+  """
+  Returns output line of every feedback index, with the invalid line at index feedback_index_count(code_length).
+
+  Lines are a fixed-width bytes array padded with NUL, so a chunk renders with one fancy index and a NUL strip.
+  """
+  lines = []
+  for index in range(scoring.feedback_index_count(code_length)):
+    feedback = Feedback.from_id(index, code_length)
+    lines.append(feedback.to_string().encode("ascii") if text else f"{feedback.correct_number} {feedback.correct_location}".encode("ascii"))
+  return np.array([line + b"\n" for line in lines + [INVALID_LINE]])
+
+def iter_chunks(stream, chunk_bytes: int=CHUNK_BYTES):
+  """
+  Read a binary stream in chunks of whole lines.
+
+  Yields:
+    bytes: About chunk_bytes of input ending at a line end, the last chunk may lack the final newline.
+  """
+  remainder = b""
+  while True:
+    block = stream.read(chunk_bytes)
+    if not block:
+      break
+    block = remainder + block
+    cut = block.rfind(b"\n") + 1
+    remainder = block[cut:]
+    if cut:
+      yield block[:cut]
+  if remainder:
+    yield remainder
+
+def score_chunk(data: bytes, code_length: int, code_range: int, text: bool=False) -> tuple:
+  """
+  Validate and score every line of a chunk.
+
+  Args:
+    data(bytes): Whole lines of "secret guess" pairs.
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    text(bool): Write feedback as Feedback.to_string() text instead of the two numbers.
+
+  Returns:
+    tuple: (output bytes, number of lines, array of the invalid lines' numbers within the chunk, from 0).
+  """
+  buffer = np.frombuffer(data, dtype=np.uint8)
+  ends = np.flatnonzero(buffer == NEWLINE)
+  if len(buffer) and buffer[-1] != NEWLINE:
+    ends = np.append(ends, len(buffer))
+  starts = np.concatenate(([0], ends[:-1] + 1))
+  lengths = ends - starts
+  #accept windows line ends
+  lengths -= (lengths > 0) & (buffer[np.maximum(ends - 1, 0)] == CARRIAGE_RETURN)
+  fixed_width = lengths == 2 * code_length + 1
+  fields = buffer[starts[fixed_width, None] + np.arange(2 * code_length + 1)]
+  digits = scoring.SYMBOL_LOOKUP[np.delete(fields, code_length, axis=1)]
+  codes = np.isin(fields[:, code_length], SEPARATORS) & ((digits >= 0) & (digits < code_range)).all(axis=1)
+  valid = fixed_width.copy()
+  valid[fixed_width] = codes
+  digits = digits[codes]
+  correct_number, correct_location = scoring.score_pairs(digits[:, code_length:], digits[:, :code_length], code_range)
+  indices = np.full(len(starts), scoring.feedback_index_count(code_length), dtype=np.intp)
+  indices[valid] = scoring.feedback_index(correct_number, correct_location, code_length)
+  return rendered_feedback(code_length, text)[indices].tobytes().replace(b"\0", b""), len(starts), np.flatnonzero(~valid)
+
+class BulkReport:
+  """Counts of a bulk scoring run."""
+  def __init__(self, lines: int=0, invalid: int=0, invalid_lines: list=None):
+    self.lines = lines
+    self.invalid = invalid
+    self.invalid_lines = invalid_lines or [] # List[Tuple(path, line number from 1)], first MAX_REPORTED_INVALID only
+
+  @property
+  def ok(self) -> bool:
+    """Returns True if every line was a valid pair."""
+    return self.invalid == 0
+
+  def to_dict(self) -> dict:
+    """Returns plain dictionary of the report."""
+    return {"lines": self.lines, "invalid": self.invalid, "ok": self.ok}
+
+def score_files(paths: list, output, code_length: int, code_range: int, workers: int=1, chunk_bytes: int=CHUNK_BYTES, text: bool=False) -> BulkReport:
+  """
+  Score every line of the files and write the feedback of each, in input order.
+
+  Args:
+    paths(list): Input file paths, "-" reads standard input.
+    output: Binary stream the feedback lines are written to.
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    workers(int): Processes scoring chunks, 1 scores in this process.
+    chunk_bytes(int): Bytes read per chunk.
+    text(bool): Write feedback as Feedback.to_string() text instead of the two numbers.
+
+  Returns:
+    BulkReport: Lines scored and the invalid ones.
+  """
+  report = BulkReport()
+  def chunks():
+    for path in paths:
+      stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+      try:
+        for chunk in iter_chunks(stream, chunk_bytes):
+          yield path, (chunk, code_length, code_range, text)
+      finally:
+        if stream is not sys.stdin.buffer:
+          stream.close()
+
+  line_numbers = {}  # Dict{path: lines seen so far}
+  def collect(path: str, result: tuple) -> None:
+    written, lines, invalid = result
+    output.write(written)
+    first_line = line_numbers.get(path, 0) + 1
+    line_numbers[path] = first_line - 1 + lines
+    report.lines += lines
+    report.invalid += len(invalid)
+    for line in invalid[:MAX_REPORTED_INVALID - len(report.invalid_lines)]:
+      report.invalid_lines.append((path, first_line + int(line)))
+
+  if workers <= 1:
+    for path, args in chunks():
+      collect(path, score_chunk(*args))
+    return report
+  from concurrent.futures import ProcessPoolExecutor
+  in_flight = deque()  # (path, Future) of each chunk submitted, oldest first so output keeps input order
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    for path, args in chunks():
+      if len(in_flight) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+        done_path, future = in_flight.popleft()
+        collect(done_path, future.result())
+      in_flight.append((path, executor.submit(score_chunk, *args)))
+    while in_flight:
+      done_path, future = in_flight.popleft()
+      collect(done_path, future.result())
+  return report
+
+def main(argv: list=None) -> int:
+  """Score files of secret/guess pairs, returns exit code 1 if any line was invalid."""
+  parser = argparse.ArgumentParser(description="Score every 'secret guess' line of the files, one feedback line out per line in.")
+  parser.add_argument("code_length", type=int)
+  parser.add_argument("code_range", type=int)
+  parser.add_argument("paths", nargs="+", help="input files, - for standard input")
+  parser.add_argument("--output", "-o", help="output file, standard output by default")
+  parser.add_argument("--workers", type=int, default=1, help="processes scoring chunks in parallel")
+  parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+  parser.add_argument("--text", action="store_true", help="write feedback as text, e.g. '2 correct numbers and 1 correct location'")
+  args = parser.parse_args(argv)
+  if args.code_length < 1 or not 1 <= args.code_range <= MAX_CODE_RANGE:
+    parser.error(f"code_length must be at least 1 and code_range between 1 and {MAX_CODE_RANGE}.")
+  output = open(args.output, "wb") if args.output else sys.stdout.buffer
+  try:
+    report = score_files(args.paths, output, args.code_length, args.code_range, args.workers, args.chunk_bytes, args.text)
+  finally:
+    if args.output:
+      output.close()
+    else:
+      output.flush()
+  print(f"{report.lines} lines, {report.invalid} invalid", file=sys.stderr)
+  for path, line in report.invalid_lines:
+    print(f"  {path}:{line}", file=sys.stderr)
+  return 0 if report.ok else 1
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,70 @@
+import numpy as np
+from . import scoring
+from .code_entry import CodeEntry
+from .feedback import Feedback
+from .feedback_table import FeedbackTable
+
+#set bits in each byte value, counts candidates without unpacking the bitset
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+#bytes of per-feedback guess masks kept, oldest guesses are dropped first; one 6x12 guess alone takes about 18MB
+MAX_CACHED_MASK_BYTES = 1 << 26
+
+class CandidateIndex:
+  """Bitset over the code space marking secrets still consistent with every (CodeEntry, Feedback) pair applied."""
+  def __init__(self, code_length: int, code_range: int, feedback_table: FeedbackTable=None):
+    self.code_length = code_length
+    self.code_range = code_range
+    self.feedback_table = feedback_table
+    self.size = code_range ** code_length
+    self.feedback_count = scoring.feedback_index_count(code_length)
+    self.codes = None
+    self.full = np.packbits(np.ones(self.size, dtype=bool))
+    self.bits = self.full
+    self.undo_stack = [] # List[np.ndarray], bitset before each applied pair
+    self.masks = {} #Dict{guess index (int): np.ndarray of one packed mask per feedback index}
+    self.cached_bytes = 0
+
+  def guess_masks(self, guess_index: int) -> np.ndarray:
+    """Returns packed bitsets of shape (feedback count, bytes), row k marks codes that give feedback index k to the guess."""
+    masks = self.masks.get(guess_index)
+    if masks is None:
+      if self.feedback_table is not None:
+        row = np.asarray(self.feedback_table.row(guess_index))
+      else:
+        if self.codes is None:
+          self.codes = scoring.all_codes(self.code_length, self.code_range)
+        correct_number, correct_location = scoring.score_batch(self.codes[guess_index], self.codes, self.code_range)
+        row = scoring.feedback_index(correct_number, correct_location, self.code_length)
+      masks = np.packbits(row[None, :] == np.arange(self.feedback_count)[:, None], axis=1)
+      while self.masks and self.cached_bytes + masks.nbytes > MAX_CACHED_MASK_BYTES:
+        self.cached_bytes -= self.masks.pop(next(iter(self.masks))).nbytes
+      self.masks[guess_index] = masks
+      self.cached_bytes += masks.nbytes
+    return masks
+
+  def apply(self, guess_code: CodeEntry, feedback: Feedback) -> None:
+    """Keep only codes that would give this feedback to the guess, one bitwise AND with a precomputed mask."""
+    mask = self.guess_masks(guess_code.to_int())[feedback.id]
+    self.undo_stack.append(self.bits)
+    self.bits = self.bits & mask
+
+  def undo(self) -> None:
+    """Forget the most recently applied pair."""
+    self.bits = self.undo_stack.pop()
+
+  def reset(self) -> None:
+    """Every code is a candidate again, cached masks are kept for the next game."""
+    self.bits = self.full
+    self.undo_stack.clear()
+
+  def count(self) -> int:
+    """Returns number of codes still consistent."""
+    return int(POPCOUNT[self.bits].sum(dtype=np.int64))
+
+  def candidates(self) -> np.ndarray:
+    """Returns code space indexes of every code still consistent."""
+    return np.flatnonzero(np.unpackbits(self.bits, count=self.size))
+
+  def __contains__(self, code: CodeEntry) -> bool:
+    index = code.to_int()
+    return bool(self.bits[index >> 3] & (0x80 >> (index & 7)))
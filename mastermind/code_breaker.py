@@ -1,13 +1,20 @@
 from .code_entry import CodeEntry
+from .feedback import Feedback
+from .frontend import Frontend, TerminalFrontend
 
 class CodeBreaker:
   """Instance of CodeBreaker player, handles ONLY its logic."""
-  def __init__(self, code_length: int, code_range: int):
+  def __init__(self, code_length: int, code_range: int, frontend: Frontend=None):
     self.code_length = code_length
     self.code_range = code_range
+    self.frontend = frontend or TerminalFrontend(buffered=False)
     self.turn = 1
   
   def make_guess(self) -> CodeEntry:
     """Request user to input guess, returns CodeEntry object."""
-    guess = input(f"Input #{self.turn}: ")
-    return CodeEntry(guess, self.code_length, self.code_range)
\ No newline at end of file
+    guess = self.frontend.ask(f"Input #{self.turn}: ")
+    return CodeEntry(guess, self.code_length, self.code_range)
+
+  def receive_feedback(self, guess_code: CodeEntry, feedback: Feedback) -> None:
+    """Hook for CodeBreaker to learn from the evaluation of its guess, human player reads it off the terminal instead."""
+    pass
\ No newline at end of file
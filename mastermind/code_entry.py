@@ -1,12 +1,55 @@
 from collections import Counter
 from .feedback import Feedback
 
+#one symbol per code value: digits 0-9, then letters for code ranges above 10
+SYMBOLS = "0123456789abcdefghijklmnopqrstuvwxyz"
+SYMBOL_VALUES = {symbol: value for value, symbol in enumerate(SYMBOLS)}
+MAX_CODE_RANGE = len(SYMBOLS)
+
+def is_code_sequence(sequence: str, code_length: int, code_range: int) -> bool:
+  """Returns True if sequence is code_length symbols, each one of the first code_range SYMBOLS."""
+  return len(sequence) == code_length and all(SYMBOL_VALUES.get(symbol, code_range) < code_range for symbol in sequence)
+
+def pack_sequence(sequence: str, code_range: int) -> int:
+  """Pack a valid code sequence into one int by reading its symbols as a base code_range number."""
+  if code_range == 1:
+    return 0
+  return int(sequence, code_range)
+
+def unpack_sequence(value: int, code_length: int, code_range: int) -> str:
+  """Unpack an int from pack_sequence back into its code sequence string."""
+  digits = []
+  for _ in range(code_length):
+    value, digit = divmod(value, code_range)
+    digits.append(SYMBOLS[digit])
+  return "".join(reversed(digits))
+
 class CodeEntry:
   """Handles ONLY CodeEntry logic."""
+  __slots__ = ("sequence", "length_rule", "range_rule")
+
   def __init__(self, sequence: str, length_rule: int, range_rule: int):
     self.sequence = sequence
     self.length_rule = length_rule
     self.range_rule = range_rule
+
+  @classmethod
+  def from_int(cls, value: int, length_rule: int, range_rule: int) -> "CodeEntry":
+    """Returns CodeEntry of a code packed by to_int()."""
+    return cls(unpack_sequence(value, length_rule, range_rule), length_rule, range_rule)
+
+  @classmethod
+  def from_bytes(cls, data: bytes, range_rule: int) -> "CodeEntry":
+    """Returns CodeEntry of a code packed by to_bytes()."""
+    return cls("".join(SYMBOLS[value] for value in data), len(data), range_rule)
+
+  def __eq__(self, other: object) -> bool:
+    if not isinstance(other, CodeEntry):
+      return NotImplemented
+    return self.sequence == other.sequence and self.length_rule == other.length_rule and self.range_rule == other.range_rule
+
+  def __hash__(self) -> int:
+    return hash(self.sequence)
   
   def compare_with(self, other_code: "CodeEntry") -> Feedback:
     """
@@ -44,7 +87,7 @@ class CodeEntry:
 
   def is_valid(self) -> bool:
     """
-    Checks if Code sequence follows digits, length, and range rules.
+    Checks if Code sequence follows symbols, length, and range rules.
     
     Returns:
       bool: True if is valid, False otherwise.
@@ -52,15 +95,17 @@ class CodeEntry:
     # length validity
     if len(self.sequence) != self.length_rule:
       return False
-    # digits validity
-    elif not self.sequence.isdigit():
-      return False
-    # range validiity
-    elif not all(map(lambda x: 0 <= int(x) < self.range_rule, self.sequence)):    
-      return False
-    else:
-      return True
+    # symbols and range validity, digits 0-9 then letters a-z for larger ranges
+    return is_code_sequence(self.sequence, self.length_rule, self.range_rule)
 
   def to_string(self) -> str:
     """Return Code sequence."""
-    return self.sequence
\ No newline at end of file
+    return self.sequence
+
+  def to_int(self) -> int:
+    """Returns valid code packed into one int (base range_rule digits), also its index in the enumerated code space."""
+    return pack_sequence(self.sequence, self.range_rule)
+
+  def to_bytes(self) -> bytes:
+    """Returns valid code packed into a fixed-size byte array, one byte per symbol value."""
+    return bytes(SYMBOL_VALUES[symbol] for symbol in self.sequence)
\ No newline at end of file
@@ -1,40 +1,150 @@
-import requests
 import time
 import random
-from .code_entry import CodeEntry
+from .code_entry import CodeEntry, SYMBOLS
 from .feedback import Feedback
+from .frontend import Frontend, TerminalFrontend
+from .instrumentation import Metrics, NULL_METRICS
+
+#random.org integer generator, requests and the code pool are only imported once a code is fetched from it
+RANDOM_ORG_INTEGERS_URL = "https://www.random.org/integers/"
+
+#one connection-pooled aiohttp session shared by every CodeMaker on the running event loop
+_async_session = None
+_async_session_loop = None
+
+async def get_async_session() -> "aiohttp.ClientSession":
+  """Returns the shared async HTTP session, creating it on first use or after its loop closed."""
+  global _async_session, _async_session_loop
+  import asyncio
+  import aiohttp
+  loop = asyncio.get_running_loop()
+  if _async_session is None or _async_session.closed or _async_session_loop is not loop:
+    _async_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100))
+    _async_session_loop = loop
+  return _async_session
+
+async def close_async_session() -> None:
+  """Close the shared async HTTP session, next use opens a new one."""
+  global _async_session, _async_session_loop
+  if _async_session is not None and not _async_session.closed:
+    await _async_session.close()
+  _async_session = None
+  _async_session_loop = None
 
 class CodeMaker:
   """Instance of CodeMaker player, stores secret code, handles ONLY its logic."""
-  def __init__(self, code_length: int, code_range: int):
+  def __init__(self, code_length: int, code_range: int, rng: random.Random=None, code_pool: "SecretCodePool"=None, offline: bool=False, frontend: Frontend=None, metrics: Metrics=None, auto_feedback_table: bool=True):
     self.code_length = code_length
     self.code_range = code_range
+    self.frontend = frontend or TerminalFrontend(buffered=False)
+    self.metrics = metrics or NULL_METRICS
+    self.offline = offline
+    self.rng = rng or random.Random()
+    self.code_pool = code_pool
+    self.api_base_url = RANDOM_ORG_INTEGERS_URL
     self.secret_code = None
+    #a table saved by an earlier run is memory-mapped up front, building one is left to use_feedback_table
+    self.feedback_table = None
+    if auto_feedback_table:
+      self.use_saved_feedback_table()
 
   def generate_code(self, max_retries: int=3, delay: int=3) -> None:
     """Update secrete code after API call or fallback in-house random sequence generation."""
-    api_url = f"https://www.random.org/integers/?num={self.code_length}&min=0&max={self.code_range - 1}&col=1&base=10&format=plain&rnd=new"
-    
+    if self.use_pooled_code() or self.use_offline_code():
+      return
+    import requests
     for attempt in range(max_retries):
+      self.metrics.increment("api_requests")
       try:
-        response = requests.get(api_url, timeout=5)
-        response.raise_for_status()
-        data = "".join(response.text.strip().split())
-        self.secret_code = CodeEntry(data, self.code_length, self.code_range)
+        with self.metrics.time("api_request"):
+          response = requests.get(self.api_url(), timeout=5)
+          response.raise_for_status()
+        self.use_api_response(response.text)
         return
       except requests.exceptions.RequestException:
-        print(f"Problem with connecting to random API. Reattempting API call...")
+        self.metrics.increment("api_failures")
+        self.frontend.show(f"Problem with connecting to random API. Reattempting API call...")
         if attempt < max_retries - 1:
+          self.metrics.increment("api_retries")
           time.sleep(delay)
         else:
-          self.secret_code = CodeEntry(self.use_in_house_random_seq_gen(), self.code_length, self.code_range)
-          print("Max retries exceeded. Generate random code again later, or try playing with in-house generated secret code :).")
+          self.use_fallback_code()
+
+  async def async_generate_code(self, max_retries: int=3, delay: float=3, timeout: float=5) -> None:
+    """
+    Non-blocking generate_code for asyncio servers, requests share one pooled HTTP session.
+
+    Args:
+      max_retries(int): API attempts before falling back on the in-house generator.
+      delay(float): Seconds to asyncio.sleep between attempts.
+      timeout(float): Seconds allowed for each API attempt.
+
+    Cancelling the awaiting task cancels the request or backoff in flight, secret code is left unchanged.
+    """
+    if self.use_pooled_code() or self.use_offline_code():
+      return
+    import asyncio
+    import aiohttp
+    session = await get_async_session()
+    for attempt in range(max_retries):
+      self.metrics.increment("api_requests")
+      try:
+        with self.metrics.time("api_request"):
+          async with session.get(self.api_url(), timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            text = await response.text()
+        self.use_api_response(text)
+        return
+      except (aiohttp.ClientError, asyncio.TimeoutError):
+        self.metrics.increment("api_failures")
+        self.frontend.show(f"Problem with connecting to random API. Reattempting API call...")
+        if attempt < max_retries - 1:
+          self.metrics.increment("api_retries")
+          await asyncio.sleep(delay)
+        else:
+          self.use_fallback_code()
+
+  def api_url(self) -> str:
+    """Returns random.org request url for one secret code."""
+    return f"{self.api_base_url}?num={self.code_length}&min=0&max={self.code_range - 1}&col=1&base=10&format=plain&rnd=new"
+
+  def use_pooled_code(self) -> bool:
+    """Update secret code from the code pool if there is one, returns True if secret code was updated."""
+    if self.code_pool is None:
+      return False
+    pooled_sequence = self.code_pool.get_code()
+    if pooled_sequence is None:
+      self.metrics.increment("pool_empty_codes")
+      pooled_sequence = self.use_in_house_random_seq_gen()
+    else:
+      self.metrics.increment("pooled_codes")
+    self.secret_code = CodeEntry(pooled_sequence, self.code_length, self.code_range)
+    return True
+
+  def use_offline_code(self) -> bool:
+    """Update secret code with the in-house generator if offline, returns True if secret code was updated."""
+    if not self.offline:
+      return False
+    self.metrics.increment("offline_codes")
+    self.secret_code = CodeEntry(self.use_in_house_random_seq_gen(), self.code_length, self.code_range)
+    return True
+
+  def use_api_response(self, text: str) -> None:
+    """Update secret code from a plain random.org response, one integer per line mapped to its symbol."""
+    data = "".join(SYMBOLS[int(value)] if value.isdigit() and int(value) < len(SYMBOLS) else value for value in text.split())
+    self.secret_code = CodeEntry(data, self.code_length, self.code_range)
+
+  def use_fallback_code(self) -> None:
+    """Update secret code with the in-house generator after the API retries ran out."""
+    self.metrics.increment("fallback_codes")
+    self.secret_code = CodeEntry(self.use_in_house_random_seq_gen(), self.code_length, self.code_range)
+    self.frontend.show("Max retries exceeded. Generate random code again later, or try playing with in-house generated secret code :).")
 
   def use_in_house_random_seq_gen(self) -> str:
     """Generates random code sequence as fallback, returns random sequence."""
     s = ""
     for _ in range(self.code_length):
-      s += (str)(random.randint(0, self.code_range - 1))
+      s += SYMBOLS[self.rng.randint(0, self.code_range - 1)]
     return s
 
   def get_hint_position_dict(self) -> dict:
@@ -44,6 +154,18 @@ class CodeMaker:
       hint_num_ind_dict[n] = self.secret_code.sequence[n]
     return hint_num_ind_dict
 
+  def use_feedback_table(self, cache_dir: str=None) -> bool:
+    """Score with a precomputed feedback table when the rules are small enough, returns True if a table is in use."""
+    from .feedback_table import get_feedback_table
+    self.feedback_table = get_feedback_table(self.code_length, self.code_range, cache_dir)
+    return self.feedback_table is not None
+
+  def use_saved_feedback_table(self, cache_dir: str=None) -> bool:
+    """Score with a feedback table only if one is already saved for the rules, returns True if a table is in use."""
+    from .feedback_table import saved_feedback_table
+    self.feedback_table = saved_feedback_table(self.code_length, self.code_range, cache_dir)
+    return self.feedback_table is not None
+
   def evaluate_code(self, guess_code: CodeEntry) -> Feedback:
     """
     Calls a comparison between CodeMaker's secrete code and CodeBreaker's guess code, return Feedback object.
@@ -51,4 +173,9 @@ class CodeMaker:
     Returns:
       Feedback: Formatted object of the user's guess comparison result.
     """
+    if self.feedback_table is not None:
+      try:
+        return self.feedback_table.lookup(self.secret_code.sequence, guess_code.sequence)
+      except (ValueError, IndexError):
+        pass  #code outside of table's rules, compare directly
     return self.secret_code.compare_with(guess_code)
\ No newline at end of file
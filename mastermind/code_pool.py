@@ -0,0 +1,87 @@
+import threading
+from collections import deque
+import requests
+from .code_entry import SYMBOLS
+from .code_maker import RANDOM_ORG_INTEGERS_URL
+#random.org serves at most this many integers per request
+MAX_INTEGERS_PER_REQUEST = 10000
+
+class SecretCodePool:
+  """Local buffer of secret code sequences fetched from random.org in bulk, refilled in the background."""
+  def __init__(self, code_length: int, code_range: int, pool_size: int=100, low_water: int=20, api_url: str=RANDOM_ORG_INTEGERS_URL, timeout: float=5):
+    self.code_length = code_length
+    self.code_range = code_range
+    self.pool_size = pool_size
+    self.low_water = low_water
+    self.api_url = api_url
+    self.timeout = timeout
+    self.codes = deque()
+    self.session = requests.Session()
+    self.refill_thread = None
+    self.refill_lock = threading.Lock()
+    self.failed_refills = 0
+
+  def __len__(self) -> int:
+    return len(self.codes)
+
+  def request_params(self, count: int) -> dict:
+    """Returns random.org query parameters for count codes' worth of integers."""
+    return {"num": count * self.code_length, "min": 0, "max": self.code_range - 1, "col": 1, "base": 10, "format": "plain", "rnd": "new"}
+
+  def refill(self) -> int:
+    """
+    Fetch codes in one bulk request until the pool is full.
+
+    Returns:
+      int: Number of codes added, 0 if the request failed.
+    """
+    with self.refill_lock:
+      count = min(self.pool_size - len(self.codes), MAX_INTEGERS_PER_REQUEST // max(1, self.code_length))
+      if count <= 0 or self.code_length < 1:
+        return 0
+      try:
+        response = self.session.get(self.api_url, params=self.request_params(count), timeout=self.timeout)
+        response.raise_for_status()
+        codes = self.parse_codes(response.text)
+      except (requests.exceptions.RequestException, ValueError):
+        self.failed_refills += 1
+        return 0
+      self.codes.extend(codes)
+      return len(codes)
+
+  def parse_codes(self, text: str) -> list:
+    """Split a plain random.org response into code sequences, raises ValueError if it does not follow the rules."""
+    digits = text.split()
+    if not digits or len(digits) % self.code_length:
+      raise ValueError("Response does not hold a whole number of codes.")
+    if not all(digit.isdigit() and int(digit) < self.code_range for digit in digits):
+      raise ValueError("Response holds numbers outside of code range.")
+    symbols = "".join(SYMBOLS[int(digit)] for digit in digits)
+    return [symbols[i:i + self.code_length] for i in range(0, len(symbols), self.code_length)]
+
+  def start_refill(self) -> None:
+    """Refill on a background thread unless one is already running."""
+    if self.refill_thread and self.refill_thread.is_alive():
+      return
+    self.refill_thread = threading.Thread(target=self.refill, daemon=True)
+    self.refill_thread.start()
+
+  def wait_for_refill(self, timeout: float=None) -> None:
+    """Block until the running background refill, if any, is done."""
+    if self.refill_thread:
+      self.refill_thread.join(timeout)
+
+  def get_code(self) -> str:
+    """
+    Take one code from the pool without blocking on the network.
+
+    Returns:
+      str: Code sequence, or None if the pool is empty and the caller should generate its own.
+    """
+    try:
+      sequence = self.codes.popleft()
+    except IndexError:
+      sequence = None
+    if len(self.codes) < self.low_water:
+      self.start_refill()
+    return sequence
@@ -0,0 +1,167 @@
+"""
+Deterministic CodeBreaker strategies expanded ahead of time into array-backed decision trees.
+
+Compile the solver for one rule configuration:
+  python -m mastermind.decision_tree 4 8 --output tree_4x8.npz
+"""
+import argparse
+from collections import deque
+from functools import partial
+import numpy as np
+from . import scoring
+from .code_breaker import CodeBreaker
+from .code_entry import CodeEntry
+from .feedback import Feedback
+
+#child slot of a feedback the node's guess can never receive, or that is past the depth limit
+NO_CHILD = -1
+#child slot of the perfect feedback when the node's guess is itself a possible secret
+SOLVED = -2
+
+class DecisionTree:
+  """
+  Strategy tree with one row per node: guesses[node] is the code space index to play, and
+  children[node, feedback index] is the node to move to after that feedback.
+  """
+  def __init__(self, code_length: int, code_range: int, strategy: str, guesses: np.ndarray, children: np.ndarray):
+    self.code_length = code_length
+    self.code_range = code_range
+    self.strategy = strategy
+    self.guesses = guesses
+    self.children = children
+
+  @classmethod
+  def compile(cls, code_breaker: CodeBreaker, max_depth: int=10) -> "DecisionTree":
+    """
+    Expand a deterministic CodeBreaker breadth first over every feedback it can receive.
+
+    Args:
+      code_breaker(CodeBreaker): Machine player whose guesses only depend on the feedback of the current game.
+      max_depth(int): Max guesses per game, secrets not solved by then are left out of the tree.
+
+    Returns:
+      DecisionTree: Compiled strategy.
+    """
+    code_length, code_range = code_breaker.code_length, code_breaker.code_range
+    codes = scoring.all_codes(code_length, code_range)
+    feedback_count = scoring.feedback_index_count(code_length)
+    perfect = scoring.feedback_index(code_length, code_length, code_length)
+    guesses, children = [], []
+    pending = deque([((), np.arange(len(codes)))])  #(path of (CodeEntry, Feedback) moves, candidate indexes), in node order
+    while pending:
+      path, candidates = pending.popleft()
+      guess_index = play_path(code_breaker, path).to_int()
+      row = np.full(feedback_count, NO_CHILD, dtype=np.int32)
+      correct_number, correct_location = scoring.score_batch(codes[guess_index], codes[candidates], code_range)
+      received = scoring.feedback_index(correct_number, correct_location, code_length)
+      for feedback_index in np.unique(received):
+        if feedback_index == perfect:
+          row[feedback_index] = SOLVED
+        elif len(path) + 1 < max_depth:
+          row[feedback_index] = len(guesses) + len(pending) + 1
+          feedback = Feedback.from_id(feedback_index, code_length)
+          guess_code = CodeEntry(scoring.decode_codes(codes[guess_index])[0], code_length, code_range)
+          pending.append((path + ((guess_code, feedback),), candidates[received == feedback_index]))
+      guesses.append(guess_index)
+      children.append(row)
+    strategy = getattr(code_breaker, "strategy", type(code_breaker).__name__)
+    return cls(code_length, code_range, strategy, np.array(guesses, dtype=np.int32), np.array(children, dtype=np.int32))
+
+  @classmethod
+  def load(cls, path: str) -> "DecisionTree":
+    """Read a tree saved with save()."""
+    with np.load(path) as saved:
+      code_length, code_range = (int(value) for value in saved["rules"])
+      return cls(code_length, code_range, str(saved["strategy"]), saved["guesses"], saved["children"])
+
+  def save(self, path: str) -> None:
+    """Write tree arrays and its rules to one compressed .npz file."""
+    np.savez_compressed(path, rules=np.array([self.code_length, self.code_range]), strategy=np.array(self.strategy), guesses=self.guesses, children=self.children)
+
+  def __len__(self) -> int:
+    return len(self.guesses)
+
+  def node_depths(self) -> np.ndarray:
+    """Returns guesses played before reaching each node, the root is 0."""
+    depths = np.zeros(len(self), dtype=np.int32)
+    for node, row in enumerate(self.children):
+      depths[row[row >= 0]] = depths[node] + 1
+    return depths
+
+  def solved_guess_counts(self) -> np.ndarray:
+    """Returns guesses used to solve each secret the tree solves."""
+    return self.node_depths()[(self.children == SOLVED).any(axis=1)] + 1
+
+  @property
+  def depth(self) -> int:
+    """Returns guesses needed for the hardest secret."""
+    return int(self.solved_guess_counts().max())
+
+  @property
+  def average_guesses(self) -> float:
+    """Returns mean guesses needed over every secret solved."""
+    return float(self.solved_guess_counts().mean())
+
+def play_path(code_breaker: CodeBreaker, path: tuple) -> CodeEntry:
+  """Replay a game's moves to the CodeBreaker from turn 1, returns its next guess."""
+  for turn, (guess_code, feedback) in enumerate(path, 1):
+    code_breaker.turn = turn
+    code_breaker.make_guess()
+    code_breaker.receive_feedback(guess_code, feedback)
+  code_breaker.turn = len(path) + 1
+  return code_breaker.make_guess()
+
+class TreeCodeBreaker(CodeBreaker):
+  """Machine CodeBreaker player that walks a compiled DecisionTree, every move is one array lookup."""
+  def __init__(self, decision_tree: DecisionTree):
+    super().__init__(decision_tree.code_length, decision_tree.code_range)
+    self.decision_tree = decision_tree
+    self.children = decision_tree.children
+    self.sequences = scoring.decode_codes(scoring.codes_from_indices(decision_tree.guesses, self.code_length, self.code_range))
+    self.node = 0
+    self.history = []  # List[Tuple(CodeEntry, Feedback)] of the current game, replayed once it leaves the tree
+
+  def make_guess(self) -> CodeEntry:
+    """Returns guess at the current node, or the first code consistent with the game so far once it left the tree."""
+    if self.turn == 1:
+      self.node = 0
+      self.history = []
+    if self.node < 0:
+      for indices in scoring.iter_consistent_indices(self.history, self.code_length, self.code_range):
+        if len(indices):
+          return CodeEntry(scoring.decode_codes(scoring.codes_from_indices(indices[:1], self.code_length, self.code_range))[0], self.code_length, self.code_range)
+      raise ValueError("No code is consistent with the feedback received.")
+    return CodeEntry(self.sequences[self.node], self.code_length, self.code_range)
+
+  def receive_feedback(self, guess_code: CodeEntry, feedback: Feedback) -> None:
+    """Move to the child node of the feedback."""
+    self.history.append((guess_code, feedback))
+    if self.node >= 0:
+      self.node = int(self.children[self.node, feedback.id])
+
+def load_tree_breaker(path: str, code_length: int, code_range: int) -> TreeCodeBreaker:
+  """Returns TreeCodeBreaker playing the tree saved at path, raises ValueError if it was compiled for other rules."""
+  decision_tree = DecisionTree.load(path)
+  if (decision_tree.code_length, decision_tree.code_range) != (code_length, code_range):
+    raise ValueError(f"{path} was compiled for {decision_tree.code_length}x{decision_tree.code_range}, not {code_length}x{code_range}.")
+  return TreeCodeBreaker(decision_tree)
+
+def tree_breaker_factory(path: str) -> partial:
+  """Returns picklable breaker_factory for simulate_games and run_parallel_simulation playing a saved tree."""
+  return partial(load_tree_breaker, path)
+
+def main(argv: list=None) -> None:
+  from .solver import SolverCodeBreaker
+  parser = argparse.ArgumentParser(description="Compile the solver into a decision tree for one rule configuration.")
+  parser.add_argument("code_length", type=int)
+  parser.add_argument("code_range", type=int)
+  parser.add_argument("--max-attempt", type=int, default=10)
+  parser.add_argument("--output", required=True, help="path of the .npz file to write")
+  args = parser.parse_args(argv)
+  decision_tree = DecisionTree.compile(SolverCodeBreaker(args.code_length, args.code_range), args.max_attempt)
+  decision_tree.save(args.output)
+  print(f"{len(decision_tree)} nodes, depth {decision_tree.depth}, {decision_tree.average_guesses:.4f} guesses on average, "
+        f"{len(decision_tree.solved_guess_counts())} of {args.code_range ** args.code_length} secrets solved")
+
+if __name__ == "__main__":
+  main()
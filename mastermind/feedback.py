@@ -1,9 +1,45 @@
 class Feedback:
-  """Formats result of code comparison and quality of guess."""
-  def __init__(self, correct_number: int, correct_location: int, code_length: int):
-    self.correct_number = correct_number
-    self.correct_location = correct_location
-    self.code_length = code_length
+  """
+  Formats result of code comparison and quality of guess.
+
+  Instances are interned: Feedback(correct_number, correct_location, code_length) returns the one shared,
+  immutable instance of that result, so equal Feedback are identical and hash by identity. Each carries its
+  rendered text and an id, the feedback index correct_number * (code_length + 1) + correct_location that
+  solvers and tables use as a partition key.
+  """
+  __slots__ = ("correct_number", "correct_location", "code_length", "id", "text")
+  _interned = {}  # Dict[Tuple(correct_number, correct_location, code_length), Feedback]
+
+  def __new__(cls, correct_number: int, correct_location: int, code_length: int) -> "Feedback":
+    key = (correct_number, correct_location, code_length)
+    feedback = cls._interned.get(key)
+    if feedback is None:
+      feedback = super().__new__(cls)
+      plural = lambda x: "s" if x != 1 else ""
+      #plain ints even when built from numpy scalars, which hash the same as the key
+      correct_number, correct_location, code_length = int(correct_number), int(correct_location), int(code_length)
+      object.__setattr__(feedback, "correct_number", correct_number)
+      object.__setattr__(feedback, "correct_location", correct_location)
+      object.__setattr__(feedback, "code_length", code_length)
+      object.__setattr__(feedback, "id", correct_number * (code_length + 1) + correct_location)
+      object.__setattr__(feedback, "text", f"{correct_number} correct number{plural(correct_number)} and {correct_location} correct location{plural(correct_location)}")
+      #another thread may have interned the same result first, keep whichever got in
+      feedback = cls._interned.setdefault(key, feedback)
+    return feedback
+
+  @classmethod
+  def from_id(cls, feedback_id: int, code_length: int) -> "Feedback":
+    """Returns the Feedback whose id is feedback_id under the code length."""
+    return cls(*divmod(int(feedback_id), code_length + 1), code_length)
+
+  def __setattr__(self, name: str, value) -> None:
+    raise AttributeError("Feedback is immutable.")
+
+  def __reduce__(self) -> tuple:
+    return Feedback, (self.correct_number, self.correct_location, self.code_length)
+
+  def __repr__(self) -> str:
+    return f"Feedback({self.correct_number}, {self.correct_location}, {self.code_length})"
 
   def is_perfect_response(self) -> bool:
     """Returns True if all parts of Feedback responses match code length."""
@@ -11,5 +47,4 @@ class Feedback:
 
   def to_string(self) -> str:
     """Returns a readable string of result."""
-    plural = lambda x: "s" if x != 1 else ""
-    return f"{self.correct_number} correct number{plural(self.correct_number)} and {self.correct_location} correct location{plural(self.correct_location)}"
\ No newline at end of file
+    return self.text
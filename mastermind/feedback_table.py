@@ -0,0 +1,119 @@
+import os
+from .code_entry import is_code_sequence, pack_sequence
+from .feedback import Feedback
+
+#largest table built automatically, 4x8 (4096 codes) is 16M one byte entries
+MAX_TABLE_ENTRIES = 1 << 24
+#guess rows scored per chunk while building a table
+BUILD_CHUNK_ROWS = 256
+
+def default_cache_dir() -> str:
+  """Returns directory for precomputed data, MASTERMIND_CACHE_DIR overrides ~/.cache/mastermind."""
+  return os.environ.get("MASTERMIND_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "mastermind")
+
+def table_fits(code_length: int, code_range: int) -> bool:
+  """Returns True if a full feedback table for the rules is small enough to precompute."""
+  #(code_length + 1) ** 2 is scoring.feedback_index_count, kept inline so checking the rules never imports numpy
+  return (code_range ** code_length) ** 2 <= MAX_TABLE_ENTRIES and (code_length + 1) ** 2 <= 256
+
+class FeedbackTable:
+  """
+  Every guess/secret feedback for one rule configuration, stored as uint8 feedback indexes.
+
+  numpy is only imported to build, load or save a table, so the rules and saved files can be checked without it.
+  """
+  def __init__(self, table: "np.ndarray", code_length: int, code_range: int):
+    self.table = table
+    self.code_length = code_length
+    self.code_range = code_range
+
+  @classmethod
+  def build(cls, code_length: int, code_range: int) -> "FeedbackTable":
+    """Score every code against every other code, returns new FeedbackTable held in memory."""
+    import numpy as np
+    from . import scoring
+    codes = scoring.all_codes(code_length, code_range)
+    table = np.empty((len(codes), len(codes)), dtype=np.uint8)
+    for start in range(0, len(codes), BUILD_CHUNK_ROWS):
+      correct_number, correct_location = scoring.score_matrix(codes[start:start + BUILD_CHUNK_ROWS], codes, code_range)
+      table[start:start + BUILD_CHUNK_ROWS] = scoring.feedback_index(correct_number, correct_location, code_length)
+    return cls(table, code_length, code_range)
+
+  @classmethod
+  def load(cls, path: str, code_length: int, code_range: int) -> "FeedbackTable":
+    """Memory-map a saved table, returns FeedbackTable backed by the file."""
+    import numpy as np
+    return cls(np.load(path, mmap_mode="r"), code_length, code_range)
+
+  def save(self, path: str) -> None:
+    """Write table to path, replacing any existing file only once fully written."""
+    import numpy as np
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as temp_file:
+      np.save(temp_file, np.asarray(self.table))
+    os.replace(temp_path, path)
+
+  def row(self, code_index: int) -> "np.ndarray":
+    """Returns feedback indexes of one code against every code in the code space."""
+    return self.table[code_index]
+
+  def lookup(self, secret_sequence: str, guess_sequence: str) -> Feedback:
+    """Returns Feedback of a guess against a secret with one table index, raises ValueError for codes outside the rules."""
+    for sequence in (secret_sequence, guess_sequence):
+      if not is_code_sequence(sequence, self.code_length, self.code_range):
+        raise ValueError(f"{sequence!r} is not a code of length {self.code_length} and range {self.code_range}.")
+    #a packed code is its index in the table, as scoring.code_to_index
+    index = self.table[pack_sequence(secret_sequence, self.code_range), pack_sequence(guess_sequence, self.code_range)]
+    return Feedback.from_id(index, self.code_length)
+
+def table_path(code_length: int, code_range: int, cache_dir: str=None) -> str:
+  """Returns file path of the saved table for the rules."""
+  return os.path.join(cache_dir or default_cache_dir(), f"feedback_{code_length}x{code_range}.npy")
+
+def saved_feedback_table(code_length: int, code_range: int, cache_dir: str=None) -> FeedbackTable:
+  """
+  Memory-map the saved feedback table for the rules, never building one.
+
+  Args:
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    cache_dir(str): Directory of saved tables, defaults to default_cache_dir().
+
+  Returns:
+    FeedbackTable: Memory-mapped table, or None if the rules do not fit a table or no readable table is saved.
+  """
+  if not table_fits(code_length, code_range):
+    return None
+  path = table_path(code_length, code_range, cache_dir)
+  if not os.path.exists(path):
+    return None
+  try:
+    return FeedbackTable.load(path, code_length, code_range)
+  except (OSError, ValueError):
+    return None  #unreadable or stale file
+
+def get_feedback_table(code_length: int, code_range: int, cache_dir: str=None) -> FeedbackTable:
+  """
+  Load the feedback table for the rules, building and saving it on first use.
+
+  Args:
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    cache_dir(str): Directory of saved tables, defaults to default_cache_dir().
+
+  Returns:
+    FeedbackTable: Memory-mapped table, or None if the configuration is too large for a table.
+  """
+  if not table_fits(code_length, code_range):
+    return None
+  feedback_table = saved_feedback_table(code_length, code_range, cache_dir)
+  if feedback_table is not None:
+    return feedback_table
+  path = table_path(code_length, code_range, cache_dir)
+  feedback_table = FeedbackTable.build(code_length, code_range)
+  try:
+    feedback_table.save(path)
+    return FeedbackTable.load(path, code_length, code_range)
+  except OSError:
+    return feedback_table
@@ -0,0 +1,84 @@
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+
+#clear screen and move cursor home, replaces spawning a "clear"/"cls" shell
+ANSI_CLEAR = "\033[2J\033[H"
+
+class Frontend(ABC):
+  """I/O interface between Game and its player, subclasses decide where output goes and input comes from."""
+  @abstractmethod
+  def show(self, text: str="") -> None:
+    """Display one line of text to the player."""
+
+  @abstractmethod
+  def ask(self, prompt: str) -> str:
+    """Display prompt and return the player's input line."""
+
+  @abstractmethod
+  def clear(self) -> None:
+    """Clear the player's screen."""
+
+  def flush(self) -> None:
+    """Push out any buffered output."""
+    pass
+
+class NullFrontend(Frontend):
+  """Discards all output and answers every prompt with an empty line, for benchmarks and headless play."""
+  def show(self, text: str="") -> None:
+    pass
+
+  def ask(self, prompt: str) -> str:
+    return ""
+
+  def clear(self) -> None:
+    pass
+
+class TerminalFrontend(Frontend):
+  """Terminal I/O that clears with ANSI escapes instead of a subprocess, buffered output is held until input is needed."""
+  def __init__(self, buffered: bool=True, stream=None):
+    self.buffered = buffered
+    self.stream = stream
+    self.buffer = []
+
+  def show(self, text: str="") -> None:
+    self.buffer.append(f"{text}\n")
+    if not self.buffered:
+      self.flush()
+
+  def ask(self, prompt: str) -> str:
+    self.flush()
+    return input(prompt)
+
+  def clear(self) -> None:
+    self.buffer.append(ANSI_CLEAR)
+    if not self.buffered:
+      self.flush()
+
+  def flush(self) -> None:
+    if self.buffer:
+      stream = self.stream or sys.stdout
+      stream.write("".join(self.buffer))
+      stream.flush()
+      self.buffer.clear()
+
+class BufferedFrontend(Frontend):
+  """Collects output for a host such as a network server to send, input lines are queued in by the host."""
+  def __init__(self):
+    self.lines = []
+    self.inputs = deque()
+
+  def show(self, text: str="") -> None:
+    self.lines.append(text)
+
+  def ask(self, prompt: str) -> str:
+    return self.inputs.popleft() if self.inputs else ""
+
+  def clear(self) -> None:
+    pass
+
+  def drain(self) -> str:
+    """Returns every line shown since the last drain."""
+    text = "\n".join(self.lines)
+    self.lines.clear()
+    return text
@@ -1,18 +1,39 @@
-import os
 from .code_maker import CodeMaker
 from .code_breaker import CodeBreaker
+from .code_entry import MAX_CODE_RANGE, SYMBOLS
+from .history_store import MemoryHistoryStore
+from .instrumentation import Metrics, NULL_METRICS
+from .frontend import Frontend, TerminalFrontend
+
+COMMANDS = {
+  "rules": "Rules of the game.",
+  "help": "List of commands.",
+  "hint": "Reveals a number and its position in the secret code.",
+  "clear": "Clear out terminal.",
+  "reset": "Resets the current game.",
+  "quit": "Quits the current game.",
+  "history": "Print current game guesses and feedbacks.",
+  "remaining": "Count secret codes still possible after your guesses.",
+  "previous [number]": "Print history of of the n-th game, if played."
+}
+#largest code space whose possible secrets can be tracked, the bitset and per-guess masks grow with it
+MAX_TRACKED_CODES = 1 << 24
+#first word of every command, checked before code validation since letter symbols can spell them
+COMMAND_WORDS = {command.split()[0] for command in COMMANDS}
 
 class Game:
   """Create instance instance of the game, handles game logic."""
-  def __init__(self, code_length: int=4, code_range: int=8, max_attempt: int=10):
+  def __init__(self, code_length: int=4, code_range: int=8, max_attempt: int=10, code_pool: "SecretCodePool"=None, offline: bool=False, frontend: Frontend=None, track_candidates: bool=False, history_store: "MemoryHistoryStore | SQLiteHistoryStore"=None, metrics: Metrics=None, replay_log: "ReplayLogWriter"=None, hard_mode: bool=False):
     if not str(code_length).isdigit() or code_length < 1:
       raise ValueError("code_length must be a positive integer.")
     if not str(code_range).isdigit() or code_range < 1:
       raise ValueError("code_range must be a positive integer.")
-    if code_range > 9:
-      raise ValueError("code_range must be less than 10. Increase code_length to accommodate for 10 if needed.")
+    if code_range > MAX_CODE_RANGE:
+      raise ValueError(f"code_range must be at most {MAX_CODE_RANGE}. Values from 10 up are entered as letters a-z.")
     if not str(max_attempt).isdigit() or max_attempt < 1:
       raise ValueError("max_attempt must be a positive integer.")
+    if track_candidates and code_range ** code_length > MAX_TRACKED_CODES:
+      raise ValueError(f"track_candidates needs at most {MAX_TRACKED_CODES} possible codes, {code_length}x{code_range} has {code_range ** code_length}.")
     self.code_length = code_length
     self.code_range = code_range
     self.max_attempt = max_attempt
@@ -26,38 +47,61 @@ class Game:
     self.current_guess = None
     self.current_feedback = None
     self.winner = None
-    self.game_count = 0
     self.quit_game = None
-    self.prev_match_history = {} #Dict{game_count (int): game_history (list)}
+    self.prev_match_history = MemoryHistoryStore() if history_store is None else history_store #Dict{game_count (int): (winner, game_history (list))}
+    #continue numbering after games saved by earlier sessions, so they are never overwritten
+    self.game_count = self.prev_match_history.last_game_number()
+    self.code_pool = code_pool
+    self.offline = offline
+    self.frontend = frontend or TerminalFrontend()
+    self.track_candidates = track_candidates
+    self.metrics = metrics or NULL_METRICS
+    self.replay_log = replay_log
+    self.hard_mode = hard_mode
+    self.candidate_index = None
   
   def clear_terminal(self) -> None:
     """For clearing out terminal (UI extension)."""
-    if os.name == "nt":   #for Windows
-      os.system("cls")
-    else:     #for Linux and macOS
-      os.system("clear")
+    with self.metrics.time("clear"):
+      self.frontend.clear()
 
   def start(self) -> None:
     """Initialize players and set up start of game."""
     self.welcome_rules()
-    self.code_maker = CodeMaker(self.code_length, self.code_range)
-    self.code_breaker = CodeBreaker(self.code_length, self.code_range)
+    self.create_players()
     self.reset_game_state()
 
+  def create_players(self) -> None:
+    """Create CodeMaker, CodeBreaker and candidate tracking for the game's rules, no secret code is made yet."""
+    if self.hard_mode:
+      from .adversarial import AdversarialCodeMaker
+      self.code_maker = AdversarialCodeMaker(self.code_length, self.code_range, frontend=self.frontend, metrics=self.metrics)
+    else:
+      self.code_maker = CodeMaker(self.code_length, self.code_range, code_pool=self.code_pool, offline=self.offline, frontend=self.frontend, metrics=self.metrics)
+    self.code_breaker = CodeBreaker(self.code_length, self.code_range, self.frontend)
+    if self.track_candidates:
+      from .candidate_index import CandidateIndex
+      from .feedback_table import get_feedback_table
+      #masks come from table rows when the rules fit a table, instead of rescoring the code space for each new guess
+      self.candidate_index = CandidateIndex(self.code_length, self.code_range, get_feedback_table(self.code_length, self.code_range))
+
   def welcome_rules(self) -> None:
     """Welcome player and sets out rules for better UX."""
-    print(f"Welcome to Mastermind. Try to figure out the secret code! It is {self.code_length} numbers long ranging from 0-{self.code_range}. You have {self.max_attempt} attempts. You can input 'help' for more commands. Good luck!")
+    self.frontend.show(f"Welcome to Mastermind. Try to figure out the secret code! It is {self.code_length} numbers long ranging from 0-{self.code_range}. You have {self.max_attempt} attempts. You can input 'help' for more commands. Good luck!")
 
   def reset_game_state(self) -> None:
     """Resets the state of the game to simulate a start of a new game."""
     #reset game states, do not affect players
-    self.code_maker.generate_code()
+    with self.metrics.time("generate_code"):
+      self.code_maker.generate_code()
     self.hint_answer_dict = self.code_maker.get_hint_position_dict()
     self.hint = "x" * self.code_length
     self.active_game = True
     self.turn = 1
     self.code_breaker.turn = self.turn
     self.current_game_history = []
+    if self.candidate_index:
+      self.candidate_index.reset()
     self.current_guess = None
     self.current_feedback = None
     self.winner = None
@@ -73,20 +117,24 @@ class Game:
         self.update_prev_match_history()
       play_again = self.ask_play_again()
       self.clear_terminal()
-    print(f"Match history: {self.format_match_history()}Goodbye!")
+    self.frontend.show(f"Match history: {self.format_match_history()}Goodbye!")
+    self.frontend.flush()
+    if self.replay_log:
+      self.replay_log.flush()
  
   def run_one_game(self) -> None:
     """Runs one iteration of the game until winner decided."""
     self.game_count += 1
-    print(f"Starting game #{self.game_count}.")
+    self.metrics.increment("games")
+    self.frontend.show(f"Starting game #{self.game_count}.")
 
     while not self.is_over():
       if self.quit_game:
         return
       self.make_move()
     self.active_game = False
-    print()
-    print(f"The secret code was {self.code_maker.secret_code.sequence}. Congratulations, {self.winner} won this round!")  
+    self.frontend.show()
+    self.frontend.show(f"The secret code was {self.code_maker.secret_code.sequence}. Congratulations, {self.winner} won this round!")  
 
   def quitting_game(self) -> None:
     """Set game states for quitting game."""
@@ -97,11 +145,13 @@ class Game:
 
   def update_prev_match_history(self) -> None:
     """Update previous match history dictionary of current game's winner and game history."""
-    self.prev_match_history[self.game_count] = (self.winner, self.current_game_history)
+    self.prev_match_history.record_game(self.game_count, self.winner, self.current_game_history)
+    if self.replay_log:
+      self.replay_log.append(self.code_maker.secret_code, self.current_game_history)
 
   def ask_play_again(self) -> bool:
     """Asks user if want to play again."""
-    play_again_input = input("Do you want to play again (y/n)? ")
+    play_again_input = self.frontend.ask("Do you want to play again (y/n)? ")
     if play_again_input and len(play_again_input) > 0 and play_again_input.lower()[0] == "y":
       self.reset_game_state()
       return True
@@ -109,7 +159,7 @@ class Game:
 
   def make_move(self) -> None:
     """Perform a single game move: CodeBreaker guess, CodeMaker evaluate, update game's current_guess, current_feedback, and game state."""
-    print()
+    self.frontend.show()
     guess_code = self.request_code_breaker_guess()
     if self.quit_game:
       return
@@ -120,37 +170,32 @@ class Game:
   
   def request_code_breaker_guess(self) -> "CodeEntry":
     """Request Code Breaker to input a valid guess, returns a valid CodeEntry object that follows game restraints."""
-    guess_code = self.code_breaker.make_guess()
-    while not guess_code.is_valid():
-      print(self.response_to_code_breaker_input(guess_code.sequence.lower()))
+    with self.metrics.time("guess_input"):
+      guess_code = self.code_breaker.make_guess()
+    while guess_code.sequence.lower() in COMMAND_WORDS or not guess_code.is_valid():
+      self.metrics.increment("commands")
+      self.frontend.show(self.response_to_code_breaker_input(guess_code.sequence.lower()))
       if self.quit_game:
         return
-      print()
-      guess_code = self.code_breaker.make_guess()
+      self.frontend.show()
+      with self.metrics.time("guess_input"):
+        guess_code = self.code_breaker.make_guess()
     return guess_code
   
   def response_to_code_breaker_input(self, user_input: str) -> str:
     """Analyze and respond to input user input. Returns string back in response to handling input."""
     rules = f"Mastermind: The goal of this game is to match your guess to a secret code of {self.code_length} numbers ranging from 0-{self.code_range} in {self.max_attempt} attempts."
-    commands = {
-      "rules": "Rules of the game.",
-      "help": "List of commands.",
-      "hint": "Reveals a number and its position in the secret code.",
-      "clear": "Clear out terminal.",
-      "reset": "Resets the current game.",
-      "quit": "Quits the current game.",
-      "history": "Print current game guesses and feedbacks.",
-      "previous [number]": "Print history of of the n-th game, if played."
-    }
     match(user_input):
       case "rules":
         return rules
       case "help":
         statement = []
-        for command, brief in commands.items():
+        for command, brief in COMMANDS.items():
           statement.append(f"{command} - {brief}")
         return "\n".join(statement)
       case "hint":
+        if self.hard_mode:
+          return "Hints are off in hard mode, the secret code is not chosen until the game ends."
         self.reveal_one_hint()
         return self.hint
       case "clear":
@@ -167,13 +212,18 @@ class Game:
       case "history":
         formatted_curr_game_history = self.format_game_history(self.current_game_history)
         return formatted_curr_game_history
+      case "remaining":
+        if not self.candidate_index:
+          return "Tracking of possible secret codes is off for this game."
+        remaining = self.candidate_index.count()
+        return f"{remaining} possible secret code{'s' if remaining != 1 else ''} remaining."
       case x if "previous" in x:
         game_number = self.validate_previous_input_entry(user_input)
         if game_number:
           return self.previous_game_look_up(game_number)
         return "Please follow the format when looking up previous match histories: 'previous [number]' for games that have already been played."
       case _:
-        return f"Enter {self.code_length} numbers ranging from 0-{self.code_range-1}, or input 'help' to see other commands."
+        return f"Enter {self.code_length} numbers ranging from 0-{SYMBOLS[self.code_range-1]}, or input 'help' to see other commands."
 
   def reveal_one_hint(self) -> None:
     """Update current game's hint to reveal left most number of hidden sequence."""
@@ -185,7 +235,7 @@ class Game:
       self.hint = "".join(hint_array)
       del self.hint_answer_dict[selected_hint_pos]
     else:
-      print(f"There are no more hints to give! The answer is:")
+      self.frontend.show(f"There are no more hints to give! The answer is:")
 
   def validate_previous_input_entry(self, user_input) -> int:
     """Validate user input for previous game lookup request, return int representing the nth game played, 0 being DNE."""
@@ -207,14 +257,19 @@ class Game:
 
   def request_code_maker_evalulation(self, guess_code: "Code") -> "Feedback":
     """Request Code Maker to make evaluation of CodeEntry comparison quality."""
-    requested_feedback = self.code_maker.evaluate_code(guess_code)
-    print(requested_feedback.to_string())
+    with self.metrics.time("evaluate"):
+      requested_feedback = self.code_maker.evaluate_code(guess_code)
+    self.frontend.show(requested_feedback.to_string())
     return requested_feedback
 
   def update_game_state(self) -> None:
     """Update current game history, turn counter, print remaining turn(s)."""
+    self.metrics.increment("moves")
     self.current_game_history.append((self.current_guess, self.current_feedback))
-    print(f"{self.max_attempt - self.turn} guess{'es' if self.turn != self.max_attempt-1 else ''} remaining.")
+    self.code_breaker.receive_feedback(self.current_guess, self.current_feedback)
+    if self.candidate_index:
+      self.candidate_index.apply(self.current_guess, self.current_feedback)
+    self.frontend.show(f"{self.max_attempt - self.turn} guess{'es' if self.turn != self.max_attempt-1 else ''} remaining.")
     self.turn += 1
     self.code_breaker.turn = self.turn
 
@@ -240,13 +295,12 @@ class Game:
 
   def format_match_history(self) -> str:
     """Return shortened result of all games played and its winner."""
-    matches = self.prev_match_history.keys()
+    matches = self.prev_match_history.summaries()
     if not matches:
       return "No games played.\n"
    
     match_result_arr = [] 
-    for match in matches:
-      round_winner, _ = self.prev_match_history[match]
+    for match, round_winner in matches:
       match_result_arr.append(f"Game {match} Winner: {round_winner}")
     match_str = '\n'.join(match_result_arr)
     return f"\n{match_str}\n"
\ No newline at end of file
@@ -0,0 +1,102 @@
+from .code_entry import CodeEntry
+from .feedback import Feedback
+
+class MemoryHistoryStore(dict):
+  """Default match history, game number keys map to (winner, game history) tuples held in memory."""
+  def record_game(self, game_number: int, winner: str, history: list) -> None:
+    """Save a finished game's winner and its list of (CodeEntry, Feedback) moves."""
+    self[game_number] = (winner, history)
+
+  def summaries(self) -> list:
+    """Returns (game number, winner) of every saved game, ordered by game number."""
+    return [(game_number, self[game_number][0]) for game_number in sorted(self)]
+
+  def count_wins(self, winner: str) -> int:
+    """Returns number of saved games won by winner."""
+    return sum(1 for saved_winner, _ in self.values() if saved_winner == winner)
+
+  def last_game_number(self) -> int:
+    """Returns highest saved game number, 0 when no game is saved."""
+    return max(self, default=0)
+
+  def close(self) -> None:
+    pass
+
+class SQLiteHistoryStore:
+  """Match history persisted in SQLite, indexed by game number and winner, each game written in one transaction."""
+  SCHEMA = """
+    CREATE TABLE IF NOT EXISTS games (
+      game_number INTEGER PRIMARY KEY,
+      winner TEXT,
+      code_length INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS games_by_winner ON games (winner);
+    CREATE TABLE IF NOT EXISTS moves (
+      game_number INTEGER NOT NULL,
+      turn INTEGER NOT NULL,
+      guess TEXT NOT NULL,
+      guess_length INTEGER NOT NULL,
+      guess_range INTEGER NOT NULL,
+      correct_number INTEGER NOT NULL,
+      correct_location INTEGER NOT NULL,
+      PRIMARY KEY (game_number, turn)
+    ) WITHOUT ROWID;
+  """
+
+  def __init__(self, path: str=":memory:"):
+    import sqlite3  #only persisted histories pay for loading sqlite3, plain games use MemoryHistoryStore
+    self.path = path
+    self.connection = sqlite3.connect(path)
+    self.connection.executescript(self.SCHEMA)
+
+  def record_game(self, game_number: int, winner: str, history: list) -> None:
+    """Save a finished game's winner and its list of (CodeEntry, Feedback) moves in one batched write."""
+    code_length = history[0][1].code_length if history else 0
+    with self.connection:
+      self.connection.execute("DELETE FROM moves WHERE game_number = ?", (game_number,))
+      self.connection.execute("INSERT OR REPLACE INTO games VALUES (?, ?, ?)", (game_number, winner, code_length))
+      self.connection.executemany(
+        "INSERT INTO moves VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(game_number, turn, guess.sequence, guess.length_rule, guess.range_rule, feedback.correct_number, feedback.correct_location) for turn, (guess, feedback) in enumerate(history, 1)]
+      )
+
+  def __setitem__(self, game_number: int, game: tuple) -> None:
+    self.record_game(game_number, *game)
+
+  def __getitem__(self, game_number: int) -> tuple:
+    """Returns (winner, game history) of a saved game, history rebuilt as (CodeEntry, Feedback) tuples."""
+    row = self.connection.execute("SELECT winner, code_length FROM games WHERE game_number = ?", (game_number,)).fetchone()
+    if row is None:
+      raise KeyError(game_number)
+    winner, code_length = row
+    moves = self.connection.execute(
+      "SELECT guess, guess_length, guess_range, correct_number, correct_location FROM moves WHERE game_number = ? ORDER BY turn",
+      (game_number,)
+    )
+    return winner, [(CodeEntry(guess, length, code_range), Feedback(number, location, code_length)) for guess, length, code_range, number, location in moves]
+
+  def __contains__(self, game_number: int) -> bool:
+    return self.connection.execute("SELECT 1 FROM games WHERE game_number = ?", (game_number,)).fetchone() is not None
+
+  def __len__(self) -> int:
+    return self.connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+  def keys(self) -> list:
+    """Returns every saved game number in order."""
+    return [game_number for game_number, in self.connection.execute("SELECT game_number FROM games ORDER BY game_number")]
+
+  def summaries(self) -> list:
+    """Returns (game number, winner) of every saved game, ordered by game number."""
+    return self.connection.execute("SELECT game_number, winner FROM games ORDER BY game_number").fetchall()
+
+  def count_wins(self, winner: str) -> int:
+    """Returns number of saved games won by winner."""
+    return self.connection.execute("SELECT COUNT(*) FROM games WHERE winner = ?", (winner,)).fetchone()[0]
+
+  def last_game_number(self) -> int:
+    """Returns highest saved game number, 0 when no game is saved."""
+    return self.connection.execute("SELECT COALESCE(MAX(game_number), 0) FROM games").fetchone()[0]
+
+  def close(self) -> None:
+    """Close the database connection."""
+    self.connection.close()
@@ -0,0 +1,122 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+#upper bounds in seconds of latency histogram buckets, covering fast evaluation up to slow player input
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, float("inf"))
+
+class LatencyHistogram:
+  """Count of observed latencies per bucket, along with their total."""
+  def __init__(self):
+    self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+    self.count = 0
+    self.total = 0.0
+
+  def observe(self, seconds: float) -> None:
+    self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+    self.count += 1
+    self.total += seconds
+
+  def to_dict(self) -> dict:
+    """Returns count, sum and cumulative bucket counts keyed by bucket upper bound."""
+    cumulative, buckets = 0, {}
+    for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+      cumulative += bucket_count
+      buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+    return {"count": self.count, "sum": self.total, "buckets": buckets}
+
+class PhaseTimer:
+  """Context manager observing the time spent inside it into one phase's histogram."""
+  __slots__ = ("metrics", "phase", "start")
+
+  def __init__(self, metrics: "Metrics", phase: str):
+    self.metrics = metrics
+    self.phase = phase
+
+  def __enter__(self) -> "PhaseTimer":
+    self.start = time.perf_counter()
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.metrics.observe(self.phase, time.perf_counter() - self.start)
+
+class Metrics:
+  """Counters and per-phase latency histograms, safe to export from another thread while a game runs."""
+  enabled = True
+
+  def __init__(self):
+    self.counters = {} #Dict{counter name (str): count (int)}
+    self.histograms = {} #Dict{phase name (str): LatencyHistogram}
+    self.lock = threading.Lock()
+
+  def increment(self, name: str, amount: int=1) -> None:
+    """Add amount to a counter."""
+    with self.lock:
+      self.counters[name] = self.counters.get(name, 0) + amount
+
+  def observe(self, phase: str, seconds: float) -> None:
+    """Record one latency of a phase."""
+    with self.lock:
+      histogram = self.histograms.get(phase)
+      if histogram is None:
+        histogram = self.histograms[phase] = LatencyHistogram()
+      histogram.observe(seconds)
+
+  def time(self, phase: str) -> PhaseTimer:
+    """Returns context manager timing its body as one latency of phase."""
+    return PhaseTimer(self, phase)
+
+  def snapshot(self) -> dict:
+    """Returns a consistent copy of every counter and histogram."""
+    with self.lock:
+      return {
+        "counters": dict(self.counters),
+        "histograms": {phase: histogram.to_dict() for phase, histogram in self.histograms.items()}
+      }
+
+  def to_json(self) -> str:
+    """Returns snapshot as JSON text."""
+    return json.dumps(self.snapshot(), sort_keys=True)
+
+  def to_prometheus(self, prefix: str="mastermind") -> str:
+    """Returns snapshot in Prometheus text exposition format."""
+    snapshot = self.snapshot()
+    lines = []
+    for name, count in sorted(snapshot["counters"].items()):
+      lines.append(f"# TYPE {prefix}_{name}_total counter")
+      lines.append(f"{prefix}_{name}_total {count}")
+    if snapshot["histograms"]:
+      lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+    for phase, histogram in sorted(snapshot["histograms"].items()):
+      for bound, cumulative in histogram["buckets"].items():
+        lines.append(f'{prefix}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+      lines.append(f'{prefix}_phase_seconds_sum{{phase="{phase}"}} {histogram["sum"]}')
+      lines.append(f'{prefix}_phase_seconds_count{{phase="{phase}"}} {histogram["count"]}')
+    return "\n".join(lines) + "\n"
+
+  def write(self, path: str, prometheus: bool=False) -> None:
+    """Atomically write the current snapshot to path, so readers never see a partial file."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as temp_file:
+      temp_file.write(self.to_prometheus() if prometheus else self.to_json())
+    os.replace(temp_path, path)
+
+class NullMetrics(Metrics):
+  """Disabled instrumentation, every call is a no-op so the hot path pays close to nothing."""
+  enabled = False
+  _null_timer = nullcontext()
+
+  def increment(self, name: str, amount: int=1) -> None:
+    pass
+
+  def observe(self, phase: str, seconds: float) -> None:
+    pass
+
+  def time(self, phase: str) -> nullcontext:
+    return self._null_timer
+
+#shared default for Game and CodeMaker when instrumentation is off
+NULL_METRICS = NullMetrics()
@@ -0,0 +1,102 @@
+"""
+Precomputed first and second guesses of a solver strategy.
+
+Build a book offline once per rule configuration:
+  python -m mastermind.opening_book 4 8
+"""
+import argparse
+import os
+import numpy as np
+from . import scoring
+from .feedback_table import default_cache_dir
+
+#reply slot of a feedback the opening guess can never receive
+NO_REPLY = -1
+
+class OpeningBook:
+  """Opening guess of a strategy and its reply to every possible first feedback, as code space indexes."""
+  def __init__(self, code_length: int, code_range: int, strategy: str, opening: int, replies: np.ndarray):
+    self.code_length = code_length
+    self.code_range = code_range
+    self.strategy = strategy
+    self.opening = opening
+    self.replies = replies
+
+  @classmethod
+  def build(cls, solver) -> "OpeningBook":
+    """Run the solver's live search for the opening and every reply, returns new OpeningBook."""
+    solver.reset()
+    opening = solver.choose_guess()
+    replies = np.full(scoring.feedback_index_count(solver.code_length), NO_REPLY, dtype=np.int32)
+    first_feedback = solver.feedback_rows(np.array([opening]), np.arange(len(solver.codes)))[0]
+    for received in np.unique(first_feedback):
+      solver.reset()
+      solver.history = ((opening, int(received)),)
+      replies[received] = solver.choose_guess()
+    solver.reset()
+    return cls(solver.code_length, solver.code_range, solver.strategy, opening, replies)
+
+  @classmethod
+  def load(cls, path: str, code_length: int, code_range: int, strategy: str) -> "OpeningBook":
+    """Read a saved book, raises ValueError if it does not fit the rules."""
+    entries = np.load(path)
+    if entries.shape != (1 + scoring.feedback_index_count(code_length),):
+      raise ValueError(f"{path} is not an opening book for code length {code_length}.")
+    return cls(code_length, code_range, strategy, int(entries[0]), entries[1:])
+
+  def save(self, path: str) -> None:
+    """Write book as one int32 array (opening, replies...), replacing any existing file only once fully written."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as temp_file:
+      np.save(temp_file, np.concatenate(([self.opening], self.replies)).astype(np.int32))
+    os.replace(temp_path, path)
+
+  def guess(self, history: tuple) -> int:
+    """
+    Look up the guess for a solver history of (guess index, feedback index) pairs.
+
+    Returns:
+      int: Code space index of the guess, or None once the game has left the book.
+    """
+    if not history:
+      return self.opening
+    if len(history) == 1 and history[0][0] == self.opening:
+      reply = int(self.replies[history[0][1]])
+      return None if reply == NO_REPLY else reply
+    return None
+
+def book_path(code_length: int, code_range: int, strategy: str, cache_dir: str=None) -> str:
+  """Returns file path of the saved book for the rules and strategy."""
+  return os.path.join(cache_dir or default_cache_dir(), f"opening_{code_length}x{code_range}_{strategy}.npy")
+
+def load_opening_book(code_length: int, code_range: int, strategy: str, cache_dir: str=None) -> OpeningBook:
+  """Returns the saved book for the rules and strategy, or None if none was built or it is unreadable."""
+  path = book_path(code_length, code_range, strategy, cache_dir)
+  if not os.path.exists(path):
+    return None
+  try:
+    return OpeningBook.load(path, code_length, code_range, strategy)
+  except (OSError, ValueError):
+    return None
+
+def build_opening_book(solver, cache_dir: str=None) -> OpeningBook:
+  """Build the book of a solver's strategy and save it where its solvers will look for it."""
+  opening_book = OpeningBook.build(solver)
+  opening_book.save(book_path(solver.code_length, solver.code_range, solver.strategy, cache_dir))
+  return opening_book
+
+def main(argv: list=None) -> None:
+  from .solver import SolverCodeBreaker
+  parser = argparse.ArgumentParser(description="Precompute the solver's opening book for one rule configuration.")
+  parser.add_argument("code_length", type=int)
+  parser.add_argument("code_range", type=int)
+  parser.add_argument("--cache-dir", help="directory of saved books, defaults to the feedback table cache")
+  args = parser.parse_args(argv)
+  solver = SolverCodeBreaker(args.code_length, args.code_range, cache_dir=args.cache_dir)
+  opening_book = build_opening_book(solver, args.cache_dir)
+  print(f"Opening {solver.sequence_of(opening_book.opening)}, {int((opening_book.replies != NO_REPLY).sum())} replies saved to "
+        f"{book_path(args.code_length, args.code_range, solver.strategy, args.cache_dir)}")
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,93 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .code_maker import CodeMaker
+from .feedback_table import get_feedback_table
+from .simulation import SimulationStats, run_games
+from .solver import SolverCodeBreaker
+
+#per-process players, built once by the pool initializer so tasks only carry a seed and a game count
+_worker_state = {}
+
+class ParallelResult:
+  """Merged statistics of a parallel simulation and the throughput of each worker process."""
+  def __init__(self, stats: SimulationStats, worker_stats: dict, seconds: float):
+    self.stats = stats
+    self.worker_stats = worker_stats #Dict{worker pid (int): {"games", "batches", "seconds", "games_per_second"}}
+    self.seconds = seconds
+
+  @property
+  def games_per_second(self) -> float:
+    """Returns overall throughput in games per wall clock second."""
+    return self.stats.games / self.seconds if self.seconds else 0.0
+
+  def to_dict(self) -> dict:
+    """Returns plain dictionary of the merged statistics and worker throughput."""
+    return {
+      "stats": self.stats.to_dict(),
+      "seconds": self.seconds,
+      "games_per_second": self.games_per_second,
+      "workers": self.worker_stats
+    }
+
+def batch_seeds(master_seed: int, n_batches: int) -> list:
+  """Derive one independent seed per batch from the master seed, same master seed gives same seeds."""
+  return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(master_seed).spawn(n_batches)]
+
+def _init_worker(code_length: int, code_range: int, breaker_factory, cache_dir: str) -> None:
+  """Build the worker's players once, feedback tables are memory-mapped from the shared cache file."""
+  if cache_dir:
+    os.environ["MASTERMIND_CACHE_DIR"] = cache_dir
+  code_maker = CodeMaker(code_length, code_range, auto_feedback_table=False)
+  code_maker.use_feedback_table(cache_dir)
+  _worker_state["code_maker"] = code_maker
+  _worker_state["code_breaker"] = breaker_factory(code_length, code_range)
+
+def _run_batch(n_games: int, seed: int, max_attempt: int) -> tuple:
+  """Play one batch of games in a worker, returns (worker pid, SimulationStats, seconds)."""
+  start = time.perf_counter()
+  code_maker = _worker_state["code_maker"]
+  code_maker.rng = random.Random(seed)
+  stats = run_games(code_maker, _worker_state["code_breaker"], n_games, max_attempt)
+  return os.getpid(), stats, time.perf_counter() - start
+
+def run_parallel_simulation(n_games: int, code_length: int=4, code_range: int=8, max_attempt: int=10, breaker_factory=SolverCodeBreaker, master_seed: int=0, workers: int=None, batch_size: int=10000, cache_dir: str=None) -> ParallelResult:
+  """
+  Spread headless games across a process pool in fixed-size batches.
+
+  Each batch plays secrets from its own seed derived from master_seed, so merged statistics are
+  reproducible regardless of the number of workers or the order batches finish in.
+
+  Args:
+    n_games(int): Number of games to play.
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    max_attempt(int): Max attempts for the CodeBreaker to guess.
+    breaker_factory: Picklable callable taking (code_length, code_range), returns the CodeBreaker strategy.
+    master_seed(int): Seed every batch seed is derived from.
+    workers(int): Number of worker processes, defaults to the CPU count.
+    batch_size(int): Games played per task.
+    cache_dir(str): Directory of saved feedback tables shared with the workers.
+
+  Returns:
+    ParallelResult: Merged statistics and per-worker throughput.
+  """
+  #build the table file once up front, workers then memory-map it instead of receiving a pickled copy
+  get_feedback_table(code_length, code_range, cache_dir)
+  batch_sizes = [min(batch_size, n_games - start) for start in range(0, n_games, batch_size)]
+  seeds = batch_seeds(master_seed, len(batch_sizes))
+  stats = SimulationStats(max_attempt)
+  worker_stats = {}
+  start = time.perf_counter()
+  with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(code_length, code_range, breaker_factory, cache_dir)) as executor:
+    for pid, batch_stats, seconds in executor.map(_run_batch, batch_sizes, seeds, [max_attempt] * len(batch_sizes)):
+      stats.merge(batch_stats)
+      worker = worker_stats.setdefault(pid, {"games": 0, "batches": 0, "seconds": 0.0})
+      worker["games"] += batch_stats.games
+      worker["batches"] += 1
+      worker["seconds"] += seconds
+  for worker in worker_stats.values():
+    worker["games_per_second"] = worker["games"] / worker["seconds"] if worker["seconds"] else 0.0
+  return ParallelResult(stats, worker_stats, time.perf_counter() - start)
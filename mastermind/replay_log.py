@@ -0,0 +1,215 @@
+"""
+Append-only binary log of finished games, with bulk verification of every recorded Feedback.
+
+A log is a 16 byte header holding the rules, followed by fixed-size records of one game each:
+the secret, the number of moves, and every guess with its feedback index. Verify logs with:
+  python -m mastermind.replay_log games.log [more.log ...] [--exact]
+"""
+import argparse
+import os
+import sys
+import numpy as np
+from . import scoring
+from .code_entry import CodeEntry
+from .feedback import Feedback
+
+MAGIC = b"MMREPLAY"
+HEADER_DTYPE = np.dtype([("magic", "S8"), ("code_length", "<u2"), ("code_range", "<u2"), ("max_attempt", "<u2"), ("version", "<u2")])
+VERSION = 1
+#records buffered by a writer before they are written out
+WRITE_BUFFER_RECORDS = 1024
+#records scored together while verifying
+VERIFY_BATCH_RECORDS = 1 << 16
+
+def record_dtype(code_length: int, code_range: int, max_attempt: int) -> np.dtype:
+  """Returns the fixed-size record layout of one game under the rules, one byte per digit and per feedback when they fit."""
+  moves_type = "u1" if max_attempt <= 0xff else "<u2"
+  feedback_type = "u1" if scoring.feedback_index_count(code_length) <= 0x100 else "<u2"
+  return np.dtype([
+    ("secret", "u1", (code_length,)),
+    ("moves", moves_type),
+    ("guesses", "u1", (max_attempt, code_length)),
+    ("feedback", feedback_type, (max_attempt,))
+  ])
+
+def read_header(path: str) -> tuple:
+  """Returns (code_length, code_range, max_attempt) of a log, raises ValueError if the file is not a replay log."""
+  header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+  if len(header) == 0 or header["magic"][0] != MAGIC or header["version"][0] != VERSION:
+    raise ValueError(f"{path} is not a version {VERSION} replay log.")
+  return int(header["code_length"][0]), int(header["code_range"][0]), int(header["max_attempt"][0])
+
+class ReplayLogWriter:
+  """Appends finished games to a replay log, creating it with a header for the rules on first use."""
+  def __init__(self, path: str, code_length: int, code_range: int, max_attempt: int, buffer_records: int=WRITE_BUFFER_RECORDS):
+    self.path = path
+    self.code_length = code_length
+    self.code_range = code_range
+    self.max_attempt = max_attempt
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+      if read_header(path) != (code_length, code_range, max_attempt):
+        raise ValueError(f"{path} was logged with other rules than {code_length}x{code_range} in {max_attempt} attempts.")
+      header = None
+    else:
+      header = np.array([(MAGIC, code_length, code_range, max_attempt, VERSION)], dtype=HEADER_DTYPE)
+    self.file = open(path, "ab")
+    if header is not None:
+      self.file.write(header.tobytes())
+    self.buffer = np.zeros(buffer_records, dtype=record_dtype(code_length, code_range, max_attempt))
+    self.buffered = 0
+
+  def append(self, secret_code: CodeEntry, history: list) -> None:
+    """
+    Log one finished game.
+
+    Args:
+      secret_code(CodeEntry): Secret of the game.
+      history(list): (CodeEntry guess, Feedback) pairs in the order played.
+    """
+    if len(history) > self.max_attempt:
+      raise ValueError(f"Game has {len(history)} moves, more than the {self.max_attempt} attempts allowed.")
+    row = self.buffered
+    self.buffer["secret"][row] = scoring.encode_codes([secret_code], self.code_length)[0]
+    self.buffer["moves"][row] = len(history)
+    self.buffer["guesses"][row] = 0
+    self.buffer["guesses"][row, :len(history)] = scoring.encode_codes([guess for guess, _ in history], self.code_length)
+    self.buffer["feedback"][row] = 0
+    self.buffer["feedback"][row, :len(history)] = [feedback.id for _, feedback in history]
+    self.buffered += 1
+    if self.buffered == len(self.buffer):
+      self.flush()
+
+  def flush(self) -> None:
+    """Write every buffered game to the file."""
+    self.file.write(self.buffer[:self.buffered].tobytes())
+    self.file.flush()
+    self.buffered = 0
+
+  def close(self) -> None:
+    """Flush and close the file."""
+    self.flush()
+    self.file.close()
+
+  def __enter__(self) -> "ReplayLogWriter":
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.close()
+
+class ReplayLog:
+  """Memory-mapped read access to the records of a replay log, a partly written last record is ignored."""
+  def __init__(self, path: str):
+    self.path = path
+    self.code_length, self.code_range, self.max_attempt = read_header(path)
+    dtype = record_dtype(self.code_length, self.code_range, self.max_attempt)
+    count = (os.path.getsize(path) - HEADER_DTYPE.itemsize) // dtype.itemsize
+    if count > 0:
+      self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_DTYPE.itemsize, shape=(count,))
+    else:
+      self.records = np.zeros(0, dtype=dtype)
+
+  def __len__(self) -> int:
+    return len(self.records)
+
+  def games(self):
+    """
+    Iterate over the logged games.
+
+    Yields:
+      tuple: (secret CodeEntry, list of (CodeEntry guess, Feedback) pairs).
+    """
+    for record in self.records:
+      moves = min(int(record["moves"]), self.max_attempt)
+      guesses = scoring.decode_codes(record["guesses"][:moves]) if moves else []
+      history = [(CodeEntry(guess, self.code_length, self.code_range), Feedback.from_id(index, self.code_length))
+                 for guess, index in zip(guesses, record["feedback"][:moves])]
+      yield CodeEntry(scoring.decode_codes(record["secret"])[0], self.code_length, self.code_range), history
+
+class ReplayReport:
+  """Result of verifying a replay log."""
+  def __init__(self, games: int=0, moves: int=0, mismatches: list=None):
+    self.games = games
+    self.moves = moves
+    self.mismatches = mismatches or [] # List[Tuple(game number, move number)], move -1 for an impossible move count
+
+  @property
+  def ok(self) -> bool:
+    """Returns True if every recorded Feedback was reproduced."""
+    return not self.mismatches
+
+  def to_dict(self) -> dict:
+    """Returns plain dictionary of the report."""
+    return {"games": self.games, "moves": self.moves, "mismatches": len(self.mismatches), "ok": self.ok}
+
+def verify_replay_log(path: str, exact: bool=False, batch_size: int=VERIFY_BATCH_RECORDS) -> ReplayReport:
+  """
+  Replay every logged move and check its recorded Feedback.
+
+  Args:
+    path(str): Replay log to verify.
+    exact(bool): Replay each move through CodeEntry.compare_with instead of vectorized batches, far slower.
+    batch_size(int): Records scored together in vectorized mode.
+
+  Returns:
+    ReplayReport: Counts of games and moves checked, and every move whose Feedback did not match.
+  """
+  replay_log = ReplayLog(path)
+  report = ReplayReport(games=len(replay_log))
+  code_length, code_range, max_attempt = replay_log.code_length, replay_log.code_range, replay_log.max_attempt
+  if exact:
+    for game_number, record in enumerate(replay_log.records):
+      moves = int(record["moves"])
+      if moves > max_attempt:
+        report.mismatches.append((game_number, -1))
+        moves = max_attempt
+      #digits outside the code range cannot come from a valid game, and cannot be decoded
+      secret_valid = bool((record["secret"] < code_range).all())
+      if secret_valid:
+        secret_code = CodeEntry(scoring.decode_codes(record["secret"])[0], code_length, code_range)
+      for move in range(moves):
+        guess = record["guesses"][move]
+        if not secret_valid or (guess >= code_range).any():
+          report.mismatches.append((game_number, move))
+          continue
+        guess_code = CodeEntry(scoring.decode_codes(guess)[0], code_length, code_range)
+        if secret_code.compare_with(guess_code) is not Feedback.from_id(record["feedback"][move], code_length):
+          report.mismatches.append((game_number, move))
+      report.moves += moves
+    return report
+
+  for start in range(0, len(replay_log), batch_size):
+    batch = replay_log.records[start:start + batch_size]
+    moves = batch["moves"].astype(np.intp)
+    report.mismatches.extend((start + int(game), -1) for game in np.flatnonzero(moves > max_attempt))
+    played = np.arange(max_attempt) < moves[:, None]
+    games, move_numbers = np.nonzero(played)
+    #row order of the played moves matches repeating each secret once per move
+    secrets = np.repeat(batch["secret"], np.minimum(moves, max_attempt), axis=0)
+    guesses = batch["guesses"][played]
+    #digits outside the code range cannot come from a valid game, they are mismatches and are never scored
+    wrong = (guesses >= code_range).any(axis=1) | (secrets >= code_range).any(axis=1)
+    in_range = ~wrong
+    correct_number, correct_location = scoring.score_pairs(guesses[in_range].astype(scoring.CODE_DTYPE), secrets[in_range].astype(scoring.CODE_DTYPE), code_range)
+    wrong[in_range] = scoring.feedback_index(correct_number, correct_location, code_length) != batch["feedback"][played][in_range]
+    report.mismatches.extend((start + int(game), int(move)) for game, move in zip(games[wrong], move_numbers[wrong]))
+    report.moves += len(guesses)
+  report.mismatches.sort()
+  return report
+
+def main(argv: list=None) -> int:
+  """Verify replay logs, returns exit code 1 if any recorded Feedback did not match."""
+  parser = argparse.ArgumentParser(description="Verify every Feedback recorded in replay logs.")
+  parser.add_argument("paths", nargs="+")
+  parser.add_argument("--exact", action="store_true", help="replay through CodeEntry.compare_with instead of vectorized batches")
+  args = parser.parse_args(argv)
+  failed = False
+  for path in args.paths:
+    report = verify_replay_log(path, args.exact)
+    failed |= not report.ok
+    print(f"{path}: {report.games} games, {report.moves} moves, {len(report.mismatches)} mismatches")
+    for game_number, move in report.mismatches[:10]:
+      print(f"  game {game_number}, move {move}")
+  return 1 if failed else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,164 @@
+import time
+import numpy as np
+from . import scoring
+from .code_breaker import CodeBreaker
+from .code_entry import CodeEntry
+from .feedback import Feedback
+
+#codes drawn or scanned per batch while looking for consistent candidates
+DRAW_BATCH_CODES = 4096
+#random batches in a row adding no new consistent code before switching to a directed search
+MAX_EMPTY_DRAWS = 4
+#largest code space scanned in order once random draws dry up, larger ones mutate the codes closest to consistent instead
+MAX_SCANNED_CODES = 1 << 24
+#codes closest to consistent kept as parents of mutated batches
+ELITE_SIZE = 64
+#mutated batches in a row adding no new consistent code before sampling stops with what was found
+MAX_STALE_MUTATIONS = 16
+#upper bound on guess x sample feedback cells scored per chunk
+SCORE_CHUNK_CELLS = 1 << 20
+
+class SamplingCodeBreaker(CodeBreaker):
+  """
+  Machine CodeBreaker player for code spaces too large for exhaustive search, picks the guess whose
+  feedback partitions a random sample of consistent candidates with the highest entropy.
+  """
+  def __init__(self, code_length: int, code_range: int, sample_size: int=500, guess_pool_size: int=500, time_budget: float=1.0, seed: int=None):
+    """
+    Args:
+      code_length(int): Number of digits in each code.
+      code_range(int): Number of possible digits.
+      sample_size(int): Max consistent candidates each guess is scored against.
+      guess_pool_size(int): Random codes scored as guesses besides the sampled candidates.
+      time_budget(float): Seconds per move split between sampling and scoring, None for no limit.
+      seed(int): Seed of the sampling, same seed and no time budget play the same guesses.
+    """
+    super().__init__(code_length, code_range)
+    self.sample_size = sample_size
+    self.guess_pool_size = guess_pool_size
+    self.time_budget = time_budget
+    self.rng = np.random.default_rng(seed)
+    self.total_codes = code_range ** code_length
+    self.feedback_count = scoring.feedback_index_count(code_length)
+    self.history = []  # List[Tuple(guess digit array, feedback index, correct_number, correct_location)]
+
+  def make_guess(self) -> CodeEntry:
+    """Pick the highest entropy guess within the budget, returns CodeEntry object."""
+    if self.turn == 1:
+      self.history = []
+    deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+    sample = self.sample_candidates(deadline)
+    if len(sample) <= 2:
+      guess = sample[0]
+    else:
+      guess = self.choose_guess(sample, deadline)
+    return CodeEntry(scoring.decode_codes(guess)[0], self.code_length, self.code_range)
+
+  def receive_feedback(self, guess_code: CodeEntry, feedback: Feedback) -> None:
+    """Record feedback of the guess, later samples only keep codes consistent with it."""
+    guess = scoring.encode_codes([guess_code.sequence], self.code_length)[0]
+    self.history.append((guess, feedback.id, feedback.correct_number, feedback.correct_location))
+
+  def distances(self, codes: np.ndarray) -> np.ndarray:
+    """Returns how far each code's feedback to every recorded guess is from the feedback received, 0 for consistent codes."""
+    distance = np.zeros(len(codes), dtype=np.int32)
+    for guess, _, expected_number, expected_location in self.history:
+      correct_number, correct_location = scoring.score_batch(guess, codes, self.code_range)
+      distance += np.abs(correct_number - expected_number) + np.abs(correct_location - expected_location)
+    return distance
+
+  def random_codes(self, count: int) -> np.ndarray:
+    """Returns digit array of count uniformly random codes."""
+    return self.rng.integers(0, self.code_range, size=(count, self.code_length)).astype(scoring.CODE_DTYPE)
+
+  def scanned_codes(self, scan_offset: int) -> np.ndarray:
+    """Returns digit array of the next DRAW_BATCH_CODES codes from scan_offset on in index order, wrapping around."""
+    indices = (scan_offset + np.arange(min(DRAW_BATCH_CODES, self.total_codes), dtype=np.int64)) % self.total_codes
+    return scoring.codes_from_indices(indices, self.code_length, self.code_range)
+
+  def mutated_codes(self, elite: np.ndarray) -> np.ndarray:
+    """Returns digit array of DRAW_BATCH_CODES copies of elite codes, each with one or two digits redrawn."""
+    rows = np.arange(DRAW_BATCH_CODES)
+    codes = elite[self.rng.integers(len(elite), size=DRAW_BATCH_CODES)]
+    for mutations in range(2):
+      changed = rows if mutations == 0 else rows[self.rng.random(DRAW_BATCH_CODES) < 0.5]
+      codes[changed, self.rng.integers(self.code_length, size=len(changed))] = self.rng.integers(self.code_range, size=len(changed))
+    return codes
+
+  def sample_candidates(self, deadline: float) -> np.ndarray:
+    """
+    Collect up to sample_size distinct codes consistent with every feedback before the deadline.
+
+    Codes are drawn at random while that keeps finding new candidates. After that, small code spaces are
+    scanned in order from a random offset until every candidate is found, and large ones are searched by
+    mutating the codes closest to consistent, until MAX_STALE_MUTATIONS batches in a row add nothing new.
+    If the deadline passes or mutation stalls before any candidate is found, the closest code seen is
+    returned alone.
+
+    Returns:
+      np.ndarray: Digit array of the sampled codes.
+    """
+    found = np.empty((0, self.code_length), dtype=scoring.CODE_DTYPE)
+    elite = np.empty((0, self.code_length), dtype=scoring.CODE_DTYPE)
+    elite_distances = np.empty(0, dtype=np.int32)
+    scan_offset, scanned, empty_draws = None, 0, 0
+    if self.total_codes <= DRAW_BATCH_CODES * MAX_EMPTY_DRAWS:
+      scan_offset = int(self.rng.integers(self.total_codes))  #scanning everything is as cheap as the random draws
+    while len(found) < self.sample_size:
+      if scan_offset is not None:
+        codes = self.scanned_codes(scan_offset)
+      elif empty_draws >= MAX_EMPTY_DRAWS:
+        codes = self.mutated_codes(elite)
+      else:
+        codes = self.random_codes(DRAW_BATCH_CODES)
+      distances = self.distances(codes)
+      found_before = len(found)
+      found = np.unique(np.concatenate((found, codes[distances == 0])), axis=0)
+      if scan_offset is not None:
+        scan_offset += DRAW_BATCH_CODES
+        scanned += DRAW_BATCH_CODES
+        if scanned >= self.total_codes:
+          break
+      else:
+        empty_draws = 0 if len(found) > found_before else empty_draws + 1
+        if empty_draws >= MAX_EMPTY_DRAWS + MAX_STALE_MUTATIONS:
+          break  #fewer than sample_size candidates are left or they are out of reach, also without a deadline
+        if empty_draws >= MAX_EMPTY_DRAWS and self.total_codes <= MAX_SCANNED_CODES:
+          scan_offset = int(self.rng.integers(self.total_codes))
+        #closest distinct codes so far, consistent ones included so mutations explore around them
+        elite, first = np.unique(np.concatenate((elite, codes)), axis=0, return_index=True)
+        elite_distances = np.concatenate((elite_distances, distances))[first]
+        closest = np.argsort(elite_distances, kind="stable")[:ELITE_SIZE]
+        elite, elite_distances = elite[closest], elite_distances[closest]
+      if deadline is not None and time.perf_counter() > deadline:
+        break
+    if len(found) == 0:
+      if scanned >= self.total_codes:
+        raise ValueError("No code is consistent with the feedback received.")
+      return elite[:1]
+    return self.rng.permutation(found)[:self.sample_size]
+
+  def choose_guess(self, sample: np.ndarray, deadline: float) -> np.ndarray:
+    """
+    Score the sampled candidates and guess_pool_size random codes by the entropy of the feedback partition
+    they split the sample into, scoring stops at the deadline once the first chunk is done.
+
+    Returns:
+      np.ndarray: Digit array of the guess, ties prefer sampled candidates.
+    """
+    random_guesses = self.rng.integers(0, self.code_range, size=(self.guess_pool_size, self.code_length)).astype(scoring.CODE_DTYPE)
+    guesses = np.concatenate((sample, random_guesses))
+    entropy = np.full(len(guesses), -1.0)
+    chunk = max(1, SCORE_CHUNK_CELLS // len(sample))
+    for start in range(0, len(guesses), chunk):
+      correct_number, correct_location = scoring.score_matrix(guesses[start:start + chunk], sample, self.code_range)
+      rows = scoring.feedback_index(correct_number, correct_location, self.code_length)
+      #offset each row into its own block of feedback counters so one bincount partitions every guess
+      keys = rows.astype(np.int64) + (np.arange(len(rows)) * self.feedback_count)[:, None]
+      counts = np.bincount(keys.ravel(), minlength=len(rows) * self.feedback_count).reshape(len(rows), self.feedback_count)
+      probabilities = counts / len(sample)
+      with np.errstate(divide="ignore", invalid="ignore"):
+        entropy[start:start + chunk] = -np.where(counts, probabilities * np.log2(probabilities), 0.0).sum(axis=1)
+      if deadline is not None and time.perf_counter() > deadline:
+        break
+    return guesses[int(np.argmax(entropy))]
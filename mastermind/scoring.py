@@ -0,0 +1,168 @@
+import numpy as np
+from .code_entry import SYMBOLS, pack_sequence
+
+#int8 digits keep code arrays small, every code_range Game accepts fits
+CODE_DTYPE = np.int8
+#upper bound on guess x candidate x code_range cells built per score_matrix chunk
+MATRIX_CHUNK_CELLS = 1 << 23
+#codes enumerated per chunk when streaming through a code space too large to materialize
+ENUMERATION_CHUNK_CODES = 1 << 16
+#ascii byte -> symbol value, -1 for bytes that are not symbols
+SYMBOL_LOOKUP = np.full(256, -1, dtype=CODE_DTYPE)
+SYMBOL_LOOKUP[np.frombuffer(SYMBOLS.encode("ascii"), dtype=np.uint8)] = np.arange(len(SYMBOLS))
+SYMBOL_BYTES = np.frombuffer(SYMBOLS.encode("ascii"), dtype=np.uint8)
+
+def encode_codes(sequences: list, code_length: int) -> np.ndarray:
+  """
+  Encode code sequences into an integer digit array.
+
+  Args:
+    sequences(list): Code sequences as strings or CodeEntry objects.
+    code_length(int): Number of digits in each code.
+
+  Returns:
+    np.ndarray: Array of shape (len(sequences), code_length) holding each digit.
+  """
+  sequences = [getattr(s, "sequence", s) for s in sequences]
+  if not sequences:
+    return np.empty((0, code_length), dtype=CODE_DTYPE)
+  raw = np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8)
+  return SYMBOL_LOOKUP[raw].reshape(len(sequences), code_length)
+
+def decode_codes(codes: np.ndarray) -> list:
+  """Decode an integer digit array back into a list of code sequence strings."""
+  codes = np.atleast_2d(codes)
+  raw = SYMBOL_BYTES[codes].tobytes().decode("ascii")
+  width = codes.shape[1]
+  return [raw[i:i + width] for i in range(0, len(raw), width)]
+
+#a packed code is its index in the enumerated code space
+code_to_index = pack_sequence
+
+def all_codes(code_length: int, code_range: int) -> np.ndarray:
+  """Enumerate every code of the given rules, ordered so row i is the code at code_to_index i."""
+  indices = np.arange(code_range ** code_length, dtype=np.int64)
+  return codes_from_indices(indices, code_length, code_range)
+
+def iter_code_chunks(code_length: int, code_range: int, chunk_size: int=ENUMERATION_CHUNK_CODES):
+  """
+  Lazily enumerate the code space in fixed-size chunks, memory stays bounded by chunk_size.
+
+  Yields:
+    tuple: (code space indexes of the chunk, digit array of the chunk's codes).
+  """
+  total = code_range ** code_length
+  for start in range(0, total, chunk_size):
+    indices = np.arange(start, min(start + chunk_size, total), dtype=np.int64)
+    yield indices, codes_from_indices(indices, code_length, code_range)
+
+def iter_consistent_indices(history: list, code_length: int, code_range: int, chunk_size: int=ENUMERATION_CHUNK_CODES):
+  """
+  Stream the code space, yielding only codes consistent with every (guess, feedback) pair.
+
+  Args:
+    history(list): (CodeEntry guess, Feedback) pairs played so far.
+    code_length(int): Number of symbols in each code.
+    code_range(int): Number of possible symbols.
+    chunk_size(int): Codes scored per chunk.
+
+  Yields:
+    np.ndarray: Code space indexes of the consistent codes in each chunk, possibly empty.
+  """
+  guesses = encode_codes([guess for guess, _ in history], code_length)
+  received = [feedback.id for _, feedback in history]
+  for indices, codes in iter_code_chunks(code_length, code_range, chunk_size):
+    keep = np.ones(len(indices), dtype=bool)
+    for guess, expected in zip(guesses, received):
+      correct_number, correct_location = score_batch(guess, codes[keep], code_range)
+      keep[keep] = feedback_index(correct_number, correct_location, code_length) == expected
+    yield indices[keep]
+
+def codes_from_indices(indices: np.ndarray, code_length: int, code_range: int) -> np.ndarray:
+  """Convert code space indices into an integer digit array."""
+  powers = code_range ** np.arange(code_length - 1, -1, -1, dtype=np.int64)
+  return ((np.asarray(indices, dtype=np.int64)[:, None] // powers) % code_range).astype(CODE_DTYPE)
+
+def color_counts(codes: np.ndarray, code_range: int) -> np.ndarray:
+  """Returns array of shape (n, code_range) counting how often each digit appears in each code."""
+  codes = np.atleast_2d(codes)
+  #offset each row into its own block of code_range counters so one bincount counts every code
+  keys = codes.astype(np.intp) + (np.arange(len(codes)) * code_range)[:, None]
+  return np.bincount(keys.ravel(), minlength=len(codes) * code_range).reshape(len(codes), code_range).astype(np.int8)
+
+def feedback_index(correct_number, correct_location, code_length: int):
+  """Pack a (correct_number, correct_location) pair into one small integer, works on arrays too."""
+  if isinstance(correct_number, np.ndarray):
+    correct_number = correct_number.astype(np.int16)
+  return correct_number * (code_length + 1) + correct_location
+
+def feedback_from_index(index, code_length: int) -> tuple:
+  """Unpack a feedback index into its (correct_number, correct_location) pair."""
+  return divmod(index, code_length + 1)
+
+def feedback_index_count(code_length: int) -> int:
+  """Returns number of possible feedback indexes for the code length."""
+  return (code_length + 1) ** 2
+
+def score_batch(guess: np.ndarray, candidates: np.ndarray, code_range: int) -> tuple:
+  """
+  Score one guess against many candidate codes.
+
+  Args:
+    guess(np.ndarray): Digit array of shape (code_length,).
+    candidates(np.ndarray): Digit array of shape (n, code_length).
+    code_range(int): Number of possible digits.
+
+  Returns:
+    tuple: (correct_number, correct_location) arrays of shape (n,), matching CodeEntry.compare_with.
+  """
+  guess = np.asarray(guess, dtype=CODE_DTYPE)
+  candidates = np.atleast_2d(candidates)
+  correct_location = (candidates == guess).sum(axis=1, dtype=np.int8)
+  guess_counts = color_counts(guess, code_range)[0]
+  correct_number = np.minimum(color_counts(candidates, code_range), guess_counts).sum(axis=1, dtype=np.int8)
+  return correct_number, correct_location
+
+def score_matrix(guesses: np.ndarray, candidates: np.ndarray, code_range: int) -> tuple:
+  """
+  Score every guess against every candidate code.
+
+  Args:
+    guesses(np.ndarray): Digit array of shape (m, code_length).
+    candidates(np.ndarray): Digit array of shape (n, code_length).
+    code_range(int): Number of possible digits.
+
+  Returns:
+    tuple: (correct_number, correct_location) arrays of shape (m, n).
+  """
+  guesses = np.atleast_2d(guesses)
+  candidates = np.atleast_2d(candidates)
+  correct_number = np.empty((guesses.shape[0], candidates.shape[0]), dtype=np.int8)
+  correct_location = np.empty_like(correct_number)
+  guess_counts = color_counts(guesses, code_range)
+  candidate_counts = color_counts(candidates, code_range)
+  #chunk guesses so the broadcast intermediates stay bounded
+  chunk = max(1, MATRIX_CHUNK_CELLS // max(1, candidates.shape[0] * max(code_range, guesses.shape[1])))
+  for start in range(0, guesses.shape[0], chunk):
+    stop = start + chunk
+    correct_location[start:stop] = (guesses[start:stop, None, :] == candidates[None, :, :]).sum(axis=2, dtype=np.int8)
+    correct_number[start:stop] = np.minimum(guess_counts[start:stop, None, :], candidate_counts[None, :, :]).sum(axis=2, dtype=np.int8)
+  return correct_number, correct_location
+
+def score_pairs(guesses: np.ndarray, secrets: np.ndarray, code_range: int) -> tuple:
+  """
+  Score each guess against the secret in the same row.
+
+  Args:
+    guesses(np.ndarray): Digit array of shape (n, code_length).
+    secrets(np.ndarray): Digit array of shape (n, code_length).
+    code_range(int): Number of possible digits.
+
+  Returns:
+    tuple: (correct_number, correct_location) arrays of shape (n,), matching CodeEntry.compare_with.
+  """
+  guesses = np.atleast_2d(guesses)
+  secrets = np.atleast_2d(secrets)
+  correct_location = (guesses == secrets).sum(axis=1, dtype=np.int8)
+  correct_number = np.minimum(color_counts(guesses, code_range), color_counts(secrets, code_range)).sum(axis=1, dtype=np.int8)
+  return correct_number, correct_location
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import itertools
+import json
+from .code_entry import CodeEntry
+from .frontend import BufferedFrontend
+from .game import COMMAND_WORDS, Game
+
+#requests the server answers itself, on top of the Game's own command words
+SESSION_COMMANDS = {"new", "exit"}
+#pending connections queued by the OS, sized for bursts of players connecting at once
+LISTEN_BACKLOG = 1024
+
+class GameSession:
+  """One player's Game hosted by GameServer, answers one request line at a time."""
+  def __init__(self, session_id: int, game: Game):
+    self.session_id = session_id
+    self.game = game
+    self.closed = False
+    self.welcome = self.capture(self.start_game)
+
+  def start_game(self) -> None:
+    """Set up players and count the first game, as Game.run_one_game() would."""
+    self.game.start()
+    self.game.game_count += 1
+    self.game.frontend.show(f"Starting game #{self.game.game_count}.")
+
+  def new_game(self) -> None:
+    """Start the next game after the current one is over or quit."""
+    self.game.reset_game_state()
+    self.game.game_count += 1
+    self.game.frontend.show(f"Starting game #{self.game.game_count}.")
+
+  def capture(self, action, *args) -> str:
+    """Run a Game action, returns everything it showed along with its return value."""
+    result = action(*args)
+    if result:
+      self.game.frontend.show(result)
+    return self.game.frontend.drain()
+
+  def play_guess(self, guess_code: CodeEntry) -> None:
+    """Evaluate one valid guess, as Game.make_move() would, and record the game once it is over."""
+    self.game.current_guess = guess_code
+    self.game.current_feedback = self.game.request_code_maker_evalulation(guess_code)
+    self.game.update_game_state()
+    if self.game.is_over():
+      self.game.update_prev_match_history()
+      self.game.frontend.show(f"The secret code was {self.game.code_maker.secret_code.sequence}. Congratulations, {self.game.winner} won this round!")
+      self.game.frontend.show("Send 'new' to play again.")
+
+  def handle(self, line: str) -> str:
+    """Respond to one request line: a guess, a Game command, 'new' or 'exit'."""
+    request = line.strip()
+    command = request.lower()
+    game = self.game
+    if command == "exit":
+      self.closed = True
+      return "Goodbye!"
+    if command == "new" or (command == "reset" and not game.active_game):
+      if game.active_game:
+        return "Finish, 'reset' or 'quit' the current game before starting a new one."
+      return self.capture(self.new_game)
+    #command words are matched before code validation since letter symbols can spell them
+    guess_code = CodeEntry(request, game.code_length, game.code_range)
+    if command not in COMMAND_WORDS and command not in SESSION_COMMANDS and guess_code.is_valid():
+      if not game.active_game:
+        return "This game is over. Send 'new' to play again."
+      return self.capture(self.play_guess, guess_code)
+    if command == "quit" and not game.active_game:
+      return "There is no game to quit. Send 'new' to play again."
+    return self.capture(game.response_to_code_breaker_input, command)
+
+  def response(self, output: str) -> dict:
+    """Returns JSON-ready response carrying output and the game state the client needs."""
+    return {
+      "session": self.session_id,
+      "game": self.game.game_count,
+      "turn": self.game.turn,
+      "active": self.game.active_game,
+      "winner": self.game.winner,
+      "output": output
+    }
+
+class GameServer:
+  """Asyncio line protocol server, hosts one independent Game session per TCP connection."""
+  def __init__(self, host: str="127.0.0.1", port: int=0, code_length: int=4, code_range: int=8, max_attempt: int=10, idle_timeout: float=300, max_sessions: int=10000, code_pool: "SecretCodePool"=None):
+    self.host = host
+    self.port = port
+    self.code_length = code_length
+    self.code_range = code_range
+    self.max_attempt = max_attempt
+    self.idle_timeout = idle_timeout
+    self.max_sessions = max_sessions
+    self.code_pool = code_pool
+    self.sessions = {} #Dict{session id (int): GameSession}
+    self.evicted_count = 0
+    self.session_ids = itertools.count(1)
+    self.server = None
+
+  def new_game(self) -> Game:
+    """Returns Game for a new session, secrets come from the shared pool or the in-house generator, never a blocking request."""
+    return Game(self.code_length, self.code_range, self.max_attempt, code_pool=self.code_pool, offline=self.code_pool is None, frontend=BufferedFrontend())
+
+  async def start(self) -> None:
+    """Start listening, port is updated with the bound port."""
+    self.server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=LISTEN_BACKLOG)
+    self.port = self.server.sockets[0].getsockname()[1]
+
+  async def serve_forever(self) -> None:
+    """Start listening and serve until cancelled."""
+    await self.start()
+    async with self.server:
+      await self.server.serve_forever()
+
+  async def close(self) -> None:
+    """Stop listening and close the listening socket."""
+    if self.server:
+      self.server.close()
+      await self.server.wait_closed()
+
+  async def send(self, writer: asyncio.StreamWriter, message: dict) -> None:
+    """Write one JSON response line."""
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+  async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Host one session for the connection, evicting it once idle for idle_timeout seconds."""
+    if len(self.sessions) >= self.max_sessions:
+      await self.send(writer, {"error": "Server is full, try again later."})
+      writer.close()
+      return
+    session = GameSession(next(self.session_ids), self.new_game())
+    self.sessions[session.session_id] = session
+    try:
+      await self.send(writer, session.response(session.welcome))
+      while not session.closed:
+        try:
+          line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+          self.evicted_count += 1
+          await self.send(writer, {"session": session.session_id, "error": "Session closed after being idle."})
+          break
+        if not line:
+          break
+        await self.send(writer, session.response(session.handle(line.decode(errors="replace"))))
+    except ConnectionError:
+      pass  #client went away mid-response
+    finally:
+      del self.sessions[session.session_id]
+      writer.close()
+
+def main(argv: list=None) -> None:
+  """Entry point for hosting Mastermind games over TCP."""
+  parser = argparse.ArgumentParser(description="Host Mastermind games over a JSON line protocol.")
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=8765)
+  parser.add_argument("--idle-timeout", type=float, default=300)
+  parser.add_argument("--max-sessions", type=int, default=10000)
+  args = parser.parse_args(argv)
+  server = GameServer(args.host, args.port, idle_timeout=args.idle_timeout, max_sessions=args.max_sessions)
+  asyncio.run(server.serve_forever())
+
+if __name__ == "__main__":
+  main()
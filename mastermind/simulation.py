@@ -0,0 +1,100 @@
+import random
+from .code_maker import CodeMaker
+from .code_breaker import CodeBreaker
+from .code_entry import CodeEntry
+from .solver import SolverCodeBreaker
+
+class SimulationStats:
+  """Aggregate results of headless games, mergeable across batches."""
+  def __init__(self, max_attempt: int):
+    self.max_attempt = max_attempt
+    self.games = 0
+    self.wins = 0
+    self.total_turns = 0
+    self.max_turns = 0
+    self.histogram = {} #Dict{guesses to solve (int): games won (int)}
+
+  def record(self, turns: int, won: bool) -> None:
+    """Add the result of one game, a lost game used every turn."""
+    self.games += 1
+    self.total_turns += turns
+    self.max_turns = max(self.max_turns, turns)
+    if won:
+      self.wins += 1
+      self.histogram[turns] = self.histogram.get(turns, 0) + 1
+
+  def merge(self, other: "SimulationStats") -> None:
+    """Add the results of another SimulationStats into this one."""
+    self.games += other.games
+    self.wins += other.wins
+    self.total_turns += other.total_turns
+    self.max_turns = max(self.max_turns, other.max_turns)
+    for turns, count in other.histogram.items():
+      self.histogram[turns] = self.histogram.get(turns, 0) + count
+
+  @property
+  def win_rate(self) -> float:
+    """Returns fraction of games won by the CodeBreaker."""
+    return self.wins / self.games if self.games else 0.0
+
+  @property
+  def mean_turns(self) -> float:
+    """Returns mean number of turns played per game."""
+    return self.total_turns / self.games if self.games else 0.0
+
+  def to_dict(self) -> dict:
+    """Returns plain dictionary of the statistics, histogram ordered by guesses to solve."""
+    return {
+      "games": self.games,
+      "wins": self.wins,
+      "win_rate": self.win_rate,
+      "mean_turns": self.mean_turns,
+      "max_turns": self.max_turns,
+      "histogram": dict(sorted(self.histogram.items()))
+    }
+
+def play_headless_game(code_maker: CodeMaker, code_breaker: CodeBreaker, max_attempt: int) -> tuple:
+  """
+  Play one game between CodeMaker's current secret and a machine CodeBreaker, no terminal I/O.
+
+  Returns:
+    tuple: (turns played (int), True if CodeBreaker won).
+  """
+  for turn in range(1, max_attempt + 1):
+    code_breaker.turn = turn
+    guess_code = code_breaker.make_guess()
+    feedback = code_maker.evaluate_code(guess_code)
+    code_breaker.receive_feedback(guess_code, feedback)
+    if feedback.is_perfect_response():
+      return turn, True
+  return max_attempt, False
+
+def simulate_games(n_games: int, code_length: int=4, code_range: int=8, max_attempt: int=10, breaker_factory=SolverCodeBreaker, seed: int=None, code_breaker: CodeBreaker=None, cache_dir: str=None) -> SimulationStats:
+  """
+  Play many headless games with in-house generated secrets.
+
+  Args:
+    n_games(int): Number of games to play.
+    code_length(int): Number of digits in each code.
+    code_range(int): Number of possible digits.
+    max_attempt(int): Max attempts for the CodeBreaker to guess.
+    breaker_factory: Callable taking (code_length, code_range), returns the CodeBreaker strategy to play.
+    seed(int): Seed of the secret generator, same seed plays the same secrets.
+    code_breaker(CodeBreaker): Already built CodeBreaker to play instead of calling breaker_factory.
+    cache_dir(str): Directory of saved feedback tables, defaults to default_cache_dir().
+
+  Returns:
+    SimulationStats: Aggregate results of every game.
+  """
+  code_maker = CodeMaker(code_length, code_range, rng=random.Random(seed), auto_feedback_table=False)
+  code_maker.use_feedback_table(cache_dir)
+  code_breaker = code_breaker or breaker_factory(code_length, code_range)
+  return run_games(code_maker, code_breaker, n_games, max_attempt)
+
+def run_games(code_maker: CodeMaker, code_breaker: CodeBreaker, n_games: int, max_attempt: int) -> SimulationStats:
+  """Play n_games headless games, each against a new secret from CodeMaker's in-house generator."""
+  stats = SimulationStats(max_attempt)
+  for _ in range(n_games):
+    code_maker.secret_code = CodeEntry(code_maker.use_in_house_random_seq_gen(), code_maker.code_length, code_maker.code_range)
+    stats.record(*play_headless_game(code_maker, code_breaker, max_attempt))
+  return stats
@@ -0,0 +1,99 @@
+"""
+Snapshot and restore of a Game in play, so a session can be paused, moved to another process or recovered.
+
+A snapshot is a plain dictionary of the game's rules and state, dumps()/loads() turn it into compact JSON.
+Process-local resources (frontend, metrics, code pool, history store, replay log) are not part of it and are
+handed to restore_game() instead.
+"""
+import json
+from .code_entry import CodeEntry
+from .feedback import Feedback
+from .game import Game
+from .history_store import MemoryHistoryStore
+
+SNAPSHOT_VERSION = 1
+
+def encode_history(history: list) -> list:
+  """Returns [guess sequence, correct_number, correct_location] of each (CodeEntry, Feedback) pair."""
+  return [[guess.sequence, feedback.correct_number, feedback.correct_location] for guess, feedback in history]
+
+def decode_history(moves: list, code_length: int, code_range: int) -> list:
+  """Returns (CodeEntry, Feedback) pairs of moves from encode_history()."""
+  return [(CodeEntry(sequence, code_length, code_range), Feedback(correct_number, correct_location, code_length)) for sequence, correct_number, correct_location in moves]
+
+def snapshot_game(game: Game) -> dict:
+  """
+  Capture everything needed to resume a started Game.
+
+  Returns:
+    dict: JSON-safe snapshot, match history is included only when it is held in memory. Raises ValueError
+    if the game was not started, there is no secret code to save yet.
+  """
+  if game.code_maker is None or game.code_maker.secret_code is None:
+    raise ValueError("Game has not started, call start() before taking a snapshot.")
+  match_history = None
+  if isinstance(game.prev_match_history, MemoryHistoryStore):
+    match_history = [[game_number, winner, encode_history(history)] for game_number, (winner, history) in sorted(game.prev_match_history.items())]
+  return {
+    "version": SNAPSHOT_VERSION,
+    "rules": [game.code_length, game.code_range, game.max_attempt],
+    "options": {"offline": game.offline, "track_candidates": game.track_candidates, "hard_mode": game.hard_mode},
+    "secret": game.code_maker.secret_code.sequence,
+    "turn": game.turn,
+    "hint": game.hint,
+    "hidden_hints": sorted(game.hint_answer_dict),
+    "history": encode_history(game.current_game_history),
+    "active_game": game.active_game,
+    "winner": game.winner,
+    "quit_game": game.quit_game,
+    "game_count": game.game_count,
+    "match_history": match_history
+  }
+
+def restore_game(snapshot: dict, **resources) -> Game:
+  """
+  Rebuild a Game from snapshot_game() output, ready to continue with run() or make_move().
+
+  Args:
+    snapshot(dict): Snapshot of the game.
+    resources: Game keyword arguments for process-local resources, such as frontend, metrics or history_store.
+
+  Returns:
+    Game: Game in the same state as when the snapshot was taken, raises ValueError for unknown snapshot versions.
+  """
+  if snapshot.get("version") != SNAPSHOT_VERSION:
+    raise ValueError(f"Unsupported game snapshot version {snapshot.get('version')!r}.")
+  code_length, code_range, max_attempt = snapshot["rules"]
+  game = Game(code_length, code_range, max_attempt, **snapshot["options"], **resources)
+  game.create_players()
+  history = decode_history(snapshot["history"], code_length, code_range)
+  secret_code = CodeEntry(snapshot["secret"], code_length, code_range)
+  if game.hard_mode:
+    game.code_maker.resume(secret_code, history)
+  else:
+    game.code_maker.secret_code = secret_code
+  game.hint_answer_dict = {position: secret_code.sequence[position] for position in snapshot["hidden_hints"]}
+  game.hint = snapshot["hint"]
+  game.turn = snapshot["turn"]
+  game.code_breaker.turn = game.turn
+  game.current_game_history = history
+  game.current_guess, game.current_feedback = history[-1] if history else (None, None)
+  if game.candidate_index:
+    for guess_code, feedback in history:
+      game.candidate_index.apply(guess_code, feedback)
+  game.active_game = snapshot["active_game"]
+  game.winner = snapshot["winner"]
+  game.quit_game = snapshot["quit_game"]
+  game.game_count = snapshot["game_count"]
+  if snapshot["match_history"] is not None and "history_store" not in resources:
+    for game_number, winner, moves in snapshot["match_history"]:
+      game.prev_match_history.record_game(game_number, winner, decode_history(moves, code_length, code_range))
+  return game
+
+def dumps(game: Game) -> str:
+  """Returns snapshot of the game as compact JSON text."""
+  return json.dumps(snapshot_game(game), separators=(",", ":"))
+
+def loads(text: str, **resources) -> Game:
+  """Returns Game restored from dumps() text, resources as in restore_game()."""
+  return restore_game(json.loads(text), **resources)
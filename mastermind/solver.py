@@ -0,0 +1,120 @@
+import numpy as np
+from . import scoring
+from . import symmetry
+from .code_breaker import CodeBreaker
+from .code_entry import CodeEntry
+from .feedback import Feedback
+from .feedback_table import get_feedback_table
+from .opening_book import load_opening_book
+
+#upper bound on guess x candidate feedback cells gathered per partition counting chunk
+PARTITION_CHUNK_CELLS = 1 << 21
+
+class SolverCodeBreaker(CodeBreaker):
+  """Machine CodeBreaker player, guesses by Knuth's minimax over the codes still consistent with feedback."""
+  #name opening books of this strategy are saved under
+  strategy = "minimax"
+
+  def __init__(self, code_length: int, code_range: int, use_feedback_table: bool=True, cache_dir: str=None, use_opening_book: bool=True, use_symmetry: bool=True):
+    super().__init__(code_length, code_range)
+    self.use_symmetry = use_symmetry
+    self.cache_dir = cache_dir
+    self.use_opening_book = use_opening_book
+    self.opening_book = None
+    self.opening_book_loaded = False
+    self.codes = scoring.all_codes(code_length, code_range)
+    self.feedback_count = scoring.feedback_index_count(code_length)
+    self.feedback_table = get_feedback_table(code_length, code_range, cache_dir) if use_feedback_table else None
+    self.candidates = np.arange(len(self.codes))
+    self.history = ()  # Tuple[Tuple(guess index, feedback index)]
+    self.filtered_turns = 0  # number of history entries already applied to candidates
+    self.guess_cache = {}  # Dict{history: (guess index, guess sequence)}, strategy is deterministic so it is shared across games
+
+  def reset(self) -> None:
+    """Forget feedback from the previous game, every code is a candidate again."""
+    self.candidates = np.arange(len(self.codes))
+    self.history = ()
+    self.filtered_turns = 0
+
+  def make_guess(self) -> CodeEntry:
+    """Pick the minimax guess for the current candidates, returns CodeEntry object."""
+    if self.turn == 1:
+      self.reset()
+    cached_guess = self.guess_cache.get(self.history)
+    if cached_guess is None:
+      guess_index = self.book_guess()
+      if guess_index is None:
+        guess_index = self.choose_guess()
+      cached_guess = (guess_index, self.sequence_of(guess_index))
+      self.guess_cache[self.history] = cached_guess
+    return CodeEntry(cached_guess[1], self.code_length, self.code_range)
+
+  def book_guess(self) -> int:
+    """Returns opening book guess for the history, None once the game left the book or no book was built."""
+    if not self.use_opening_book or len(self.history) > 1:
+      return None
+    if not self.opening_book_loaded:
+      self.opening_book = load_opening_book(self.code_length, self.code_range, self.strategy, self.cache_dir)
+      self.opening_book_loaded = True
+    return self.opening_book.guess(self.history) if self.opening_book else None
+
+  def receive_feedback(self, guess_code: CodeEntry, feedback: Feedback) -> None:
+    """Record feedback of the guess, candidates are only filtered once a guess is not already cached."""
+    guess_index = scoring.code_to_index(guess_code.sequence, self.code_range)
+    self.history += ((guess_index, feedback.id),)
+
+  def update_candidates(self) -> None:
+    """Drop every candidate that would not have produced the recorded feedback for each guess."""
+    for guess_index, received in self.history[self.filtered_turns:]:
+      self.candidates = self.candidates[self.feedback_rows(np.array([guess_index]), self.candidates)[0] == received]
+    self.filtered_turns = len(self.history)
+
+  def sequence_of(self, code_index: int) -> str:
+    """Returns code sequence string at a code space index."""
+    return scoring.decode_codes(self.codes[code_index])[0]
+
+  def choose_guess(self) -> int:
+    """
+    Minimax guess selection: minimize the largest group of candidates that could share one feedback.
+
+    Returns:
+      int: Code space index of the guess, ties prefer candidates then the lowest index.
+    """
+    self.update_candidates()
+    if len(self.candidates) == 0:
+      raise ValueError("No code is consistent with the feedback received.")
+    if len(self.candidates) <= 2:
+      return int(self.candidates[0])
+    guesses = self.guess_representatives()
+    worst_case = self.worst_case_partition_sizes(guesses, self.candidates)
+    best = guesses[worst_case == worst_case.min()]
+    best_candidates = np.intersect1d(best, self.candidates, assume_unique=True)
+    return int(best_candidates[0] if len(best_candidates) else best[0])
+
+  def guess_representatives(self) -> np.ndarray:
+    """Returns code space indexes worth scoring, one per class of guesses the history cannot tell apart when use_symmetry is set."""
+    if not self.use_symmetry:
+      return np.arange(len(self.codes))
+    history_codes = self.codes[[guess_index for guess_index, _ in self.history]].reshape(-1, self.code_length)
+    return symmetry.class_representatives(self.codes, history_codes, self.code_range)
+
+  def feedback_rows(self, guess_indices: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Returns feedback index array of shape (len(guess_indices), len(candidates))."""
+    if self.feedback_table is not None:
+      if len(candidates) == len(self.codes):
+        return np.asarray(self.feedback_table.table[guess_indices])
+      return self.feedback_table.table[np.ix_(guess_indices, candidates)]
+    correct_number, correct_location = scoring.score_matrix(self.codes[guess_indices], self.codes[candidates], self.code_range)
+    return scoring.feedback_index(correct_number, correct_location, self.code_length)
+
+  def worst_case_partition_sizes(self, guess_indices: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Returns, for each guess, the size of the largest group of candidates sharing one feedback."""
+    worst_case = np.empty(len(guess_indices), dtype=np.int64)
+    chunk = max(1, PARTITION_CHUNK_CELLS // len(candidates))
+    for start in range(0, len(guess_indices), chunk):
+      rows = self.feedback_rows(guess_indices[start:start + chunk], candidates)
+      #offset each row into its own block of feedback counters so one bincount partitions every guess
+      keys = rows.astype(np.int64) + (np.arange(len(rows)) * self.feedback_count)[:, None]
+      counts = np.bincount(keys.ravel(), minlength=len(rows) * self.feedback_count)
+      worst_case[start:start + chunk] = counts.reshape(len(rows), self.feedback_count).max(axis=1)
+    return worst_case
@@ -0,0 +1,88 @@
+"""
+Symmetry reduction of the guess space.
+
+A position permutation together with a color permutation maps every guess/secret pair to a pair with
+the same Feedback. The ones that leave every guess already played unchanged also map the consistent
+candidates onto themselves, so every guess in one of their equivalence classes scores the same and
+only one representative per class needs scoring.
+"""
+from itertools import permutations
+import numpy as np
+from . import scoring
+
+def stabilizer(history_codes: np.ndarray, code_length: int, code_range: int) -> tuple:
+  """
+  Find the position permutations that, with a matching permutation of the colors played, fix every played guess.
+
+  Args:
+    history_codes(np.ndarray): Integer digit array of the guesses played, shape (turns, code_length).
+
+  Returns:
+    tuple: (position permutations of shape (n, code_length), color maps of shape (n, code_range)), a code's
+    image is color_map[code[position_permutation]] and colors never played map to themselves.
+  """
+  positions = np.array(list(permutations(range(code_length))), dtype=np.intp)
+  rows = np.arange(len(positions))
+  color_map = np.tile(np.arange(code_range, dtype=scoring.CODE_DTYPE), (len(positions), 1))
+  mapped = np.zeros((len(positions), code_range), dtype=bool)
+  inverse = np.full((len(positions), code_range), -1, dtype=np.int16)
+  valid = np.ones(len(positions), dtype=bool)
+  for history_code in history_codes:
+    sources = history_code[positions]
+    for target_position, target in enumerate(history_code):
+      source = sources[:, target_position]
+      #color map must stay a function and one-to-one: a source color keeps its target and a target keeps its source
+      valid &= (~mapped[rows, source] | (color_map[rows, source] == target)) & ((inverse[:, target] < 0) | (inverse[:, target] == source))
+      color_map[rows, source] = target
+      mapped[rows, source] = True
+      inverse[:, target] = source
+  return positions[valid], color_map[valid]
+
+def free_colors(history_codes: np.ndarray, code_range: int) -> np.ndarray:
+  """Returns sorted colors that no played guess used, any permutation of them keeps the history unchanged."""
+  return np.setdiff1d(np.arange(code_range), history_codes)
+
+def relabel_free_colors(codes: np.ndarray, free: np.ndarray, code_range: int) -> np.ndarray:
+  """Rename each code's free colors to the smallest free colors in order of first appearance, the lowest index among its relabelings."""
+  codes = codes.copy()
+  is_free = np.zeros(code_range, dtype=bool)
+  is_free[free] = True
+  rows = np.arange(len(codes))
+  relabeled = np.full((len(codes), code_range), -1, dtype=np.int16)
+  next_free = np.zeros(len(codes), dtype=np.intp)
+  for position in range(codes.shape[1]):
+    colors = codes[:, position]
+    free_rows = rows[is_free[colors]]
+    first_seen = free_rows[relabeled[free_rows, colors[free_rows]] < 0]
+    relabeled[first_seen, colors[first_seen]] = free[next_free[first_seen]]
+    next_free[first_seen] += 1
+    codes[free_rows, position] = relabeled[free_rows, colors[free_rows]]
+  return codes
+
+def code_indices(codes: np.ndarray, code_range: int) -> np.ndarray:
+  """Returns code space index of each row of an integer digit array."""
+  powers = code_range ** np.arange(codes.shape[1] - 1, -1, -1, dtype=np.int64)
+  return codes.astype(np.int64) @ powers
+
+def class_representatives(codes: np.ndarray, history_codes: np.ndarray, code_range: int) -> np.ndarray:
+  """
+  Split the code space into classes of guesses equivalent under the symmetries of the history.
+
+  Args:
+    codes(np.ndarray): Integer digit array of every code, in code space index order.
+    history_codes(np.ndarray): Integer digit array of the guesses played.
+    code_range(int): Number of possible digits.
+
+  Returns:
+    np.ndarray: Sorted code space indexes of the lowest index code in each class.
+  """
+  free = free_colors(history_codes, code_range)
+  #lowest index of each code's class under free color permutations alone
+  free_representative = code_indices(relabel_free_colors(codes, free, code_range), code_range)
+  representatives = np.unique(free_representative)
+  lowest = representatives.copy()
+  representative_codes = codes[representatives]
+  for positions, color_map in zip(*stabilizer(history_codes, codes.shape[1], code_range)):
+    images = code_indices(color_map[representative_codes[:, positions]], code_range)
+    np.minimum(lowest, free_representative[images], out=lowest)
+  return np.unique(lowest)
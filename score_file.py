@@ -0,0 +1,5 @@
+import sys
+from mastermind.bulk_eval import main
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,38 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+
+class FakeRandomOrgHandler(BaseHTTPRequestHandler):
+  """Serves random.org style plain integer responses, counting 0..max in a cycle."""
+  def do_GET(self):
+    self.server.requests_seen += 1
+    threading.Event().wait(self.server.delay)
+    if self.server.fail:
+      self.send_response(503)
+      self.end_headers()
+      return
+    query = parse_qs(urlparse(self.path).query)
+    count, top = int(query["num"][0]), int(query["max"][0])
+    body = "\n".join(str(i % (top + 1)) for i in range(count)).encode()
+    self.send_response(200)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+@pytest.fixture
+def fake_server():
+  """Local random.org stand-in, yields its server object with the url attached."""
+  server = ThreadingHTTPServer(("127.0.0.1", 0), FakeRandomOrgHandler)
+  server.requests_seen = 0
+  server.fail = False
+  server.delay = 0
+  server.url = f"http://127.0.0.1:{server.server_address[1]}/integers/"
+  thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
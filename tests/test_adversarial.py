@@ -0,0 +1,65 @@
+import random
+from mastermind import CodeEntry
+from mastermind import Game
+from mastermind import SolverCodeBreaker
+from mastermind.adversarial import AdversarialCodeMaker
+from mastermind.code_entry import SYMBOLS
+from mastermind.frontend import BufferedFrontend
+from mastermind.simulation import play_headless_game
+
+def play_random_guesses(code_maker, moves, seed=0):
+  """Evaluate random guesses, returns the (guess, Feedback) pairs given."""
+  rng = random.Random(seed)
+  history = []
+  for _ in range(moves):
+    guess = CodeEntry("".join(SYMBOLS[rng.randrange(code_maker.code_range)] for _ in range(code_maker.code_length)), code_maker.code_length, code_maker.code_range)
+    history.append((guess, code_maker.evaluate_code(guess)))
+  return history
+
+def assert_secret_consistent(code_maker, history):
+  """Committed secret should give exactly the feedback handed out for every guess."""
+  for guess, feedback in history:
+    expected = code_maker.secret_code.compare_with(guess)
+    assert (expected.correct_number, expected.correct_location) == (feedback.correct_number, feedback.correct_location)
+
+def test_feedback_stays_consistent():
+  """Every feedback should be explained by the secret committed at the end."""
+  code_maker = AdversarialCodeMaker(4, 8, rng=random.Random(1))
+  code_maker.generate_code()
+  history = play_random_guesses(code_maker, 6)
+  assert_secret_consistent(code_maker, history)
+  assert len(code_maker.candidates) >= 1
+  assert code_maker.get_hint_position_dict() == {}
+
+def test_first_guess_never_wins():
+  """With more than one secret possible, a lucky first guess should never be accepted."""
+  for sequence in ["000", "012", "321"]:
+    code_maker = AdversarialCodeMaker(3, 4, rng=random.Random(0))
+    code_maker.generate_code()
+    assert not code_maker.evaluate_code(CodeEntry(sequence, 3, 4)).is_perfect_response()
+
+def test_solver_still_wins_against_hard_mode(tmp_path):
+  """A consistent CodeMaker can always be beaten, hard mode only makes the solver use its worst case."""
+  code_maker = AdversarialCodeMaker(4, 6, rng=random.Random(2))
+  solver = SolverCodeBreaker(4, 6, cache_dir=str(tmp_path))
+  for _ in range(3):
+    code_maker.generate_code()
+    turns, won = play_headless_game(code_maker, solver, 10)
+    assert won
+    assert turns >= 4
+
+def test_large_code_space_uses_a_sample():
+  """Code spaces too large to track should still get consistent feedback within the time budget."""
+  code_maker = AdversarialCodeMaker(8, 20, rng=random.Random(3), time_budget=0.05)
+  code_maker.generate_code()
+  assert not code_maker.exact
+  history = play_random_guesses(code_maker, 4)
+  assert_secret_consistent(code_maker, history)
+
+def test_game_hard_mode_turns_hints_off():
+  """Hard mode games should use the adversarial CodeMaker and refuse hints."""
+  game = Game(frontend=BufferedFrontend(), hard_mode=True)
+  game.start()
+  assert isinstance(game.code_maker, AdversarialCodeMaker)
+  assert "hard mode" in game.response_to_code_breaker_input("hint")
+  assert game.hint == "xxxx"
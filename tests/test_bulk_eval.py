@@ -0,0 +1,70 @@
+import io
+import random
+import pytest
+from mastermind import CodeEntry
+from mastermind.bulk_eval import iter_chunks, main, score_chunk, score_files
+from mastermind.code_entry import SYMBOLS
+
+def random_pairs(count, code_length=4, code_range=8, seed=0):
+  """Returns count (secret, guess) sequence pairs of random codes."""
+  rng = random.Random(seed)
+  code = lambda: "".join(rng.choice(SYMBOLS[:code_range]) for _ in range(code_length))
+  return [(code(), code()) for _ in range(count)]
+
+def expected_line(secret, guess, code_length=4, code_range=8, text=False):
+  """Returns output line of one pair through CodeEntry.compare_with."""
+  feedback = CodeEntry(secret, code_length, code_range).compare_with(CodeEntry(guess, code_length, code_range))
+  return feedback.to_string() if text else f"{feedback.correct_number} {feedback.correct_location}"
+
+@pytest.mark.parametrize("code_length, code_range", [(4, 8), (1, 1), (10, 36)])
+def test_score_chunk_matches_compare_with(code_length, code_range):
+  """Every valid line should score as CodeEntry.compare_with does."""
+  pairs = random_pairs(500, code_length, code_range)
+  data = "".join(f"{secret} {guess}\n" for secret, guess in pairs).encode("ascii")
+  for text in (False, True):
+    output, lines, invalid = score_chunk(data, code_length, code_range, text)
+    assert lines == len(pairs)
+    assert len(invalid) == 0
+    assert output.decode("ascii").splitlines() == [expected_line(secret, guess, code_length, code_range, text) for secret, guess in pairs]
+
+def test_invalid_lines_and_line_ends():
+  """Malformed lines should be marked invalid in place, windows line ends and a missing last newline are accepted."""
+  data = b"1234 4321\r\n1234,9999\n\n12345 4321\n1234\t123a\n1234  4321\n1234\t1234"
+  output, lines, invalid = score_chunk(data, 4, 8)
+  assert output == b"4 0\ninvalid\ninvalid\ninvalid\ninvalid\ninvalid\n4 4\n"
+  assert lines == 7
+  assert list(invalid) == [1, 2, 3, 4, 5]
+
+def test_chunks_end_at_line_ends():
+  """Chunks should hold whole lines whatever the chunk size."""
+  data = b"".join(f"{secret} {guess}\n".encode("ascii") for secret, guess in random_pairs(100)) + b"0000 0000"
+  for chunk_bytes in (1, 7, 64, 1 << 20):
+    chunks = list(iter_chunks(io.BytesIO(data), chunk_bytes))
+    assert b"".join(chunks) == data
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_score_files_in_order(tmp_path, workers):
+  """Output should follow input order across files and small chunks, invalid lines reported by file and line."""
+  pairs = random_pairs(3000)
+  paths = []
+  for number, part in enumerate((pairs[:1000], pairs[1000:])):
+    path = tmp_path / f"pairs{number}.txt"
+    path.write_text("".join(f"{secret} {guess}\n" for secret, guess in part) + ("bad line\n" if number else ""))
+    paths.append(str(path))
+  output = io.BytesIO()
+  report = score_files(paths, output, 4, 8, workers=workers, chunk_bytes=1000)
+  assert output.getvalue().decode("ascii").splitlines() == [expected_line(secret, guess) for secret, guess in pairs] + ["invalid"]
+  assert report.to_dict() == {"lines": 3001, "invalid": 1, "ok": False}
+  assert report.invalid_lines == [(paths[1], 2001)]
+
+def test_main_writes_output_file(tmp_path, capsys):
+  """CLI should write the output file and return 0 only when every line is valid."""
+  source, target = tmp_path / "pairs.txt", tmp_path / "scores.txt"
+  source.write_text("1234 1243\n")
+  assert main(["4", "8", str(source), "--output", str(target)]) == 0
+  assert target.read_text() == "4 2\n"
+  source.write_text("1234 1249\n")
+  assert main(["4", "8", str(source), "-o", str(target), "--text"]) == 1
+  assert target.read_text() == "invalid\n"
+  assert f"{source}:1" in capsys.readouterr().err
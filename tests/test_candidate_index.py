@@ -0,0 +1,91 @@
+import pytest
+from mastermind import CodeEntry
+from mastermind import Feedback
+from mastermind import Game
+from mastermind import scoring
+from mastermind.candidate_index import CandidateIndex
+from mastermind.feedback_table import FeedbackTable
+from mastermind.frontend import BufferedFrontend
+
+def consistent_by_rescan(history, code_length, code_range):
+  """Reference: rescan every code with compare_with."""
+  consistent = []
+  for index, sequence in enumerate(scoring.decode_codes(scoring.all_codes(code_length, code_range))):
+    code = CodeEntry(sequence, code_length, code_range)
+    if all(guess.compare_with(code).correct_number == feedback.correct_number and guess.compare_with(code).correct_location == feedback.correct_location for guess, feedback in history):
+      consistent.append(index)
+  return consistent
+
+@pytest.mark.parametrize("use_table", [False, True])
+def test_apply_matches_rescan(use_table):
+  """Bitset after each applied pair should match a full rescan of the code space."""
+  feedback_table = FeedbackTable.build(3, 4) if use_table else None
+  index = CandidateIndex(3, 4, feedback_table)
+  secret = CodeEntry("132", 3, 4)
+  history = []
+  for sequence in ["001", "123", "230"]:
+    guess = CodeEntry(sequence, 3, 4)
+    feedback = secret.compare_with(guess)
+    index.apply(guess, feedback)
+    history.append((guess, feedback))
+    assert list(index.candidates()) == consistent_by_rescan(history, 3, 4)
+    assert index.count() == len(index.candidates())
+  assert secret in index
+
+def test_undo_and_reset():
+  """Undo should restore the previous bitset, reset should restore every code without rebuilding masks."""
+  index = CandidateIndex(4, 8)
+  assert index.count() == 4096
+  index.apply(CodeEntry("0011", 4, 8), Feedback(1, 1, 4))
+  after_first = index.count()
+  index.apply(CodeEntry("2233", 4, 8), Feedback(0, 0, 4))
+  assert index.count() < after_first
+  index.undo()
+  assert index.count() == after_first
+  cached_masks = dict(index.masks)
+  index.reset()
+  assert index.count() == 4096
+  assert index.masks.keys() == cached_masks.keys()
+
+def test_mask_cache_is_bounded_by_bytes(monkeypatch):
+  """Cached guess masks should be dropped oldest first once they would exceed the byte budget."""
+  index = CandidateIndex(4, 8)
+  one_guess = index.guess_masks(0).nbytes
+  monkeypatch.setattr("mastermind.candidate_index.MAX_CACHED_MASK_BYTES", 2 * one_guess)
+  for guess_index in range(1, 4):
+    index.guess_masks(guess_index)
+  assert list(index.masks) == [2, 3]
+  assert index.cached_bytes == 2 * one_guess
+
+def test_impossible_feedback_empties_index():
+  """Feedback no code could produce should leave no candidates."""
+  index = CandidateIndex(2, 3)
+  index.apply(CodeEntry("00", 2, 3), Feedback(2, 1, 2))
+  assert index.count() == 0
+  assert len(index.candidates()) == 0
+
+@pytest.mark.parametrize("track_candidates, expected", [
+  (True, "possible secret code"),
+  (False, "Tracking of possible secret codes is off for this game.")
+])
+def test_game_remaining_command(tmp_path, monkeypatch, track_candidates, expected):
+  """Game should update the index with each move and reset it with the game."""
+  monkeypatch.setenv("MASTERMIND_CACHE_DIR", str(tmp_path))
+  game = Game(offline=True, frontend=BufferedFrontend(), track_candidates=track_candidates)
+  game.start()
+  game.current_guess = CodeEntry("0123", 4, 8)
+  game.current_feedback = game.code_maker.evaluate_code(game.current_guess)
+  game.update_game_state()
+  assert expected in game.response_to_code_breaker_input("remaining")
+  if track_candidates:
+    assert game.code_maker.secret_code in game.candidate_index
+    assert game.candidate_index.count() < 4096
+    assert game.candidate_index.feedback_table is not None
+    game.reset_game_state()
+    assert game.candidate_index.count() == 4096
+
+def test_game_rejects_tracking_large_code_spaces():
+  """Tracking should be refused up front for code spaces too large for the bitset and its masks."""
+  with pytest.raises(ValueError, match="track_candidates"):
+    Game(8, 36, offline=True, frontend=BufferedFrontend(), track_candidates=True)
+  assert Game(8, 36, offline=True, frontend=BufferedFrontend()).code_range == 36
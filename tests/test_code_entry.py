@@ -67,4 +67,52 @@ def test_compare_codes(seq1, seq2, length, range, loc_count, num_count, loc_coun
   feedback = code1.compare_with(code2)
   assert (feedback.correct_location == feedback.correct_number)== loc_count_same
   assert feedback.correct_location == loc_count
-  assert feedback.correct_number == num_count
\ No newline at end of file
+  assert feedback.correct_number == num_count
+
+@pytest.mark.parametrize("sequence, code_length, code_range, packed", [
+  ("0000", 4, 8, 0),
+  ("0017", 4, 8, 15),
+  ("7777", 4, 8, 4095),
+  ("101", 3, 2, 5),
+  ("000", 3, 1, 0)
+])
+def test_int_round_trip(sequence, code_length, code_range, packed):
+  """Packing into an int should read digits as a base code_range number and unpack back to the same code."""
+  code = CodeEntry(sequence, code_length, code_range)
+  assert code.to_int() == packed
+  assert CodeEntry.from_int(packed, code_length, code_range) == code
+
+@pytest.mark.parametrize("sequence", ["1234", "0000", "8"])
+def test_bytes_round_trip(sequence):
+  """Packing into bytes should keep one byte per digit."""
+  code = CodeEntry(sequence, len(sequence), 9)
+  assert len(code.to_bytes()) == len(sequence)
+  assert CodeEntry.from_bytes(code.to_bytes(), 9) == code
+
+def test_code_entry_is_compact_and_hashable():
+  """CodeEntry should not carry a per-instance __dict__, and equal codes should hash alike."""
+  code = CodeEntry("1234", 4, 8)
+  assert not hasattr(code, "__dict__")
+  assert code == CodeEntry("1234", 4, 8)
+  assert code != CodeEntry("1234", 4, 9)
+  assert len({code, CodeEntry("1234", 4, 8), CodeEntry("4321", 4, 8)}) == 2
+
+@pytest.mark.parametrize("sequence, code_length, code_range, valid", [
+  ("ab09", 4, 12, True),    #letters a-b stand for 10-11
+  ("ab0c", 4, 12, False),   #c (12) is outside of range
+  ("AB09", 4, 12, False),   #symbols are lowercase
+  ("zz", 2, 36, True),
+  ("a", 1, 10, False)
+])
+def test_multi_symbol_code_validity(sequence, code_length, code_range, valid):
+  """Code ranges above 10 should use letters after the digits."""
+  assert CodeEntry(sequence, code_length, code_range).is_valid() == valid
+
+def test_multi_symbol_pack_and_compare():
+  """Letter symbols should pack, unpack and compare like any other value."""
+  code = CodeEntry("ba10", 4, 12)
+  assert code.to_int() == 11 * 12 ** 3 + 10 * 12 ** 2 + 12
+  assert CodeEntry.from_int(code.to_int(), 4, 12) == code
+  assert CodeEntry.from_bytes(code.to_bytes(), 12) == code
+  feedback = code.compare_with(CodeEntry("ab1a", 4, 12))
+  assert (feedback.correct_number, feedback.correct_location) == (3, 1)
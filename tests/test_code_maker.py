@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from mastermind import CodeMaker
 from mastermind import CodeEntry
@@ -46,4 +47,77 @@ def test_evaluate_code():
   sample_code = CodeEntry("1234", 4, 8)
   feedback = code_maker.evaluate_code(sample_code)
   assert isinstance(feedback, Feedback)
-  assert feedback.is_perfect_response()
\ No newline at end of file
+  assert feedback.is_perfect_response()
+
+#ASYNC TESTS against a local fake random.org server
+@pytest.mark.parametrize("fail, expected", [
+  (False, "0123"),
+  (True, None)    #falls back on in-house generator
+])
+def test_async_generate_code(fake_server, fail, expected):
+  """Async generation should take the API response, or fall back after retries without blocking."""
+  pytest.importorskip("aiohttp")
+  from mastermind.code_maker import close_async_session
+  fake_server.fail = fail
+  code_maker = CodeMaker(4, 8)
+  code_maker.api_base_url = fake_server.url
+  async def run():
+    await code_maker.async_generate_code(max_retries=2, delay=0)
+    await close_async_session()
+  asyncio.run(run())
+  assert code_maker.secret_code.is_valid()
+  assert fake_server.requests_seen == (2 if fail else 1)
+  if expected:
+    assert code_maker.secret_code.sequence == expected
+
+def test_async_generate_code_shares_session(fake_server):
+  """Concurrent games should share one pooled session."""
+  pytest.importorskip("aiohttp")
+  from mastermind.code_maker import close_async_session, get_async_session
+  code_makers = [CodeMaker(4, 8) for _ in range(20)]
+  for code_maker in code_makers:
+    code_maker.api_base_url = fake_server.url
+  async def run():
+    session = await get_async_session()
+    await asyncio.gather(*(code_maker.async_generate_code() for code_maker in code_makers))
+    assert await get_async_session() is session
+    await close_async_session()
+  asyncio.run(run())
+  assert all(code_maker.secret_code.sequence == "0123" for code_maker in code_makers)
+
+def test_async_generate_code_timeout_and_cancel(fake_server):
+  """Slow API should time out into the fallback, and cancelling should leave the secret unchanged."""
+  pytest.importorskip("aiohttp")
+  from mastermind.code_maker import close_async_session
+  fake_server.delay = 0.5
+  timed_out = CodeMaker(4, 8)
+  timed_out.api_base_url = fake_server.url
+  cancelled = CodeMaker(4, 8)
+  cancelled.api_base_url = fake_server.url
+  async def run():
+    await timed_out.async_generate_code(max_retries=1, timeout=0.05)
+    task = asyncio.create_task(cancelled.async_generate_code())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+      await task
+    await close_async_session()
+  asyncio.run(run())
+  assert timed_out.secret_code.is_valid()
+  assert cancelled.secret_code is None
+
+def test_offline_generate_code_skips_api(monkeypatch):
+  """Offline CodeMaker should never make a request."""
+  def fail(*args, **kwargs):
+    raise AssertionError("offline CodeMaker made a request")
+  monkeypatch.setattr("requests.get", fail)
+  code_maker = CodeMaker(4, 8, offline=True)
+  code_maker.generate_code()
+  assert code_maker.secret_code.is_valid()
+
+def test_large_range_generation():
+  """In-house generator and API responses should map values from 10 up onto letters."""
+  code_maker = CodeMaker(6, 12)
+  assert CodeEntry(code_maker.use_in_house_random_seq_gen(), 6, 12).is_valid()
+  code_maker.use_api_response("10\n11\n0\n9\n1\n10\n")
+  assert code_maker.secret_code.sequence == "ab091a"
@@ -0,0 +1,59 @@
+import pytest
+from mastermind import CodeMaker
+from mastermind.code_pool import SecretCodePool
+
+def test_refill_fetches_codes_in_one_request(fake_server):
+  """One bulk request should fill the whole pool with valid codes."""
+  pool = SecretCodePool(4, 8, pool_size=50, api_url=fake_server.url)
+  assert pool.refill() == 50
+  assert len(pool) == 50
+  assert fake_server.requests_seen == 1
+  assert pool.get_code() == "0123"
+  assert pool.get_code() == "4567"
+
+def test_get_code_refills_in_background_below_low_water(fake_server):
+  """Dropping under the low-water mark should start a background refill back to pool size."""
+  pool = SecretCodePool(3, 5, pool_size=10, low_water=5, api_url=fake_server.url)
+  pool.refill()
+  for _ in range(6):
+    assert pool.get_code() is not None
+  pool.wait_for_refill(5)
+  assert len(pool) == 10
+  assert fake_server.requests_seen == 2
+
+def test_empty_pool_returns_none_and_starts_refill(fake_server):
+  """Empty pool should never block, caller generates its own code while the pool refills."""
+  pool = SecretCodePool(4, 8, pool_size=5, api_url=fake_server.url)
+  assert pool.get_code() is None
+  pool.wait_for_refill(5)
+  assert len(pool) == 5
+
+def test_failed_refill_keeps_pool_empty(fake_server):
+  """Server errors should be counted instead of raised."""
+  fake_server.fail = True
+  pool = SecretCodePool(4, 8, api_url=fake_server.url)
+  assert pool.refill() == 0
+  assert pool.failed_refills == 1
+  assert len(pool) == 0
+
+@pytest.mark.parametrize("text", [
+  "1\n2\n3",      #not a whole number of codes
+  "1\n2\n3\n9",   #9 is outside of range
+  ""
+])
+def test_parse_codes_rejects_bad_responses(text):
+  """Malformed responses should not be added to the pool."""
+  with pytest.raises(ValueError):
+    SecretCodePool(4, 8).parse_codes(text)
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_code_maker_generates_from_pool(fake_server, fail):
+  """CodeMaker should take its secret from the pool, or the in-house generator when the pool is empty."""
+  fake_server.fail = fail
+  pool = SecretCodePool(4, 8, pool_size=10, api_url=fake_server.url)
+  pool.refill()
+  code_maker = CodeMaker(4, 8, code_pool=pool)
+  code_maker.generate_code()
+  pool.wait_for_refill(5)
+  assert code_maker.secret_code.is_valid()
+  assert (code_maker.secret_code.sequence == "0123") != fail
@@ -0,0 +1,68 @@
+import pytest
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import SolverCodeBreaker
+from mastermind import scoring
+from mastermind.decision_tree import DecisionTree, TreeCodeBreaker, load_tree_breaker, tree_breaker_factory
+from mastermind.simulation import play_headless_game, simulate_games
+
+@pytest.fixture
+def solver(tmp_path):
+  return SolverCodeBreaker(3, 4, cache_dir=str(tmp_path))
+
+def guesses_played(code_breaker, code_maker, max_attempt=10):
+  """Play one game, returns every guess sequence."""
+  guesses = []
+  for turn in range(1, max_attempt + 1):
+    code_breaker.turn = turn
+    guess = code_breaker.make_guess()
+    feedback = code_maker.evaluate_code(guess)
+    code_breaker.receive_feedback(guess, feedback)
+    guesses.append(guess.sequence)
+    if feedback.is_perfect_response():
+      break
+  return guesses
+
+def test_tree_plays_like_the_compiled_strategy(solver):
+  """Walking the tree should make the same guesses as the strategy, and report its depth and average exactly."""
+  decision_tree = DecisionTree.compile(solver)
+  tree_breaker = TreeCodeBreaker(decision_tree)
+  code_maker = CodeMaker(3, 4)
+  guess_counts = []
+  for secret in scoring.decode_codes(scoring.all_codes(3, 4)):
+    code_maker.secret_code = CodeEntry(secret, 3, 4)
+    guesses = guesses_played(tree_breaker, code_maker)
+    assert guesses == guesses_played(solver, code_maker)
+    assert guesses[-1] == secret
+    guess_counts.append(len(guesses))
+  assert decision_tree.depth == max(guess_counts)
+  assert decision_tree.average_guesses == pytest.approx(sum(guess_counts) / len(guess_counts))
+
+def test_tree_save_and_load(tmp_path, solver):
+  """Saved trees should load back identical, and refuse to play other rules."""
+  decision_tree = DecisionTree.compile(solver)
+  path = str(tmp_path / "tree.npz")
+  decision_tree.save(path)
+  loaded = DecisionTree.load(path)
+  assert (loaded.code_length, loaded.code_range, loaded.strategy) == (3, 4, "minimax")
+  assert (loaded.guesses == decision_tree.guesses).all()
+  assert (loaded.children == decision_tree.children).all()
+  with pytest.raises(ValueError):
+    load_tree_breaker(path, 4, 4)
+  stats = simulate_games(200, 3, 4, breaker_factory=tree_breaker_factory(path), seed=0, cache_dir=str(tmp_path))
+  assert stats.win_rate == 1.0
+  assert stats.max_turns <= decision_tree.depth
+
+def test_tree_depth_limit(tmp_path, solver):
+  """Secrets the strategy cannot solve within max depth should be lost, not crash the simulator."""
+  decision_tree = DecisionTree.compile(solver, max_depth=2)
+  assert decision_tree.depth <= 2
+  code_maker = CodeMaker(3, 4)
+  code_maker.secret_code = CodeEntry("321", 3, 4)
+  tree_breaker = TreeCodeBreaker(decision_tree)
+  assert play_headless_game(code_maker, tree_breaker, 2) == (2, False)
+  #past the tree the breaker falls back to codes consistent with the feedback, and still plays valid guesses
+  turns, won = play_headless_game(code_maker, tree_breaker, 10)
+  assert won and turns > 2
+  stats = simulate_games(200, 3, 4, max_attempt=2, code_breaker=tree_breaker, seed=0, cache_dir=str(tmp_path))
+  assert stats.games == 200 and stats.win_rate < 1.0
@@ -23,4 +23,35 @@ def test_feedback_is_perfect_response(correct_num, correct_loc, code_length, per
 def test_feedback_to_string(correct_num, correct_loc, code_length, feedback_string):
   """Feedback should be a formatted string."""
   feedback = Feedback(correct_num, correct_loc, code_length)
-  assert feedback.to_string() == feedback_string
\ No newline at end of file
+  assert feedback.to_string() == feedback_string
+
+def test_feedback_is_compact():
+  """Feedback should not carry a per-instance __dict__."""
+  assert not hasattr(Feedback(1, 1, 4), "__dict__")
+
+def test_feedback_is_interned():
+  """Equal Feedback should be one shared instance, also after pickling and when built from a comparison."""
+  import pickle
+  from mastermind import CodeEntry
+  feedback = Feedback(2, 1, 4)
+  assert Feedback(2, 1, 4) is feedback
+  assert pickle.loads(pickle.dumps(feedback)) is feedback
+  assert CodeEntry("1234", 4, 8).compare_with(CodeEntry("1520", 4, 8)) is feedback
+  assert Feedback(2, 1, 5) is not feedback
+  assert len({Feedback(2, 1, 4), feedback, Feedback(0, 0, 4)}) == 2
+
+def test_feedback_is_immutable():
+  """Shared Feedback should not be changed in place."""
+  with pytest.raises(AttributeError):
+    Feedback(1, 1, 4).correct_number = 2
+
+@pytest.mark.parametrize("code_length", [1, 4, 8])
+def test_feedback_id_matches_feedback_index(code_length):
+  """Feedback id should be the scoring feedback index, and from_id should give back the same Feedback."""
+  from mastermind import scoring
+  for correct_number in range(code_length + 1):
+    for correct_location in range(correct_number + 1):
+      feedback = Feedback(correct_number, correct_location, code_length)
+      assert feedback.id == scoring.feedback_index(correct_number, correct_location, code_length)
+      assert feedback.id < scoring.feedback_index_count(code_length)
+      assert Feedback.from_id(feedback.id, code_length) is feedback
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import scoring
+from mastermind.feedback_table import FeedbackTable, get_feedback_table, table_fits, table_path
+
+@pytest.mark.parametrize("code_length, code_range", [
+  (1, 1),
+  (2, 3),
+  (3, 4)
+])
+def test_build_matches_compare_with(code_length, code_range):
+  """Every table entry should match the feedback of CodeEntry.compare_with."""
+  feedback_table = FeedbackTable.build(code_length, code_range)
+  sequences = scoring.decode_codes(scoring.all_codes(code_length, code_range))
+  for secret in sequences:
+    for guess in sequences:
+      expected = CodeEntry(secret, code_length, code_range).compare_with(CodeEntry(guess, code_length, code_range))
+      feedback = feedback_table.lookup(secret, guess)
+      assert (feedback.correct_number, feedback.correct_location) == (expected.correct_number, expected.correct_location)
+
+@pytest.mark.parametrize("code_length, code_range, fits", [
+  (4, 8, True),
+  (6, 4, True),
+  (4, 9, False),
+  (6, 9, False)
+])
+def test_table_fits(code_length, code_range, fits):
+  """Only configurations up to the default 4x8 code space size should get a table."""
+  assert table_fits(code_length, code_range) == fits
+
+def test_get_feedback_table_saves_and_memory_maps(tmp_path):
+  """First call should save the table, later calls should memory-map the saved file."""
+  first = get_feedback_table(3, 4, str(tmp_path))
+  assert (tmp_path / "feedback_3x4.npy").exists()
+  second = get_feedback_table(3, 4, str(tmp_path))
+  assert isinstance(second.table, np.memmap)
+  assert np.array_equal(first.table, second.table)
+  assert table_path(3, 4, str(tmp_path)) == str(tmp_path / "feedback_3x4.npy")
+
+def test_get_feedback_table_too_large(tmp_path):
+  """Configurations too large for a table should fall back to None."""
+  assert get_feedback_table(6, 9, str(tmp_path)) is None
+  assert not list(tmp_path.iterdir())
+
+@pytest.mark.parametrize("secret, guess", [
+  ("123", "12"),
+  ("123", "-12"),
+  ("123", "129")
+])
+def test_lookup_rejects_codes_outside_rules(secret, guess):
+  """Codes that do not follow the table's rules should not be silently indexed."""
+  with pytest.raises(ValueError):
+    FeedbackTable.build(3, 4).lookup(secret, guess)
+
+@pytest.mark.parametrize("guess, expected", [
+  ("123", (3, 3)),
+  ("321", (3, 1)),
+  ("000", (0, 0)),
+  ("1234", (3, 3))  #outside of table rules, falls back on compare_with
+])
+def test_code_maker_evaluates_with_table(tmp_path, guess, expected):
+  """CodeMaker should score through the table once enabled."""
+  code_maker = CodeMaker(3, 4)
+  assert code_maker.use_feedback_table(str(tmp_path))
+  code_maker.secret_code = CodeEntry("123", 3, 4)
+  feedback = code_maker.evaluate_code(CodeEntry(guess, 3, 4))
+  assert (feedback.correct_number, feedback.correct_location) == expected
+
+@pytest.mark.parametrize("code_length, code_range, auto, uses_table", [
+  (3, 4, True, True),
+  (3, 4, False, False),
+  (8, 12, True, False)  #too large for a table, keeps comparing directly
+])
+def test_code_maker_uses_saved_table_from_construction(tmp_path, monkeypatch, code_length, code_range, auto, uses_table):
+  """CodeMaker should memory-map a saved table when constructed, but never build one while evaluating."""
+  monkeypatch.setenv("MASTERMIND_CACHE_DIR", str(tmp_path))
+  code_maker = CodeMaker(code_length, code_range, auto_feedback_table=auto)
+  code_maker.secret_code = CodeEntry("1" * code_length, code_length, code_range)
+  assert code_maker.evaluate_code(CodeEntry("1" * code_length, code_length, code_range)).is_perfect_response()
+  assert code_maker.feedback_table is None
+  assert not list(tmp_path.iterdir())
+  get_feedback_table(code_length, code_range)
+  code_maker = CodeMaker(code_length, code_range, auto_feedback_table=auto)
+  code_maker.secret_code = CodeEntry("1" * code_length, code_length, code_range)
+  assert code_maker.evaluate_code(CodeEntry("1" * code_length, code_length, code_range)).is_perfect_response()
+  assert (code_maker.feedback_table is not None) == uses_table
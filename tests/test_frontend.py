@@ -0,0 +1,66 @@
+import io
+import pytest
+from mastermind import CodeEntry
+from mastermind import Game
+from mastermind.frontend import ANSI_CLEAR, BufferedFrontend, Frontend, NullFrontend, TerminalFrontend
+
+def test_terminal_frontend_buffers_until_input(monkeypatch):
+  """Buffered output should only be written when input is requested."""
+  stream = io.StringIO()
+  frontend = TerminalFrontend(stream=stream)
+  monkeypatch.setattr("builtins.input", lambda _: "1234")
+  frontend.show("first")
+  frontend.clear()
+  assert stream.getvalue() == ""
+  assert frontend.ask("Input: ") == "1234"
+  assert stream.getvalue() == f"first\n{ANSI_CLEAR}"
+
+def test_unbuffered_terminal_frontend_writes_immediately():
+  """Unbuffered output should be written on every show."""
+  stream = io.StringIO()
+  TerminalFrontend(buffered=False, stream=stream).show("now")
+  assert stream.getvalue() == "now\n"
+
+def test_buffered_frontend_drain():
+  """Buffered frontend should hand every line shown since the last drain to its host."""
+  frontend = BufferedFrontend()
+  frontend.show("a")
+  frontend.show()
+  frontend.show("b")
+  assert frontend.drain() == "a\n\nb"
+  assert frontend.drain() == ""
+  frontend.inputs.append("0000")
+  assert frontend.ask("Input: ") == "0000"
+  assert frontend.ask("Input: ") == ""
+
+@pytest.mark.parametrize("command", ["clear", "reset", "quit"])
+def test_game_commands_never_spawn_a_shell(monkeypatch, command):
+  """Clearing the screen should go through the frontend instead of os.system."""
+  def fail(*args):
+    raise AssertionError("os.system was called")
+  monkeypatch.setattr("os.system", fail)
+  frontend = BufferedFrontend()
+  game = Game(offline=True, frontend=frontend)
+  game.start()
+  game.response_to_code_breaker_input(command)
+  assert "Welcome to Mastermind" in frontend.drain()
+
+def test_game_runs_with_null_frontend():
+  """Game logic should run without any terminal I/O."""
+  game = Game(offline=True, frontend=NullFrontend())
+  game.start()
+  game.current_guess = CodeEntry(game.code_maker.secret_code.sequence, 4, 8)
+  game.current_feedback = game.request_code_maker_evalulation(game.current_guess)
+  game.update_game_state()
+  assert game.is_over()
+  assert game.winner == "Code Breaker"
+  assert not game.ask_play_again()
+
+def test_incomplete_frontend_fails_on_creation():
+  """A Frontend missing one of its I/O methods should fail when created, not halfway through a game."""
+  class ShowOnlyFrontend(Frontend):
+    def show(self, text=""):
+      pass
+
+  with pytest.raises(TypeError):
+    ShowOnlyFrontend()
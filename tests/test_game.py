@@ -277,3 +277,32 @@ def test_response_to_different_code_breaker_commands_in_game(user_input, abbrevi
   game.code_maker.evalulate_code.return_value = mock_feedback
   game.make_move()
   assert abbreviated_response in game.response_to_code_breaker_input(user_input)
+
+@pytest.mark.parametrize("code_range, valid", [
+  (12, True),
+  (36, True),
+  (37, False)
+])
+def test_game_large_code_range(code_range, valid):
+  """Code ranges up to 36 symbols should be accepted."""
+  if valid:
+    assert Game(6, code_range).code_range == code_range
+  else:
+    with pytest.raises(ValueError, match="code_range must be at most 36."):
+      Game(6, code_range)
+
+@pytest.mark.parametrize("command", ["help", "hint", "quit", "rules"])
+def test_commands_spelled_with_code_symbols_are_not_guesses(command):
+  """With letters as code symbols, a command word should still run as a command and not use up a turn."""
+  from mastermind.frontend import BufferedFrontend
+  frontend = BufferedFrontend()
+  game = Game(len(command), 36, offline=True, frontend=frontend)
+  game.start()
+  frontend.inputs.extend([command, "0" * len(command)])
+  game.make_move()
+  if command == "quit":
+    assert game.quit_game
+    assert game.current_game_history == []
+  else:
+    assert [guess.sequence for guess, _ in game.current_game_history] == ["0" * len(command)]
+    assert game.turn == 2
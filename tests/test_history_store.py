@@ -0,0 +1,89 @@
+import pytest
+from mastermind import CodeEntry
+from mastermind import Feedback
+from mastermind import Game
+from mastermind.frontend import BufferedFrontend
+from mastermind.history_store import MemoryHistoryStore, SQLiteHistoryStore
+
+def sample_history():
+  return [
+    (CodeEntry("0011", 4, 8), Feedback(1, 0, 4)),
+    (CodeEntry("1234", 4, 8), Feedback(4, 4, 4))
+  ]
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+  """Every history backend should behave the same."""
+  if request.param == "memory":
+    yield MemoryHistoryStore()
+  else:
+    sqlite_store = SQLiteHistoryStore(str(tmp_path / "history.db"))
+    yield sqlite_store
+    sqlite_store.close()
+
+def test_record_and_look_up_game(store):
+  """Saved games should come back with the same winner, guesses and feedback."""
+  store.record_game(1, "Code Breaker", sample_history())
+  store.record_game(2, "Code Maker", [])
+  winner, history = store[1]
+  assert winner == "Code Breaker"
+  assert [(guess.sequence, feedback.to_string()) for guess, feedback in history] == [(guess.sequence, feedback.to_string()) for guess, feedback in sample_history()]
+  assert history[-1][1].is_perfect_response()
+  assert len(store) == 2
+  assert 2 in store and 3 not in store
+  assert list(store.keys()) == [1, 2]
+  assert store.summaries() == [(1, "Code Breaker"), (2, "Code Maker")]
+  assert store.count_wins("Code Maker") == 1
+  assert store.last_game_number() == 2
+
+def test_missing_game_raises_key_error(store):
+  with pytest.raises(KeyError):
+    store[5]
+
+def test_sqlite_store_persists(tmp_path):
+  """Games saved by one session should be served to the next."""
+  path = str(tmp_path / "history.db")
+  first = SQLiteHistoryStore(path)
+  first.record_game(1, "Code Breaker", sample_history())
+  first.close()
+  second = SQLiteHistoryStore(path)
+  assert second.summaries() == [(1, "Code Breaker")]
+  assert second[1][1][0][0].sequence == "0011"
+  second.close()
+
+def test_second_session_appends_games(tmp_path):
+  """A new Game on an existing database should number its games after the earlier session's."""
+  path = str(tmp_path / "history.db")
+  for session in range(2):
+    store = SQLiteHistoryStore(path)
+    frontend = BufferedFrontend()
+    game = Game(offline=True, frontend=frontend, history_store=store)
+    game.start()
+    frontend.inputs.append(game.code_maker.secret_code.sequence)
+    game.run_one_game()
+    game.update_prev_match_history()
+    assert game.game_count == session + 1
+    store.close()
+  store = SQLiteHistoryStore(path)
+  assert store.summaries() == [(1, "Code Breaker"), (2, "Code Breaker")]
+  assert store.last_game_number() == 2
+  store.close()
+
+def test_game_uses_history_store(tmp_path):
+  """previous N and the match summary should be served from the configured store."""
+  store = SQLiteHistoryStore(str(tmp_path / "history.db"))
+  game = Game(offline=True, frontend=BufferedFrontend(), history_store=store)
+  game.start()
+  game.game_count = 1
+  game.winner = "Code Breaker"
+  game.current_game_history = sample_history()
+  game.update_prev_match_history()
+  assert game.validate_previous_input_entry("previous 1") == 1
+  assert "Guess #2: 1234 - 4 correct numbers and 4 correct locations" in game.previous_game_look_up(1)
+  assert game.format_match_history() == "\nGame 1 Winner: Code Breaker\n"
+  store.close()
+
+def test_game_defaults_to_memory_store():
+  game = Game()
+  assert isinstance(game.prev_match_history, MemoryHistoryStore)
+  assert game.format_match_history() == "No games played.\n"
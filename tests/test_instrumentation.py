@@ -0,0 +1,71 @@
+import json
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import Game
+from mastermind.frontend import BufferedFrontend, NullFrontend
+from mastermind.instrumentation import LATENCY_BUCKETS, NULL_METRICS, LatencyHistogram, Metrics
+
+def test_latency_histogram_cumulative_buckets():
+  """Bucket counts should be cumulative and end with every observation."""
+  histogram = LatencyHistogram()
+  for seconds in (0.00005, 0.0002, 0.0002, 2, 100):
+    histogram.observe(seconds)
+  buckets = histogram.to_dict()["buckets"]
+  assert len(buckets) == len(LATENCY_BUCKETS)
+  assert buckets["0.0001"] == 1
+  assert buckets["0.0005"] == 3
+  assert buckets["5"] == 4
+  assert buckets["+Inf"] == 5
+  assert histogram.to_dict()["count"] == 5
+
+def test_metrics_exports(tmp_path):
+  """Snapshot should be exportable as JSON and Prometheus text."""
+  metrics = Metrics()
+  metrics.increment("moves")
+  metrics.increment("moves", 2)
+  with metrics.time("evaluate"):
+    pass
+  snapshot = json.loads(metrics.to_json())
+  assert snapshot["counters"] == {"moves": 3}
+  assert snapshot["histograms"]["evaluate"]["count"] == 1
+  text = metrics.to_prometheus()
+  assert "mastermind_moves_total 3" in text
+  assert 'mastermind_phase_seconds_bucket{phase="evaluate",le="+Inf"} 1' in text
+  assert 'mastermind_phase_seconds_count{phase="evaluate"} 1' in text
+  path = tmp_path / "metrics.prom"
+  metrics.write(str(path), prometheus=True)
+  assert path.read_text() == text
+
+def test_null_metrics_records_nothing():
+  """Disabled instrumentation should keep no state."""
+  NULL_METRICS.increment("moves")
+  with NULL_METRICS.time("evaluate"):
+    pass
+  assert NULL_METRICS.snapshot() == {"counters": {}, "histograms": {}}
+
+def test_game_records_phases():
+  """Game should time code generation, guess input, evaluation and screen clearing."""
+  metrics = Metrics()
+  frontend = BufferedFrontend()
+  game = Game(offline=True, frontend=frontend, metrics=metrics)
+  game.start()
+  frontend.inputs.append(game.code_maker.secret_code.sequence)
+  game.run_one_game()
+  game.clear_terminal()
+  snapshot = metrics.snapshot()
+  assert snapshot["counters"]["games"] == 1
+  assert snapshot["counters"]["moves"] == 1
+  assert snapshot["counters"]["offline_codes"] == 1
+  assert {"generate_code", "guess_input", "evaluate", "clear"} <= set(snapshot["histograms"])
+
+def test_code_maker_counts_api_failures(fake_server):
+  """Failed API calls should count requests, retries and the fallback."""
+  fake_server.fail = True
+  metrics = Metrics()
+  code_maker = CodeMaker(4, 8, frontend=NullFrontend(), metrics=metrics)
+  code_maker.api_base_url = fake_server.url
+  code_maker.generate_code(max_retries=2, delay=0)
+  counters = metrics.snapshot()["counters"]
+  assert counters == {"api_requests": 2, "api_failures": 2, "api_retries": 1, "fallback_codes": 1}
+  assert metrics.snapshot()["histograms"]["api_request"]["count"] == 2
+  assert CodeEntry(code_maker.secret_code.sequence, 4, 8).is_valid()
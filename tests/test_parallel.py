@@ -0,0 +1,32 @@
+import pytest
+from mastermind import CodeBreaker
+from mastermind import CodeEntry
+from mastermind.parallel import batch_seeds, run_parallel_simulation
+
+class RepeatCodeBreaker(CodeBreaker):
+  """CodeBreaker strategy that always guesses the same code."""
+  def make_guess(self) -> CodeEntry:
+    return CodeEntry("0" * self.code_length, self.code_length, self.code_range)
+
+def test_batch_seeds_are_reproducible():
+  """Same master seed should derive the same distinct batch seeds."""
+  assert batch_seeds(5, 4) == batch_seeds(5, 4)
+  assert len(set(batch_seeds(5, 4))) == 4
+  assert batch_seeds(5, 4) != batch_seeds(6, 4)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_results_do_not_depend_on_workers(tmp_path, workers):
+  """Merged statistics should be bit-for-bit equal for any worker count."""
+  serial = run_parallel_simulation(400, 2, 2, 1, RepeatCodeBreaker, master_seed=11, workers=1, batch_size=50, cache_dir=str(tmp_path))
+  parallel = run_parallel_simulation(400, 2, 2, 1, RepeatCodeBreaker, master_seed=11, workers=workers, batch_size=50, cache_dir=str(tmp_path))
+  assert parallel.stats.to_dict() == serial.stats.to_dict()
+  assert parallel.stats.games == 400
+  assert sum(worker["games"] for worker in parallel.worker_stats.values()) == 400
+  assert all(worker["games_per_second"] > 0 for worker in parallel.worker_stats.values())
+
+def test_parallel_solver_simulation(tmp_path):
+  """Default solver strategy should play through the pool with a shared feedback table."""
+  result = run_parallel_simulation(300, 3, 4, 10, master_seed=2, workers=2, batch_size=100, cache_dir=str(tmp_path))
+  assert result.stats.win_rate == 1.0
+  assert (tmp_path / "feedback_3x4.npy").exists()
+  assert result.to_dict()["stats"]["games"] == 300
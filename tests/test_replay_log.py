@@ -0,0 +1,106 @@
+import random
+import numpy as np
+import pytest
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import Game
+from mastermind.frontend import BufferedFrontend
+from mastermind.replay_log import HEADER_DTYPE, ReplayLog, ReplayLogWriter, record_dtype, verify_replay_log
+
+def random_games(count, code_length=4, code_range=8, max_attempt=10, seed=0):
+  """Returns (secret, history) of count games with random guesses and true feedback."""
+  code_maker = CodeMaker(code_length, code_range, rng=random.Random(seed))
+  games = []
+  for _ in range(count):
+    secret = CodeEntry(code_maker.use_in_house_random_seq_gen(), code_length, code_range)
+    code_maker.secret_code = secret
+    guesses = [CodeEntry(code_maker.use_in_house_random_seq_gen(), code_length, code_range) for _ in range(code_maker.rng.randint(0, max_attempt))]
+    games.append((secret, [(guess, code_maker.evaluate_code(guess)) for guess in guesses]))
+  return games
+
+def test_round_trip_and_verify(tmp_path):
+  """Logged games should read back unchanged and verify in both modes, across buffer flushes and reopening."""
+  path = str(tmp_path / "games.log")
+  games = random_games(300)
+  with ReplayLogWriter(path, 4, 8, 10, buffer_records=64) as writer:
+    for secret, history in games[:200]:
+      writer.append(secret, history)
+  with ReplayLogWriter(path, 4, 8, 10) as writer:
+    for secret, history in games[200:]:
+      writer.append(secret, history)
+  replay_log = ReplayLog(path)
+  assert len(replay_log) == 300
+  for (secret, history), (logged_secret, logged_history) in zip(games, replay_log.games()):
+    assert logged_secret == secret
+    assert [(guess.sequence, feedback.to_string()) for guess, feedback in logged_history] == [(guess.sequence, feedback.to_string()) for guess, feedback in history]
+  for exact in (False, True):
+    report = verify_replay_log(path, exact=exact, batch_size=50)
+    assert report.ok
+    assert report.to_dict() == {"games": 300, "moves": sum(len(history) for _, history in games), "mismatches": 0, "ok": True}
+
+def test_verify_finds_tampered_feedback(tmp_path):
+  """A changed feedback byte should be reported at its game and move by both modes."""
+  path = str(tmp_path / "games.log")
+  games = [game for game in random_games(50, seed=1) if len(game[1]) >= 3]
+  with ReplayLogWriter(path, 4, 8, 10) as writer:
+    for secret, history in games:
+      writer.append(secret, history)
+  dtype = record_dtype(4, 8, 10)
+  records = np.memmap(path, dtype=dtype, mode="r+", offset=HEADER_DTYPE.itemsize)
+  records["feedback"][7, 2] = (records["feedback"][7, 2] + 1) % 25
+  records.flush()
+  del records
+  assert verify_replay_log(path).mismatches == [(7, 2)]
+  assert verify_replay_log(path, exact=True).mismatches == [(7, 2)]
+
+@pytest.mark.parametrize("field, row, digit", [
+  ("guesses", (0, 1), 200),  #wraps to a negative int8 digit
+  ("guesses", (1, 0), 9),   #one past the code range
+  ("secret", (2,), 8)
+])
+def test_verify_reports_out_of_range_digits(tmp_path, field, row, digit):
+  """Digits outside the code range in the last record should be reported as mismatches by both modes, not crash."""
+  path = str(tmp_path / "games.log")
+  games = [game for game in random_games(20, seed=2) if len(game[1]) >= 3][:2]
+  with ReplayLogWriter(path, 4, 8, 10) as writer:
+    for secret, history in games:
+      writer.append(secret, history)
+  records = np.memmap(path, dtype=record_dtype(4, 8, 10), mode="r+", offset=HEADER_DTYPE.itemsize)
+  records[field][(-1, *row)] = digit
+  records.flush()
+  del records
+  expected = [(1, move) for move in range(len(games[1][1]))] if field == "secret" else [(1, row[0])]
+  assert verify_replay_log(path).mismatches == expected
+  assert verify_replay_log(path, exact=True).mismatches == expected
+
+def test_partial_record_and_rules_mismatch(tmp_path):
+  """A half written last record should be skipped, and appending with other rules should fail."""
+  path = str(tmp_path / "games.log")
+  with ReplayLogWriter(path, 3, 5, 6) as writer:
+    for secret, history in random_games(5, 3, 5, 6):
+      writer.append(secret, history)
+  with open(path, "ab") as log_file:
+    log_file.write(b"\x01\x02\x03")
+  assert len(ReplayLog(path)) == 5
+  assert verify_replay_log(path).ok
+  with pytest.raises(ValueError):
+    ReplayLogWriter(path, 4, 8, 10)
+  with pytest.raises(ValueError):
+    ReplayLog(__file__)
+
+def test_game_logs_finished_games(tmp_path):
+  """Game should append every finished game to its replay log."""
+  path = str(tmp_path / "games.log")
+  frontend = BufferedFrontend()
+  writer = ReplayLogWriter(path, 4, 8, 10)
+  game = Game(offline=True, frontend=frontend, replay_log=writer)
+  game.start()
+  game.code_maker.secret_code = CodeEntry("1234", 4, 8)
+  frontend.inputs.extend(["0000", "1234"])
+  game.run_one_game()
+  game.update_prev_match_history()
+  writer.close()
+  (secret, history), = ReplayLog(path).games()
+  assert secret == game.code_maker.secret_code
+  assert [guess.sequence for guess, _ in history] == ["0000", secret.sequence]
+  assert verify_replay_log(path).ok
@@ -0,0 +1,55 @@
+import time
+import pytest
+from mastermind import CodeBreaker
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import Feedback
+from mastermind import scoring
+from mastermind.sampling import SamplingCodeBreaker
+from mastermind.simulation import play_headless_game, simulate_games
+
+def test_sampling_breaker_breaks_every_secret():
+  """With the whole consistent set sampled, every secret of a small space should be found quickly."""
+  code_breaker = SamplingCodeBreaker(3, 4, time_budget=None, seed=0)
+  code_maker = CodeMaker(3, 4)
+  assert isinstance(code_breaker, CodeBreaker)
+  for secret in scoring.decode_codes(scoring.all_codes(3, 4)):
+    code_maker.secret_code = CodeEntry(secret, 3, 4)
+    turns, won = play_headless_game(code_maker, code_breaker, 10)
+    assert won
+    assert turns <= 5
+
+def test_sampling_breaker_is_reproducible(tmp_path):
+  """Same seed without a time budget should play the same games."""
+  results = [simulate_games(30, 4, 6, code_breaker=SamplingCodeBreaker(4, 6, sample_size=50, guess_pool_size=50, time_budget=None, seed=3), seed=1, cache_dir=str(tmp_path)).to_dict() for _ in range(2)]
+  assert results[0] == results[1]
+  assert results[0]["win_rate"] == 1.0
+
+def test_sampling_breaker_latency_is_bounded():
+  """Moves in a code space far too large to enumerate should stay within the time budget."""
+  code_breaker = SamplingCodeBreaker(10, 20, time_budget=0.2, seed=0)
+  code_maker = CodeMaker(10, 20)
+  code_maker.secret_code = CodeEntry("0123456789", 10, 20)
+  for turn in range(1, 4):
+    code_breaker.turn = turn
+    start = time.perf_counter()
+    guess = code_breaker.make_guess()
+    assert time.perf_counter() - start < 1.0
+    assert guess.is_valid()
+    code_breaker.receive_feedback(guess, code_maker.evaluate_code(guess))
+
+def test_sampling_breaker_rejects_impossible_feedback():
+  """Feedback no code could give should raise once the whole small space was searched."""
+  code_breaker = SamplingCodeBreaker(2, 2, time_budget=None, seed=0)
+  code_breaker.receive_feedback(CodeEntry("00", 2, 2), Feedback(2, 0, 2))
+  code_breaker.turn = 2
+  with pytest.raises(ValueError):
+    code_breaker.make_guess()
+
+def test_sampling_breaker_without_budget_ends_in_large_space():
+  """Without a time budget, sampling a space too large to scan should stop once mutation stops finding new candidates."""
+  code_breaker = SamplingCodeBreaker(8, 9, sample_size=100, guess_pool_size=100, time_budget=None, seed=0)
+  code_maker = CodeMaker(8, 9)
+  code_maker.secret_code = CodeEntry("01234567", 8, 9)
+  turns, won = play_headless_game(code_maker, code_breaker, 12)
+  assert won
@@ -0,0 +1,115 @@
+import random
+import numpy as np
+import pytest
+from mastermind import CodeEntry
+from mastermind import scoring
+
+def random_sequences(count, code_length, code_range, seed=0):
+  rng = random.Random(seed)
+  return ["".join(str(rng.randrange(code_range)) for _ in range(code_length)) for _ in range(count)]
+
+@pytest.mark.parametrize("sequences, code_length", [
+  (["1234", "0000", "7707"], 4),
+  (["9"], 1),
+  ([], 3)
+])
+def test_encode_decode_round_trip(sequences, code_length):
+  """Encoded digit arrays should decode back into the same sequences."""
+  codes = scoring.encode_codes(sequences, code_length)
+  assert codes.shape == (len(sequences), code_length)
+  if sequences:
+    assert scoring.decode_codes(codes) == sequences
+
+@pytest.mark.parametrize("code_length, code_range", [
+  (1, 1),
+  (2, 3),
+  (4, 8),
+  (5, 9)
+])
+def test_all_codes_matches_code_to_index(code_length, code_range):
+  """Row i of the enumerated code space should be the code whose index is i."""
+  codes = scoring.all_codes(code_length, code_range)
+  assert len(codes) == code_range ** code_length
+  for i, sequence in enumerate(scoring.decode_codes(codes[::max(1, len(codes) // 50)])):
+    assert scoring.code_to_index(sequence, code_range) == i * max(1, len(codes) // 50)
+
+@pytest.mark.parametrize("code_length, code_range", [
+  (1, 2),
+  (3, 5),
+  (4, 8),
+  (6, 9),
+  (12, 9)
+])
+def test_score_batch_matches_compare_with(code_length, code_range):
+  """Vectorized scores should be identical to CodeEntry.compare_with Feedback."""
+  guess, *candidates = random_sequences(200, code_length, code_range)
+  number, location = scoring.score_batch(scoring.encode_codes([guess], code_length)[0], scoring.encode_codes(candidates, code_length), code_range)
+  for i, candidate in enumerate(candidates):
+    feedback = CodeEntry(guess, code_length, code_range).compare_with(CodeEntry(candidate, code_length, code_range))
+    assert (number[i], location[i]) == (feedback.correct_number, feedback.correct_location)
+
+def test_score_matrix_matches_score_batch():
+  """Each row of the score matrix should equal scoring that guess alone."""
+  guesses = scoring.encode_codes(random_sequences(30, 4, 8, seed=1), 4)
+  candidates = scoring.all_codes(4, 8)
+  number, location = scoring.score_matrix(guesses, candidates, 8)
+  assert number.shape == (30, 4096)
+  for row, guess in enumerate(guesses):
+    batch_number, batch_location = scoring.score_batch(guess, candidates, 8)
+    assert np.array_equal(number[row], batch_number)
+    assert np.array_equal(location[row], batch_location)
+
+def test_score_pairs_matches_compare_with():
+  """Row-wise scores should equal comparing each guess with its own secret."""
+  guesses, secrets = random_sequences(300, 5, 7, seed=2), random_sequences(300, 5, 7, seed=3)
+  number, location = scoring.score_pairs(scoring.encode_codes(guesses, 5), scoring.encode_codes(secrets, 5), 7)
+  for i, (guess, secret) in enumerate(zip(guesses, secrets)):
+    feedback = CodeEntry(secret, 5, 7).compare_with(CodeEntry(guess, 5, 7))
+    assert (number[i], location[i]) == (feedback.correct_number, feedback.correct_location)
+
+@pytest.mark.parametrize("correct_number, correct_location, code_length", [
+  (0, 0, 4),
+  (4, 4, 4),
+  (3, 1, 4),
+  (12, 12, 12)
+])
+def test_feedback_index_round_trip(correct_number, correct_location, code_length):
+  """Feedback indexes should be unique, small, and reversible."""
+  index = scoring.feedback_index(correct_number, correct_location, code_length)
+  assert 0 <= index < scoring.feedback_index_count(code_length)
+  assert scoring.feedback_from_index(index, code_length) == (correct_number, correct_location)
+
+def test_score_batch_matches_compare_with_multi_symbol():
+  """Scoring should also match compare_with for ranges written with letters."""
+  rng = random.Random(4)
+  sequences = ["".join(rng.choice("0123456789ab") for _ in range(6)) for _ in range(200)]
+  guess, *candidates = sequences
+  codes = scoring.encode_codes(candidates, 6)
+  assert scoring.decode_codes(codes) == candidates
+  number, location = scoring.score_batch(scoring.encode_codes([guess], 6)[0], codes, 12)
+  for i, candidate in enumerate(candidates):
+    feedback = CodeEntry(guess, 6, 12).compare_with(CodeEntry(candidate, 6, 12))
+    assert (number[i], location[i]) == (feedback.correct_number, feedback.correct_location)
+
+def test_iter_code_chunks_covers_space_in_bounded_chunks():
+  """Chunks should enumerate every code once without exceeding chunk_size."""
+  seen = 0
+  for indices, codes in scoring.iter_code_chunks(3, 12, chunk_size=100):
+    assert len(indices) <= 100
+    assert np.array_equal(codes, scoring.codes_from_indices(indices, 3, 12))
+    assert indices[0] == seen
+    seen += len(indices)
+  assert seen == 12 ** 3
+
+def test_iter_consistent_indices_matches_rescan():
+  """Streaming consistency filter should keep exactly the codes a full rescan keeps."""
+  secret = CodeEntry("1a3", 3, 11)
+  history = [(guess, secret.compare_with(guess)) for guess in (CodeEntry("001", 3, 11), CodeEntry("a12", 3, 11))]
+  streamed = np.concatenate(list(scoring.iter_consistent_indices(history, 3, 11, chunk_size=97)))
+  expected = []
+  for index, sequence in enumerate(scoring.decode_codes(scoring.all_codes(3, 11))):
+    code = CodeEntry(sequence, 3, 11)
+    if all((guess.compare_with(code).correct_number, guess.compare_with(code).correct_location) == (feedback.correct_number, feedback.correct_location) for guess, feedback in history):
+      expected.append(index)
+  assert list(streamed) == expected
+  assert secret.to_int() in streamed
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from mastermind import CodeEntry
+from mastermind.server import GameServer
+
+async def request(reader, writer, line):
+  """Send one request line, returns decoded JSON response."""
+  writer.write(f"{line}\n".encode())
+  await writer.drain()
+  return json.loads(await reader.readline())
+
+async def connect(server):
+  """Open a client connection, returns (reader, writer, welcome response)."""
+  reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+  return reader, writer, json.loads(await reader.readline())
+
+def run_with_server(client, **server_options):
+  """Start a local GameServer, run the client coroutine against it, then shut down."""
+  async def run():
+    server = GameServer(port=0, **server_options)
+    await server.start()
+    try:
+      return await client(server)
+    finally:
+      await server.close()
+  return asyncio.run(run())
+
+def test_session_plays_a_game():
+  """Guesses should be evaluated and a perfect guess should end the game with the winner."""
+  async def client(server):
+    reader, writer, welcome = await connect(server)
+    assert "Welcome to Mastermind" in welcome["output"]
+    game = server.sessions[welcome["session"]].game
+    game.code_maker.secret_code = CodeEntry("1234", 4, 8)
+    wrong = await request(reader, writer, "1243")
+    assert "4 correct numbers and 2 correct locations" in wrong["output"]
+    assert wrong["turn"] == 2
+    right = await request(reader, writer, "1234")
+    assert right["winner"] == "Code Breaker"
+    assert not right["active"]
+    over = await request(reader, writer, "1234")
+    assert "This game is over" in over["output"]
+    new_game = await request(reader, writer, "new")
+    assert new_game["active"] and new_game["game"] == 2
+    previous = await request(reader, writer, "previous 1")
+    assert "Winner: Code Breaker" in previous["output"]
+    await request(reader, writer, "exit")
+    assert await reader.readline() == b""
+    writer.close()
+  run_with_server(client)
+
+def test_session_commands():
+  """Existing Game commands should map onto requests without touching the server's terminal."""
+  async def client(server):
+    reader, writer, welcome = await connect(server)
+    secret = server.sessions[welcome["session"]].game.code_maker.secret_code.sequence
+    hint = await request(reader, writer, "hint")
+    assert hint["output"] == secret[0] + "xxx"
+    await request(reader, writer, "0000")
+    history = await request(reader, writer, "history")
+    assert history["output"].startswith("Guess #1: 0000 - ")
+    reset = await request(reader, writer, "reset")
+    assert "has been reset" in reset["output"] and reset["turn"] == 1
+    quit_game = await request(reader, writer, "quit")
+    assert quit_game["output"] == "You have left this game." and not quit_game["active"]
+    writer.close()
+  run_with_server(client)
+
+def test_many_concurrent_sessions_are_independent():
+  """Every connection should get its own Game session."""
+  async def client(server):
+    connections = await asyncio.gather(*(connect(server) for _ in range(200)))
+    assert len(server.sessions) == 200
+    responses = await asyncio.gather(*(request(reader, writer, "0000") for reader, writer, _ in connections))
+    assert {response["session"] for response in responses} == {welcome["session"] for _, _, welcome in connections}
+    assert all(response["turn"] == 2 for response in responses)
+    for _, writer, _ in connections:
+      writer.close()
+  run_with_server(client)
+
+def test_idle_session_is_evicted():
+  """Sessions idle for longer than idle_timeout should be closed and forgotten."""
+  async def client(server):
+    reader, writer, welcome = await connect(server)
+    evicted = json.loads(await reader.readline())
+    assert evicted["error"] == "Session closed after being idle."
+    assert await reader.readline() == b""
+    await asyncio.sleep(0)
+    assert not server.sessions
+    assert server.evicted_count == 1
+    writer.close()
+  run_with_server(client, idle_timeout=0.1)
+
+def test_full_server_rejects_connection():
+  """Connections over max_sessions should be refused with an error."""
+  async def client(server):
+    first = await connect(server)
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    assert "error" in json.loads(await reader.readline())
+    first[1].close()
+    writer.close()
+  run_with_server(client, max_sessions=1)
+
+def test_commands_spelled_with_code_symbols_are_not_guesses():
+  """With letters as code symbols, command words should still run as commands and not use up a turn."""
+  async def client(server):
+    reader, writer, welcome = await connect(server)
+    secret = server.sessions[welcome["session"]].game.code_maker.secret_code.sequence
+    hint = await request(reader, writer, "hint")
+    assert hint["output"] == secret[0] + "xxx" and hint["turn"] == 1
+    rules = await request(reader, writer, "rules")
+    assert rules["output"].startswith("Mastermind:") and rules["turn"] == 1
+    quit_game = await request(reader, writer, "quit")
+    assert quit_game["output"] == "You have left this game." and not quit_game["active"]
+    await request(reader, writer, "exit")
+    assert await reader.readline() == b""
+    writer.close()
+  run_with_server(client, code_range=36)
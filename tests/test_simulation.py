@@ -0,0 +1,55 @@
+import pytest
+from mastermind import CodeBreaker
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind.simulation import SimulationStats, play_headless_game, simulate_games
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+  """Keep precomputed feedback tables out of the user's cache directory."""
+  monkeypatch.setenv("MASTERMIND_CACHE_DIR", str(tmp_path))
+
+class RepeatCodeBreaker(CodeBreaker):
+  """CodeBreaker strategy that always guesses the same code."""
+  def make_guess(self) -> CodeEntry:
+    return CodeEntry("0" * self.code_length, self.code_length, self.code_range)
+
+def test_stats_record_and_merge():
+  """Histogram should only count wins, while turns count every game."""
+  first = SimulationStats(10)
+  first.record(4, True)
+  first.record(10, False)
+  second = SimulationStats(10)
+  second.record(4, True)
+  second.record(6, True)
+  first.merge(second)
+  assert first.games == 4
+  assert first.win_rate == 0.75
+  assert first.mean_turns == 6
+  assert first.max_turns == 10
+  assert first.to_dict()["histogram"] == {4: 2, 6: 1}
+
+@pytest.mark.parametrize("secret, turns, won", [
+  ("000", 1, True),
+  ("123", 3, False)
+])
+def test_play_headless_game(secret, turns, won):
+  """Headless game should stop at the perfect response or at max attempts."""
+  code_maker = CodeMaker(3, 4)
+  code_maker.secret_code = CodeEntry(secret, 3, 4)
+  assert play_headless_game(code_maker, RepeatCodeBreaker(3, 4), 3) == (turns, won)
+
+def test_simulate_games_with_solver():
+  """Default solver should win every game of a small configuration."""
+  stats = simulate_games(200, 3, 4, 10, seed=7)
+  assert stats.games == 200
+  assert stats.win_rate == 1.0
+  assert sum(stats.histogram.values()) == 200
+  assert stats.max_turns <= 5
+
+def test_simulate_games_is_deterministic_with_seed():
+  """Same seed should play the same secrets and give the same statistics."""
+  first = simulate_games(100, 2, 2, 1, breaker_factory=RepeatCodeBreaker, seed=3)
+  second = simulate_games(100, 2, 2, 1, breaker_factory=RepeatCodeBreaker, seed=3)
+  assert first.to_dict() == second.to_dict()
+  assert 0 < first.wins < 100
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from mastermind import CodeEntry
+from mastermind import Game
+from mastermind.frontend import BufferedFrontend
+from mastermind.history_store import SQLiteHistoryStore
+from mastermind.snapshot import dumps, loads, restore_game, snapshot_game
+
+def game_in_progress(**options):
+  """Returns started Game with secret 1234 outside hard mode, one finished game, two wrong guesses and one hint."""
+  frontend = BufferedFrontend()
+  game = Game(offline=True, frontend=frontend, **options)
+  game.start()
+  if not game.hard_mode:
+    frontend.inputs.append(game.code_maker.secret_code.sequence)
+    game.run_one_game()
+    game.update_prev_match_history()
+    game.reset_game_state()
+    game.code_maker.secret_code = CodeEntry("1234", 4, 8)
+    game.hint_answer_dict = game.code_maker.get_hint_position_dict()
+  for guess in ["0000", "4321"]:
+    frontend.inputs.append(guess)
+    game.make_move()
+  frontend.inputs.extend(["hint", "3210"])
+  game.make_move()
+  return game
+
+def test_restored_game_continues_where_it_left_off():
+  """Restoring in a fresh Game should give the same state, and the game should play on from it."""
+  game = game_in_progress()
+  frontend = BufferedFrontend()
+  restored = loads(dumps(game), frontend=frontend)
+  assert snapshot_game(restored) == snapshot_game(game)
+  assert restored.hint == "1xxx"
+  assert restored.prev_match_history.count_wins("Code Breaker") == 1
+  frontend.inputs.append("1234")
+  restored.make_move()
+  assert restored.is_over()
+  assert restored.winner == "Code Breaker"
+  assert restored.turn == 5
+
+def test_restore_tracked_candidates_and_hard_mode(tmp_path, monkeypatch):
+  """Candidate tracking and the hard mode CodeMaker's possible secrets should be rebuilt from the history."""
+  monkeypatch.setenv("MASTERMIND_CACHE_DIR", str(tmp_path))
+  game = game_in_progress(track_candidates=True, hard_mode=True)
+  restored = restore_game(snapshot_game(game), frontend=BufferedFrontend())
+  assert restored.candidate_index.count() == game.candidate_index.count()
+  assert np.array_equal(restored.code_maker.candidates, game.code_maker.candidates)
+  assert restored.code_maker.secret_code.sequence == game.code_maker.secret_code.sequence
+
+def test_external_history_store_is_left_alone():
+  """Match history held outside memory should not be copied into the snapshot."""
+  store = SQLiteHistoryStore()
+  game = game_in_progress(history_store=store)
+  snapshot = snapshot_game(game)
+  assert snapshot["match_history"] is None
+  assert len(restore_game(snapshot, frontend=BufferedFrontend(), history_store=store).prev_match_history) == 1
+
+def test_unknown_snapshot_version():
+  """Snapshots from another format version should be rejected."""
+  snapshot = snapshot_game(game_in_progress())
+  snapshot["version"] = 99
+  with pytest.raises(ValueError):
+    restore_game(snapshot)
+
+def test_snapshot_before_start():
+  """A Game that was not started has no secret code and should be refused with a clear error."""
+  with pytest.raises(ValueError, match="not started"):
+    snapshot_game(Game(offline=True, frontend=BufferedFrontend()))
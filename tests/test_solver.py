@@ -0,0 +1,87 @@
+import pytest
+from mastermind import CodeBreaker
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import Game
+from mastermind import SolverCodeBreaker
+from mastermind import scoring
+from mastermind.frontend import BufferedFrontend
+
+def play(solver, code_maker, max_attempt=10):
+  """Play one game with the solver, returns guesses made until the perfect response."""
+  solver.turn = 1
+  guesses = []
+  while solver.turn <= max_attempt:
+    guess = solver.make_guess()
+    feedback = code_maker.evaluate_code(guess)
+    solver.receive_feedback(guess, feedback)
+    guesses.append(guess.sequence)
+    if feedback.is_perfect_response():
+      return guesses
+    solver.turn += 1
+  return guesses
+
+@pytest.mark.parametrize("code_length, code_range, use_feedback_table", [
+  (2, 3, True),
+  (3, 4, True),
+  (3, 4, False)
+])
+def test_solver_breaks_every_secret(tmp_path, code_length, code_range, use_feedback_table):
+  """Solver should find every secret in the code space, well within max attempts."""
+  solver = SolverCodeBreaker(code_length, code_range, use_feedback_table, str(tmp_path))
+  code_maker = CodeMaker(code_length, code_range)
+  for secret in scoring.decode_codes(scoring.all_codes(code_length, code_range)):
+    code_maker.secret_code = CodeEntry(secret, code_length, code_range)
+    guesses = play(solver, code_maker)
+    assert guesses[-1] == secret
+    assert len(guesses) <= 5
+
+def test_solver_table_and_direct_scoring_agree(tmp_path):
+  """Guess choices should not depend on whether the feedback table is used."""
+  with_table = SolverCodeBreaker(3, 5, True, str(tmp_path))
+  without_table = SolverCodeBreaker(3, 5, False)
+  code_maker = CodeMaker(3, 5)
+  for secret in ["000", "123", "441", "204"]:
+    code_maker.secret_code = CodeEntry(secret, 3, 5)
+    assert play(with_table, code_maker) == play(without_table, code_maker)
+
+def test_solver_is_a_code_breaker(tmp_path):
+  """Solver should plug in wherever a CodeBreaker is expected."""
+  solver = SolverCodeBreaker(3, 4, cache_dir=str(tmp_path))
+  assert isinstance(solver, CodeBreaker)
+  guess = solver.make_guess()
+  assert isinstance(guess, CodeEntry)
+  assert guess.is_valid()
+
+def test_solver_plays_through_game(tmp_path):
+  """Game should pass each Feedback back to the solver so it wins without user input."""
+  game = Game(3, 4, 10, offline=True, frontend=BufferedFrontend())
+  game.start()
+  game.code_breaker = SolverCodeBreaker(3, 4, cache_dir=str(tmp_path))
+  game.code_breaker.turn = game.turn
+  while not game.is_over():
+    game.make_move()
+  assert game.winner == "Code Breaker"
+  assert game.current_game_history[-1][0].sequence == game.code_maker.secret_code.sequence
+
+def test_opening_book_matches_live_search(tmp_path, monkeypatch):
+  """Book guesses should be the solver's own first two guesses, and turns 1 and 2 should need no live search."""
+  from mastermind.opening_book import build_opening_book, load_opening_book, NO_REPLY
+  assert load_opening_book(3, 4, SolverCodeBreaker.strategy, str(tmp_path)) is None
+  live = SolverCodeBreaker(3, 4, cache_dir=str(tmp_path))
+  opening_book = build_opening_book(SolverCodeBreaker(3, 4, cache_dir=str(tmp_path)), str(tmp_path))
+  loaded = load_opening_book(3, 4, SolverCodeBreaker.strategy, str(tmp_path))
+  assert loaded.opening == opening_book.opening
+  assert (loaded.replies == opening_book.replies).all()
+  assert (loaded.replies != NO_REPLY).sum() > 1
+
+  booked = SolverCodeBreaker(3, 4, cache_dir=str(tmp_path))
+  live_search = booked.choose_guess
+  def choose_guess():
+    assert len(booked.history) > 1, "live search inside the opening book"
+    return live_search()
+  monkeypatch.setattr(booked, "choose_guess", choose_guess)
+  code_maker = CodeMaker(3, 4)
+  for secret in ["000", "123", "321", "303"]:
+    code_maker.secret_code = CodeEntry(secret, 3, 4)
+    assert play(booked, code_maker) == play(live, code_maker)
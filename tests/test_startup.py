@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import pytest
+import mastermind
+
+def run_python(code, env=None):
+  """Run code in a fresh interpreter, returns its stripped output."""
+  return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env).stdout.strip()
+
+def test_import_does_not_load_heavy_dependencies():
+  """Importing the package should not import numpy or requests."""
+  assert run_python("import sys, mastermind; print(sorted({'numpy', 'requests'} & set(sys.modules)))") == "[]"
+
+def test_offline_game_never_loads_network_stack(tmp_path):
+  """Offline games should generate and evaluate codes without requests, numpy or sqlite3."""
+  #no saved feedback table to memory-map, which would load numpy
+  env = dict(os.environ, MASTERMIND_CACHE_DIR=str(tmp_path))
+  code = (
+    "import sys\n"
+    "from mastermind import Game\n"
+    "from mastermind.frontend import NullFrontend\n"
+    "game = Game(offline=True, frontend=NullFrontend())\n"
+    "game.start()\n"
+    "game.code_maker.evaluate_code(game.code_maker.secret_code)\n"
+    "print(sorted({'numpy', 'requests', 'aiohttp', 'sqlite3'} & set(sys.modules)))"
+  )
+  assert run_python(code, env) == "[]"
+
+def test_lazy_exports():
+  """Public names should load on first access and unknown names should still raise AttributeError."""
+  from mastermind import SolverCodeBreaker
+  from mastermind.solver import SolverCodeBreaker as defined
+  assert SolverCodeBreaker is defined
+  assert "Game" in dir(mastermind)
+  with pytest.raises(AttributeError):
+    mastermind.NotAName
+
+def test_main_offline_flag(monkeypatch):
+  """--offline should start a Game that never calls the API."""
+  import main
+  games = []
+  monkeypatch.setattr(main.Game, "start", lambda self: games.append(self))
+  monkeypatch.setattr(main.Game, "run", lambda self: None)
+  main.main(["--offline"])
+  assert games[0].offline
@@ -0,0 +1,60 @@
+from itertools import permutations
+import numpy as np
+import pytest
+from mastermind import CodeEntry
+from mastermind import CodeMaker
+from mastermind import SolverCodeBreaker
+from mastermind import scoring
+from mastermind.symmetry import class_representatives, relabel_free_colors
+
+def brute_force_representatives(code_length, code_range, history):
+  """Lowest index of every class, found by applying every position and color permutation that fixes the history."""
+  sequences = scoring.decode_codes(scoring.all_codes(code_length, code_range))
+  symmetries = []
+  for positions in permutations(range(code_length)):
+    for colors in permutations(range(code_range)):
+      image = lambda sequence, positions=positions, colors=colors: "".join(str(colors[int(sequence[position])]) for position in positions)
+      if all(image(guess) == guess for guess in history):
+        symmetries.append(image)
+  return sorted({min(int(image(sequence), code_range) for image in symmetries) for sequence in sequences})
+
+@pytest.mark.parametrize("code_length, code_range, history", [
+  (3, 4, []),
+  (3, 4, ["011"]),
+  (3, 4, ["011", "120"]),
+  (4, 3, ["0012"]),
+  (2, 5, ["00", "13"])
+])
+def test_class_representatives_match_brute_force(code_length, code_range, history):
+  """Representatives should be exactly the lowest index code of every class."""
+  codes = scoring.all_codes(code_length, code_range)
+  history_codes = scoring.encode_codes(history, code_length).reshape(-1, code_length)
+  assert class_representatives(codes, history_codes, code_range).tolist() == brute_force_representatives(code_length, code_range, history)
+
+def test_opening_classes_are_color_patterns():
+  """With nothing played, one representative should be left per pattern of repeated colors."""
+  representatives = class_representatives(scoring.all_codes(4, 8), np.empty((0, 4), dtype=scoring.CODE_DTYPE), 8)
+  assert scoring.decode_codes(scoring.codes_from_indices(representatives, 4, 8)) == ["0000", "0001", "0011", "0012", "0123"]
+
+def test_relabel_free_colors_by_first_appearance():
+  """Free colors should be renamed in order of first appearance, played colors kept."""
+  codes = scoring.encode_codes(["5251", "7777"], 4)
+  assert scoring.decode_codes(relabel_free_colors(codes, np.array([2, 5, 7]), 8)) == ["2521", "2222"]
+
+@pytest.mark.parametrize("code_length, code_range", [(3, 4), (4, 4)])
+def test_reduced_solver_plays_like_unreduced(tmp_path, code_length, code_range):
+  """Scoring one guess per class should not change a single guess."""
+  reduced = SolverCodeBreaker(code_length, code_range, cache_dir=str(tmp_path), use_symmetry=True)
+  unreduced = SolverCodeBreaker(code_length, code_range, cache_dir=str(tmp_path), use_symmetry=False)
+  code_maker = CodeMaker(code_length, code_range)
+  for secret in scoring.decode_codes(scoring.all_codes(code_length, code_range)):
+    code_maker.secret_code = CodeEntry(secret, code_length, code_range)
+    for turn in range(1, 11):
+      reduced.turn = unreduced.turn = turn
+      guess = reduced.make_guess()
+      assert guess == unreduced.make_guess()
+      feedback = code_maker.evaluate_code(guess)
+      reduced.receive_feedback(guess, feedback)
+      unreduced.receive_feedback(guess, feedback)
+      if feedback.is_perfect_response():
+        break